@@ -0,0 +1,182 @@
+"""
+Benchmark del tiempo de arranque de la CLI.
+
+Cada invocación de main.py paga el arranque del intérprete y las
+importaciones antes de hacer ningún trabajo útil. Este benchmark lanza la
+CLI en procesos nuevos para varios casos (listar temas, generar en texto,
+generar PNG), mide el tiempo de pared de cada uno y, con -X importtime,
+qué módulos de primer nivel cuestan más y si se cargaron Pillow o NumPy:
+
+    python benchmarks/benchmark_arranque.py -o antes.json
+    python benchmarks/benchmark_arranque.py -o despues.json --comparar antes.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Dict, List
+
+from benchmark_generacion import _commit_actual
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+MAIN = os.path.join(RAIZ, 'main.py')
+
+# Nombre del caso -> argumentos del intérprete ('{salida}' se sustituye por
+# una carpeta temporal)
+CASOS = {
+    'interprete': ['-c', 'pass'],
+    'listar_temas': [MAIN, '--listar-temas'],
+    'texto': [MAIN, '-t', 'frutas', '--seed', '1', '-o', '{salida}/sopa.txt'],
+    'png': [MAIN, '-t', 'frutas', '--seed', '1', '-o', '{salida}/sopa.png'],
+}
+
+MODULOS_PESADOS = ['PIL', 'numpy']
+
+
+def _comando(caso: str, salida: str, opciones: List[str]) -> List[str]:
+    argumentos = [argumento.replace('{salida}', salida) for argumento in CASOS[caso]]
+    return [sys.executable, *opciones, *argumentos]
+
+
+def perfil_importaciones(caso: str, salida: str, mostrar: int = 5) -> Dict:
+    """
+    Ejecuta un caso con -X importtime y resume sus importaciones.
+
+    Args:
+        caso: Nombre del caso en CASOS
+        salida: Carpeta temporal para los archivos generados
+        mostrar: Módulos de primer nivel más lentos a devolver
+
+    Returns:
+        Diccionario con 'modulos_lentos' (lista de [módulo, ms]) y, por cada
+        módulo de MODULOS_PESADOS, si se importó
+    """
+    proceso = subprocess.run(
+        _comando(caso, salida, ['-X', 'importtime']),
+        cwd=RAIZ, capture_output=True, text=True
+    )
+    primer_nivel = []
+    importados = set()
+    for linea in proceso.stderr.splitlines():
+        if not linea.startswith('import time:') or 'cumulative' in linea:
+            continue
+        _, acumulado, nombre = linea[len('import time:'):].split('|')
+        modulo = nombre.strip()
+        importados.add(modulo.split('.')[0])
+        # Los módulos importados directamente no llevan sangría extra
+        if nombre.startswith(' ') and not nombre.startswith('  '):
+            primer_nivel.append([modulo, int(acumulado) / 1000])
+
+    primer_nivel.sort(key=lambda fila: fila[1], reverse=True)
+    perfil = {'modulos_lentos': primer_nivel[:mostrar]}
+    for modulo in MODULOS_PESADOS:
+        perfil[f'importa_{modulo.lower()}'] = modulo in importados
+    return perfil
+
+
+def medir_caso(caso: str, repeticiones: int = 10) -> Dict:
+    """
+    Mide el tiempo de pared de un caso lanzando procesos nuevos.
+
+    Args:
+        caso: Nombre del caso en CASOS
+        repeticiones: Procesos a lanzar
+
+    Returns:
+        Diccionario con la mediana y el mínimo en segundos y el perfil de
+        importaciones
+    """
+    with tempfile.TemporaryDirectory() as salida:
+        tiempos = []
+        for _ in range(repeticiones):
+            inicio = time.perf_counter()
+            subprocess.run(
+                _comando(caso, salida, []),
+                cwd=RAIZ, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True
+            )
+            tiempos.append(time.perf_counter() - inicio)
+        perfil = perfil_importaciones(caso, salida)
+
+    return {
+        'caso': caso,
+        'segundos_mediana': statistics.median(tiempos),
+        'segundos_minimo': min(tiempos),
+        **perfil,
+    }
+
+
+def comparar(anterior: Dict, actual: Dict) -> List[Dict]:
+    """
+    Compara dos ejecuciones caso por caso.
+
+    Returns:
+        Lista con los casos comunes y la razón actual/anterior de la
+        mediana (menor que 1 significa más rápido)
+    """
+    previos = {r['caso']: r for r in anterior['resultados']}
+    comparacion = []
+    for resultado in actual['resultados']:
+        previo = previos.get(resultado['caso'])
+        if previo is None or not previo['segundos_mediana']:
+            continue
+        comparacion.append({
+            'caso': resultado['caso'],
+            'anterior': previo['segundos_mediana'],
+            'actual': resultado['segundos_mediana'],
+            'razon': resultado['segundos_mediana'] / previo['segundos_mediana'],
+        })
+    return comparacion
+
+
+def main():
+    """Punto de entrada del benchmark."""
+    parser = argparse.ArgumentParser(description='Benchmark del arranque de main.py')
+    parser.add_argument('--casos', nargs='+', choices=list(CASOS), default=list(CASOS))
+    parser.add_argument('--repeticiones', type=int, default=10)
+    parser.add_argument('-o', '--output', default='benchmark_arranque.json',
+                        help='Archivo JSON de resultados')
+    parser.add_argument('--comparar', metavar='ANTERIOR',
+                        help='JSON de una ejecución anterior con el que comparar')
+    args = parser.parse_args()
+
+    resultados = []
+    for caso in args.casos:
+        resultado = medir_caso(caso, args.repeticiones)
+        resultados.append(resultado)
+        pesados = [m for m in MODULOS_PESADOS if resultado[f'importa_{m.lower()}']]
+        print(f"{caso:<13} mediana {resultado['segundos_mediana'] * 1000:7.1f} ms  "
+              f"mínimo {resultado['segundos_minimo'] * 1000:7.1f} ms  "
+              f"carga: {', '.join(pesados) or '-'}")
+
+    datos = {
+        'metadatos': {
+            'commit': _commit_actual(),
+            'fecha': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'plataforma': platform.platform(),
+            'repeticiones': args.repeticiones,
+        },
+        'resultados': resultados,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(datos, f, ensure_ascii=False, indent=2)
+    print(f"\n✅ Resultados guardados en: {args.output}")
+
+    if args.comparar:
+        with open(args.comparar, 'r', encoding='utf-8') as f:
+            anterior = json.load(f)
+        print(f"\nComparación con {anterior['metadatos'].get('commit') or args.comparar}:")
+        for fila in comparar(anterior, datos):
+            print(f"  {fila['caso']}: {fila['anterior'] * 1000:.1f} ms -> "
+                  f"{fila['actual'] * 1000:.1f} ms (x{fila['razon']:.2f})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,386 @@
+"""
+Benchmark de generación y renderizado de sopas de letras.
+
+Recorre combinaciones de tamaño de cuadrícula, densidad de relleno,
+conjunto de orientaciones y alfabeto, y mide por sopa el tiempo de
+generación, los inicios examinados y rechazados por palabra, el tiempo de
+renderizado y el pico de memoria. Cada caso corre en un proceso aparte y
+se abandona si supera un presupuesto de tiempo (se registra como 'error'),
+de modo que el barrido completo termina aunque algún caso sea muy lento.
+Los resultados se guardan en JSON para poder compararlos entre commits:
+
+    python benchmarks/benchmark_generacion.py -o antes.json
+    python benchmarks/benchmark_generacion.py -o despues.json --comparar antes.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+# Agregar el directorio padre al path para poder importar los módulos
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from config import Config
+from word_search_generator import WordSearchGenerator
+
+
+TAMAÑOS = [10, 20, 50, 100, 200, 500]
+TAMAÑOS_RAPIDO = [10, 20, 50]
+DENSIDADES = [0.1, 0.3, 0.5]
+PRESUPUESTO_CASO = 60.0  # Segundos máximos por caso (todas sus repeticiones)
+ORIENTACIONES = {
+    'basico': Config.ORIENTACIONES_BASICO,
+    'avanzado': Config.ORIENTACIONES_AVANZADO,
+}
+ALFABETOS = {
+    'en': Config.ALFABETO_EN,
+    'es': Config.ALFABETO_ES,
+}
+
+
+def generar_palabras(
+    tamaño: int, densidad: float, alfabeto: str, rng: random.Random,
+    max_palabras: Optional[int] = None
+) -> List[str]:
+    """
+    Crea palabras al azar hasta cubrir la densidad pedida.
+
+    Args:
+        tamaño: Tamaño de la cuadrícula (NxN)
+        densidad: Fracción de celdas a ocupar con letras de palabras
+        alfabeto: Letras disponibles
+        rng: Generador aleatorio
+        max_palabras: Número máximo de palabras (None para no limitarlas;
+            con límite, la densidad real queda por debajo de la pedida en
+            cuadrículas grandes)
+
+    Returns:
+        Lista de palabras sin repetir
+    """
+    objetivo = int(densidad * tamaño * tamaño)
+    largo_maximo = max(3, min(12, tamaño // 2))
+    palabras = set()
+    letras = 0
+    while letras < objetivo and (max_palabras is None or len(palabras) < max_palabras):
+        palabra = ''.join(rng.choice(alfabeto) for _ in range(rng.randint(3, largo_maximo)))
+        if palabra not in palabras:
+            palabras.add(palabra)
+            letras += len(palabra)
+    return sorted(palabras)
+
+
+def medir_caso(
+    tamaño: int,
+    densidad: float,
+    orientaciones: str,
+    alfabeto: str,
+    estrategia: str = 'aleatoria',
+    backend: str = 'lista',
+    repeticiones: int = 3,
+    max_palabras: Optional[int] = None,
+    semilla: int = 0
+) -> Dict:
+    """
+    Mide un caso del benchmark.
+
+    Los tiempos son la mediana de `repeticiones` ejecuciones; el pico de
+    memoria se mide aparte con tracemalloc para no distorsionar los tiempos
+    (no incluye los búferes internos de PIL).
+
+    Returns:
+        Diccionario con los parámetros del caso y sus métricas
+    """
+    rng = random.Random(f"{semilla}:{tamaño}:{densidad}:{alfabeto}")
+    palabras = generar_palabras(tamaño, densidad, ALFABETOS[alfabeto], rng, max_palabras)
+    parametros = dict(
+        palabras=palabras,
+        tamaño=tamaño,
+        orientaciones=ORIENTACIONES[orientaciones],
+        alfabeto=ALFABETOS[alfabeto],
+        estrategia=estrategia,
+        backend=backend,
+    )
+
+    def ejecutar(indice: int, directorio: str) -> Dict:
+        generador = WordSearchGenerator(semilla=semilla + indice, **parametros)
+        generador.generar()
+        generador.exportar_imagen(os.path.join(directorio, 'sopa.png'))
+        generador.exportar_solucion(os.path.join(directorio, 'solucion.txt'))
+
+        estadisticas = generador.obtener_estadisticas()
+        tiempos = estadisticas['tiempos']
+        return {
+            'colocacion': tiempos['colocacion'],
+            'relleno': tiempos['relleno'],
+            'imagen': tiempos['renderizado'],
+            'solucion': tiempos['solucion'],
+            'intentos': estadisticas['intentos_totales'],
+            'rechazos': estadisticas['rechazos_totales'],
+            'retrocesos': estadisticas['retrocesos_totales'],
+            'candidatos': sum(estadisticas['candidatos_por_palabra'].values()),
+        }
+
+    resultado = {
+        'tamaño': tamaño,
+        'densidad': densidad,
+        'orientaciones': orientaciones,
+        'alfabeto': alfabeto,
+        'estrategia': estrategia,
+        'backend': backend,
+        'palabras': len(palabras),
+        'densidad_real': sum(map(len, palabras)) / (tamaño * tamaño),
+    }
+
+    with tempfile.TemporaryDirectory() as directorio:
+        try:
+            medidas = [ejecutar(i, directorio) for i in range(repeticiones)]
+            tracemalloc.start()
+            ejecutar(0, directorio)
+            _, pico = tracemalloc.get_traced_memory()
+        except ValueError as e:
+            resultado['error'] = str(e)
+            return resultado
+        finally:
+            if tracemalloc.is_tracing():
+                tracemalloc.stop()
+
+    def mediana(clave: str) -> float:
+        valores = sorted(m[clave] for m in medidas)
+        return valores[len(valores) // 2]
+
+    total_palabras = max(len(palabras), 1)
+    generacion = mediana('colocacion') + mediana('relleno')
+    resultado.update({
+        'segundos_colocacion': mediana('colocacion'),
+        'segundos_relleno': mediana('relleno'),
+        'segundos_generacion': generacion,
+        'segundos_imagen': mediana('imagen'),
+        'segundos_solucion': mediana('solucion'),
+        'segundos_por_sopa': generacion + mediana('imagen') + mediana('solucion'),
+        'intentos_por_palabra': mediana('intentos') / total_palabras,
+        'rechazos_por_palabra': mediana('rechazos') / total_palabras,
+        'retrocesos_por_palabra': mediana('retrocesos') / total_palabras,
+        'candidatos_por_palabra': mediana('candidatos') / total_palabras,
+        'pico_memoria_bytes': pico,
+    })
+    return resultado
+
+
+def _medir_en_proceso(conexion, argumentos: Dict) -> None:
+    conexion.send(medir_caso(**argumentos))
+    conexion.close()
+
+
+def medir_caso_con_presupuesto(presupuesto: Optional[float], **argumentos) -> Dict:
+    """
+    Mide un caso en un proceso aparte y lo abandona si tarda demasiado.
+
+    Args:
+        presupuesto: Segundos máximos para todo el caso (None sin límite)
+        **argumentos: Argumentos de medir_caso
+
+    Returns:
+        Resultado de medir_caso o, si se agotó el presupuesto, los
+        parámetros del caso con 'error'
+    """
+    if presupuesto is None:
+        return medir_caso(**argumentos)
+
+    receptor, emisor = multiprocessing.Pipe(duplex=False)
+    proceso = multiprocessing.Process(target=_medir_en_proceso, args=(emisor, argumentos))
+    proceso.start()
+    emisor.close()
+    try:
+        if receptor.poll(presupuesto):
+            return receptor.recv()
+        error = f"Superó el presupuesto de {presupuesto:g} s"
+    except EOFError:
+        error = "El proceso de medida terminó sin resultado"
+    finally:
+        if proceso.is_alive():
+            proceso.terminate()
+        proceso.join()
+        receptor.close()
+
+    return {
+        'tamaño': argumentos['tamaño'],
+        'densidad': argumentos['densidad'],
+        'orientaciones': argumentos['orientaciones'],
+        'alfabeto': argumentos['alfabeto'],
+        'estrategia': argumentos.get('estrategia', 'aleatoria'),
+        'backend': argumentos.get('backend', 'lista'),
+        'error': error,
+    }
+
+
+def _commit_actual() -> Optional[str]:
+    """Devuelve el commit de git del árbol medido, si está disponible."""
+    try:
+        salida = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return salida.stdout.strip()
+
+
+def ejecutar_benchmark(
+    tamaños: List[int],
+    densidades: List[float],
+    orientaciones: List[str],
+    alfabetos: List[str],
+    estrategia: str = 'aleatoria',
+    backend: str = 'lista',
+    repeticiones: int = 3,
+    max_palabras: Optional[int] = None,
+    presupuesto: Optional[float] = PRESUPUESTO_CASO,
+    al_medir=None
+) -> Dict:
+    """
+    Ejecuta el barrido completo de casos.
+
+    Args:
+        presupuesto: Segundos máximos por caso (None sin límite)
+        al_medir: Función llamada con el resultado de cada caso
+
+    Returns:
+        Diccionario con 'metadatos' y la lista de 'resultados'
+    """
+    resultados = []
+    for tamaño in tamaños:
+        for densidad in densidades:
+            for nombre_orientaciones in orientaciones:
+                for nombre_alfabeto in alfabetos:
+                    resultado = medir_caso_con_presupuesto(
+                        presupuesto,
+                        tamaño=tamaño, densidad=densidad,
+                        orientaciones=nombre_orientaciones, alfabeto=nombre_alfabeto,
+                        estrategia=estrategia, backend=backend,
+                        repeticiones=repeticiones, max_palabras=max_palabras
+                    )
+                    resultados.append(resultado)
+                    if al_medir:
+                        al_medir(resultado)
+
+    return {
+        'metadatos': {
+            'commit': _commit_actual(),
+            'fecha': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'plataforma': platform.platform(),
+            'repeticiones': repeticiones,
+            'presupuesto_caso': presupuesto,
+            'max_palabras': max_palabras,
+        },
+        'resultados': resultados,
+    }
+
+
+def _clave(resultado: Dict) -> tuple:
+    return tuple(resultado[campo] for campo in (
+        'tamaño', 'densidad', 'orientaciones', 'alfabeto', 'estrategia', 'backend'
+    ))
+
+
+def comparar(anterior: Dict, actual: Dict) -> List[Dict]:
+    """
+    Compara dos ejecuciones del benchmark caso por caso.
+
+    Returns:
+        Lista con los casos comunes y la razón actual/anterior de
+        segundos_por_sopa (menor que 1 significa más rápido)
+    """
+    previos = {_clave(r): r for r in anterior['resultados'] if 'error' not in r}
+    comparacion = []
+    for resultado in actual['resultados']:
+        previo = previos.get(_clave(resultado))
+        if previo is None or 'error' in resultado or not previo['segundos_por_sopa']:
+            continue
+        comparacion.append({
+            'caso': _clave(resultado),
+            'anterior': previo['segundos_por_sopa'],
+            'actual': resultado['segundos_por_sopa'],
+            'razon': resultado['segundos_por_sopa'] / previo['segundos_por_sopa'],
+        })
+    return comparacion
+
+
+def _imprimir_resultado(resultado: Dict) -> None:
+    caso = (f"{resultado['tamaño']:>4} {resultado['densidad']:>4} "
+            f"{resultado['orientaciones']:<9} {resultado['alfabeto']}")
+    if 'error' in resultado:
+        print(f"{caso}  ❌ {resultado['error']}")
+        return
+    print(f"{caso}  {resultado['palabras']:>4} palabras  "
+          f"gen {resultado['segundos_generacion'] * 1000:8.1f} ms  "
+          f"img {resultado['segundos_imagen'] * 1000:7.1f} ms  "
+          f"densidad real {resultado['densidad_real']:.2f}  "
+          f"inicios/palabra {resultado['intentos_por_palabra']:.1f} "
+          f"(rechazados {resultado['rechazos_por_palabra']:.1f})  "
+          f"pico {resultado['pico_memoria_bytes'] / 1024:.0f} KiB")
+
+
+def main():
+    """Punto de entrada del benchmark."""
+    parser = argparse.ArgumentParser(description='Benchmark de generación de sopas de letras')
+    parser.add_argument('--rapido', action='store_true',
+                        help=f'Solo tamaños {TAMAÑOS_RAPIDO} y una repetición')
+    parser.add_argument('--tamaños', type=int, nargs='+', default=None,
+                        help=f'Tamaños de cuadrícula (default: {TAMAÑOS})')
+    parser.add_argument('--densidades', type=float, nargs='+', default=DENSIDADES,
+                        help=f'Fracción de celdas ocupadas por palabras (default: {DENSIDADES})')
+    parser.add_argument('--orientaciones', nargs='+', choices=list(ORIENTACIONES),
+                        default=list(ORIENTACIONES))
+    parser.add_argument('--alfabetos', nargs='+', choices=list(ALFABETOS),
+                        default=list(ALFABETOS))
+    parser.add_argument('--estrategia', choices=Config.ESTRATEGIAS, default='aleatoria')
+    parser.add_argument('--backend', default='lista')
+    parser.add_argument('--repeticiones', type=int, default=3)
+    parser.add_argument('--max-palabras', type=int, default=None,
+                        help='Límite de palabras por sopa (default: sin límite, para que '
+                             'la densidad sea la pedida)')
+    parser.add_argument('--presupuesto', type=float, default=PRESUPUESTO_CASO, metavar='SEG',
+                        help='Segundos máximos por caso; los casos que lo superan se '
+                             f'registran como error; 0 sin límite (default: {PRESUPUESTO_CASO:g})')
+    parser.add_argument('-o', '--output', default='benchmark_resultados.json',
+                        help='Archivo JSON de resultados')
+    parser.add_argument('--comparar', metavar='ANTERIOR',
+                        help='JSON de una ejecución anterior con el que comparar')
+    args = parser.parse_args()
+
+    tamaños = args.tamaños or (TAMAÑOS_RAPIDO if args.rapido else TAMAÑOS)
+    repeticiones = 1 if args.rapido else args.repeticiones
+
+    datos = ejecutar_benchmark(
+        tamaños, args.densidades, args.orientaciones, args.alfabetos,
+        estrategia=args.estrategia, backend=args.backend,
+        repeticiones=repeticiones, max_palabras=args.max_palabras,
+        presupuesto=args.presupuesto or None,
+        al_medir=_imprimir_resultado
+    )
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(datos, f, ensure_ascii=False, indent=2)
+    print(f"\n✅ Resultados guardados en: {args.output}")
+
+    if args.comparar:
+        with open(args.comparar, 'r', encoding='utf-8') as f:
+            anterior = json.load(f)
+        print(f"\nComparación con {anterior['metadatos'].get('commit') or args.comparar}:")
+        for fila in comparar(anterior, datos):
+            print(f"  {fila['caso']}: {fila['anterior'] * 1000:.1f} ms -> "
+                  f"{fila['actual'] * 1000:.1f} ms (x{fila['razon']:.2f})")
+
+
+if __name__ == '__main__':
+    main()
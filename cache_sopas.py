@@ -0,0 +1,239 @@
+"""
+Caché en disco de sopas de letras generadas y renderizadas.
+
+Cada entrada se direcciona por el hash SHA-256 de todo lo que determina el
+resultado (palabras, tamaño, orientaciones, alfabeto, inversión, estrategia,
+relleno, almacenamiento, semilla y opciones de renderizado) y guarda en un
+solo archivo la cuadrícula, las palabras colocadas y los bytes exportados.
+Las escrituras son atómicas (archivo temporal + os.replace), así varios
+procesos pueden compartir el mismo directorio.
+"""
+
+import hashlib
+import io
+import json
+import os
+import tempfile
+import time
+from typing import Dict, Optional, Tuple
+
+from config import Config
+from word_search_generator import WordSearchGenerator
+
+
+class CacheSopas:
+    """
+    Caché de resultados con desalojo por antigüedad y por tamaño (LRU).
+
+    Al leer una entrada se actualiza su fecha de modificación, de modo que
+    al superar max_bytes se borran primero las menos usadas recientemente.
+    Solo se cachean sopas con semilla: sin ella cada llamada debe producir
+    una sopa distinta.
+
+    Attributes:
+        directorio: Carpeta de la caché
+        max_bytes: Tamaño máximo total de las entradas
+        max_edad: Segundos sin usarse tras los que una entrada se borra
+        contadores: Aciertos, fallos, escrituras y desalojos de este proceso
+    """
+
+    EXTENSION = '.sopa'
+
+    def __init__(
+        self,
+        directorio: str,
+        max_bytes: int = Config.CACHE_MAX_BYTES,
+        max_edad: float = Config.CACHE_MAX_EDAD
+    ):
+        """
+        Inicializa la caché y crea su carpeta si no existe.
+
+        Args:
+            directorio: Carpeta de la caché
+            max_bytes: Tamaño máximo total de las entradas
+            max_edad: Segundos sin usarse tras los que una entrada se borra
+        """
+        self.directorio = directorio
+        self.max_bytes = max_bytes
+        self.max_edad = max_edad
+        self.contadores = {'aciertos': 0, 'fallos': 0, 'escrituras': 0, 'desalojos': 0}
+        self._escrituras_pendientes = 0
+        os.makedirs(directorio, exist_ok=True)
+
+    @staticmethod
+    def clave(generador: WordSearchGenerator, formato: str, opciones: Dict) -> str:
+        """
+        Calcula la clave de contenido de una sopa y su renderizado.
+
+        Args:
+            generador: Generador ya configurado (aún sin generar)
+            formato: Formato de exportación
+            opciones: Opciones de dibujo pasadas a exportar()
+
+        Returns:
+            Hash SHA-256 en hexadecimal
+        """
+        entradas = {
+            'version': Config.CACHE_VERSION,
+            'palabras': generador.palabras,
+            'tamaño': generador.tamaño,
+            'orientaciones': list(generador.orientaciones),
+            'alfabeto': generador.alfabeto,
+            'permitir_inversa': generador.permitir_inversa,
+            'estrategia': generador.estrategia,
+            'max_nodos': generador.max_nodos,
+            'relleno': generador.relleno,
+            'maximizar_solapamiento': generador.maximizar_solapamiento,
+            'backend': generador.backend,
+            'semilla': generador.semilla,
+            'formato': formato,
+            'opciones': opciones,
+        }
+        texto = json.dumps(entradas, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(texto.encode('utf-8')).hexdigest()
+
+    def _ruta(self, clave: str) -> str:
+        return os.path.join(self.directorio, clave[:2], clave + self.EXTENSION)
+
+    def leer(self, clave: str) -> Optional[Tuple[Dict, bytes]]:
+        """
+        Lee una entrada y la marca como usada.
+
+        Args:
+            clave: Clave de la entrada
+
+        Returns:
+            Tupla (datos, contenido) o None si no existe o está dañada
+        """
+        ruta = self._ruta(clave)
+        try:
+            with open(ruta, 'rb') as f:
+                cabecera = json.loads(f.readline().decode('utf-8'))
+                contenido = f.read()
+            os.utime(ruta)
+        except (OSError, ValueError):
+            return None
+        if len(contenido) != cabecera.get('bytes'):
+            return None
+        return cabecera, contenido
+
+    def guardar(self, clave: str, datos: Dict, contenido: bytes) -> None:
+        """
+        Escribe una entrada de forma atómica.
+
+        El archivo se escribe primero con un nombre temporal en la misma
+        carpeta y después se renombra, así ningún lector ve una entrada a
+        medio escribir.
+
+        Args:
+            clave: Clave de la entrada
+            datos: Datos serializables a JSON (cuadrícula, solución...)
+            contenido: Bytes exportados
+        """
+        ruta = self._ruta(clave)
+        os.makedirs(os.path.dirname(ruta), exist_ok=True)
+        cabecera = json.dumps(dict(datos, bytes=len(contenido)), ensure_ascii=False)
+        descriptor, temporal = tempfile.mkstemp(dir=os.path.dirname(ruta), suffix='.tmp')
+        try:
+            with os.fdopen(descriptor, 'wb') as f:
+                f.write(cabecera.encode('utf-8') + b'\n')
+                f.write(contenido)
+            os.replace(temporal, ruta)
+        except BaseException:
+            try:
+                os.remove(temporal)
+            except OSError:
+                pass
+            raise
+
+        self.contadores['escrituras'] += 1
+        self._escrituras_pendientes += 1
+        if self._escrituras_pendientes >= Config.CACHE_INTERVALO_DESALOJO:
+            self.desalojar()
+
+    def desalojar(self) -> int:
+        """
+        Borra las entradas caducadas y, si hace falta, las menos usadas.
+
+        Returns:
+            Número de entradas borradas
+        """
+        self._escrituras_pendientes = 0
+        ahora = time.time()
+        entradas = []
+        for raiz, _, archivos in os.walk(self.directorio):
+            for nombre in archivos:
+                ruta = os.path.join(raiz, nombre)
+                try:
+                    estado = os.stat(ruta)
+                except OSError:
+                    continue
+                # Temporales huérfanos de escrituras interrumpidas
+                if nombre.endswith('.tmp') and ahora - estado.st_mtime > 3600:
+                    entradas.append((0.0, estado.st_size, ruta))
+                elif nombre.endswith(self.EXTENSION):
+                    entradas.append((estado.st_mtime, estado.st_size, ruta))
+
+        entradas.sort()
+        total = sum(tamaño for _, tamaño, _ in entradas)
+        borradas = 0
+        for modificado, tamaño, ruta in entradas:
+            if ahora - modificado <= self.max_edad and total <= self.max_bytes:
+                break
+            try:
+                os.remove(ruta)
+            except OSError:
+                continue
+            total -= tamaño
+            borradas += 1
+
+        self.contadores['desalojos'] += borradas
+        return borradas
+
+    def obtener(
+        self,
+        formato: str = 'png',
+        opciones: Optional[Dict] = None,
+        **parametros
+    ) -> Tuple[WordSearchGenerator, bytes, bool]:
+        """
+        Devuelve una sopa generada y exportada, usando la caché si es posible.
+
+        Args:
+            formato: 'png', 'svg', 'pdf' o 'txt'
+            opciones: Opciones de dibujo para exportar()
+            **parametros: Parámetros de WordSearchGenerator
+
+        Returns:
+            Tupla (generador con la sopa, bytes exportados, si fue acierto)
+
+        Raises:
+            ValueError: Si las palabras no caben en la cuadrícula
+        """
+        opciones = opciones or {}
+        generador = WordSearchGenerator(**parametros)
+        cacheable = generador.semilla is not None and parametros.get('rng') is None
+
+        if cacheable:
+            clave = self.clave(generador, formato, opciones)
+            entrada = self.leer(clave)
+            if entrada is not None:
+                self.contadores['aciertos'] += 1
+                datos, contenido = entrada
+                generador.restaurar(datos['cuadricula'], datos['solucion'])
+                return generador, contenido, True
+            self.contadores['fallos'] += 1
+
+        generador.generar()
+        salida = io.StringIO() if formato in Config.FORMATOS_TEXTO else io.BytesIO()
+        generador.exportar(salida, formato=formato, **opciones)
+        contenido = salida.getvalue()
+        if formato in Config.FORMATOS_TEXTO:
+            contenido = contenido.encode('utf-8')
+
+        if cacheable:
+            self.guardar(clave, {
+                'cuadricula': generador.cuadrícula,
+                'solucion': generador.obtener_solucion(),
+            }, contenido)
+        return generador, contenido, False
@@ -0,0 +1,121 @@
+"""
+Métricas de calidad de una sopa de letras generada.
+
+Cada métrica recibe un WordSearchGenerator ya generado y devuelve una
+puntuación entre 0 (peor) y 1 (mejor). Las métricas son funciones de
+módulo (o functools.partial de ellas) para que puedan enviarse a otros
+procesos; cualquier función con esa firma sirve como métrica propia.
+"""
+
+import math
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Función (generador ya generado) -> puntuación entre 0 y 1
+Metrica = Callable[..., float]
+
+
+def _uniformidad(conteos: List[int], categorias: int) -> float:
+    """
+    Entropía de un reparto normalizada entre 0 (todo en una categoría) y 1.
+
+    Args:
+        conteos: Elementos en cada categoría ocupada
+        categorias: Categorías posibles (también las vacías)
+
+    Returns:
+        Uniformidad del reparto; 1 si no hay forma de repartir nada
+    """
+    total = sum(conteos)
+    # Con n elementos no pueden ocuparse más de n categorías
+    posibles = min(categorias, total)
+    if posibles <= 1:
+        return 1.0
+    entropia = -sum(c / total * math.log(c / total) for c in conteos if c)
+    return min(1.0, entropia / math.log(posibles))
+
+
+def variedad_orientaciones(generador) -> float:
+    """
+    Mide si las palabras usan por igual todas las orientaciones permitidas.
+
+    Args:
+        generador: WordSearchGenerator ya generado
+
+    Returns:
+        Uniformidad del reparto de orientaciones (ver obtener_estadisticas)
+    """
+    usadas = generador.obtener_estadisticas()['orientaciones_usadas']
+    return _uniformidad(list(usadas.values()), len(generador.orientaciones))
+
+
+def dispersion(generador) -> float:
+    """
+    Mide si las letras de las palabras se reparten por toda la cuadrícula.
+
+    Cuenta las celdas ocupadas por palabras en cada cuadrante; una sopa con
+    todas las palabras apiñadas en una esquina puntúa cerca de 0.
+
+    Args:
+        generador: WordSearchGenerator ya generado
+
+    Returns:
+        Uniformidad del reparto de celdas entre los cuatro cuadrantes
+    """
+    celdas = set()
+    for info in generador.palabras_colocadas.values():
+        celdas.update(info.posiciones)
+    cuadrantes = [0, 0, 0, 0]
+    for fila, col in celdas:
+        cuadrantes[2 * (2 * fila // generador.tamaño) + 2 * col // generador.tamaño] += 1
+    return _uniformidad(cuadrantes, 4 if generador.tamaño > 1 else 1)
+
+
+def invertidas(generador, objetivo: Optional[int] = None) -> float:
+    """
+    Mide cuánto se acerca el número de palabras invertidas al objetivo.
+
+    Args:
+        generador: WordSearchGenerator ya generado
+        objetivo: Palabras invertidas deseadas (por defecto, la mitad de las
+            colocadas)
+
+    Returns:
+        1 si coincide con el objetivo, bajando linealmente hasta 0 en el
+        peor caso posible; 1 si la sopa no permite invertir palabras
+    """
+    if not generador.permitir_inversa:
+        return 1.0
+    colocadas = len(generador.palabras_colocadas)
+    if objetivo is None:
+        objetivo = colocadas // 2
+    objetivo = min(objetivo, colocadas)
+    peor = max(objetivo, colocadas - objetivo)
+    if peor == 0:
+        return 1.0
+    reales = sum(1 for info in generador.palabras_colocadas.values() if info.inversa)
+    return 1.0 - abs(reales - objetivo) / peor
+
+
+# Métricas disponibles por nombre
+METRICAS: Dict[str, Metrica] = {
+    'orientaciones': variedad_orientaciones,
+    'dispersion': dispersion,
+    'invertidas': invertidas,
+}
+
+
+def puntuar(generador, metricas: Optional[Dict[str, Metrica]] = None) -> Tuple[float, Dict[str, float]]:
+    """
+    Puntúa una sopa con varias métricas.
+
+    Args:
+        generador: WordSearchGenerator ya generado
+        metricas: Diccionario nombre -> métrica (por defecto, METRICAS)
+
+    Returns:
+        Tupla (media de las métricas, puntuación de cada métrica)
+    """
+    metricas = METRICAS if metricas is None else metricas
+    detalle = {nombre: metrica(generador) for nombre, metrica in metricas.items()}
+    total = sum(detalle.values()) / len(detalle) if detalle else 0.0
+    return total, detalle
@@ -2,6 +2,26 @@
 Configuración global para el generador de sopa de letras.
 """
 
+import warnings
+
+
+class _Obsoleto:
+    """Constante de Config retirada que avisa y devuelve la que la sustituye."""
+
+    def __init__(self, sustituta: str):
+        self.sustituta = sustituta
+
+    def __set_name__(self, propietario, nombre: str):
+        self.nombre = nombre
+
+    def __get__(self, instancia, propietario):
+        warnings.warn(
+            f"Config.{self.nombre} está obsoleto; usa Config.{self.sustituta}",
+            DeprecationWarning,
+            stacklevel=2
+        )
+        return getattr(propietario, self.sustituta)
+
 
 class Config:
     """Configuración por defecto para la generación de sopas de letras."""
@@ -15,8 +35,26 @@ class Config:
     COLOR_LINEAS = 'black'
     COLOR_TEXTO = 'black'
 
+    # Formatos de salida disponibles
+    FORMATOS_SALIDA = ['png', 'svg', 'pdf', 'txt']
+    FORMATOS_TEXTO = ['svg', 'txt']  # Se escriben en modo texto (UTF-8)
+
     # Fuente
     FUENTE_POR_DEFECTO = None  # None usa la fuente por defecto de PIL
+    TAMAÑO_FUENTE = None  # None usa el tamaño por defecto de la fuente
+
+    # Fuente de los exportadores vectoriales (SVG y PDF)
+    PROPORCION_FUENTE_VECTORIAL = 0.5  # Tamaño de letra relativo a la celda
+    TAMAÑO_FUENTE_LISTA = 10  # Tamaño de letra de la lista de palabras
+    TAMAÑO_FUENTE_TITULO = 14  # Tamaño de letra del título de cada página
+    ALTURA_TITULO_PDF = 30  # Banda superior para el título en cuadernillos
+    COLOR_RESALTADO = '#ffe680'  # Celdas de las palabras en las soluciones
+
+    # Renderizado por franjas (pósteres con celdas de tamaño fijo)
+    TAMAÑO_CELDA_FRANJAS = 24  # Lado de cada celda en píxeles
+    PROPORCION_FUENTE_FRANJAS = 0.6  # Tamaño de letra relativo a la celda
+    ALTURA_FRANJA = 256  # Altura aproximada de cada franja en píxeles
+    TAMAÑO_BLOQUE_PNG = 1 << 16  # Bytes comprimidos por bloque IDAT
 
     # Alfabeto español (incluye Ñ)
     ALFABETO_ES = 'ABCDEFGHIJKLMNÑOPQRSTUVWXYZ'
@@ -28,8 +66,43 @@ class Config:
     ORIENTACIONES_BASICO = ['H', 'V']  # Horizontal, Vertical
     ORIENTACIONES_AVANZADO = ['H', 'V', 'D', 'H_INV', 'V_INV', 'D_INV']
 
+    # Estrategias de colocación de palabras
+    ESTRATEGIAS = ['aleatoria', 'backtracking']
+
+    # Modos de relleno de las celdas libres
+    RELLENOS = ['aleatorio', 'sin_duplicados']
+
     # Límites
-    MAX_INTENTOS_COLOCACION = 1000
+    MAX_NODOS_BACKTRACKING = 5000
+    MUESTRAS_COLOCACION = 32  # Inicios al azar probados antes de enumerar todos
+    MAX_INTENTOS_COLOCACION = _Obsoleto('MUESTRAS_COLOCACION')
+    MAX_PLANTILLAS_CACHE = 16  # Plantillas de imagen guardadas en memoria
+
+    # Servidor HTTP
+    SERVIDOR_HOST = '127.0.0.1'
+    SERVIDOR_PUERTO = 8000
+    SERVIDOR_MAX_PENDIENTES = 64  # Peticiones admitidas a la vez (en cola + en proceso)
+    SERVIDOR_TIEMPO_ESPERA = 10  # Segundos máximos esperando un proceso libre
+    SERVIDOR_TIEMPO_LECTURA = 10  # Segundos máximos para recibir cabeceras y cuerpo
+    SERVIDOR_TIEMPO_GENERACION = 30  # Segundos máximos esperando una sopa del pool
+    SERVIDOR_MAX_CUERPO = 1 << 20  # Bytes máximos del cuerpo de una petición
+    SERVIDOR_MAX_TAMAÑO = 200  # Tamaño máximo de cuadrícula aceptado
+    SERVIDOR_MAX_TRABAJO = 20000  # Máximo de tamaño × número de palabras por petición
+    SERVIDOR_MAX_NODOS = 5000  # Presupuesto de backtracking de cada petición
+
+    # Caché de resultados en disco
+    CACHE_VERSION = 1  # Cambiarla invalida las entradas guardadas
+    CACHE_MAX_BYTES = 512 * 1024 * 1024
+    CACHE_MAX_EDAD = 7 * 24 * 3600  # Segundos sin usarse antes de desalojar
+    CACHE_INTERVALO_DESALOJO = 32  # Escrituras entre revisiones de la caché
+
+    # Listas de palabras externas
+    DENSIDAD_MAXIMA_MUESTREO = 0.5  # Fracción de celdas que pueden ocupar las palabras elegidas
+
+    # Tamaño automático de la cuadrícula
+    PRESUPUESTO_TAMAÑO_AUTO = 2.0  # Segundos de búsqueda del tamaño mínimo
+    INTENTOS_TAMAÑO_AUTO = 3  # Semillas probadas por tamaño
+    MAX_REINTENTOS_TAMAÑO_AUTO = 5  # Tamaños extra si falla la semilla final
 
     # Formato de palabras en la lista
     ESPACIADO_CHECKBOX = "[ ]"
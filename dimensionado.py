@@ -0,0 +1,194 @@
+"""
+Elección automática del tamaño de la cuadrícula.
+
+Estima un tamaño de partida a partir de la palabra más larga y, sin
+empaquetado denso, del total de letras, y busca desde ahí el menor tamaño
+con el que la generación tiene éxito dentro de un presupuesto de tiempo. El resultado se guarda por
+conjunto de palabras (en memoria y, opcionalmente, en un archivo JSON) para
+que los trabajos repetidos no vuelvan a buscar.
+"""
+
+import hashlib
+import json
+import math
+import os
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+from config import Config
+from word_search_generator import WordSearchGenerator
+
+_TAMAÑOS_CONOCIDOS: Dict[str, int] = {}
+
+
+def cota_inferior(palabras: List[str], maximizar_solapamiento: bool = False) -> int:
+    """
+    Estima el tamaño desde el que empezar a buscar.
+
+    Ninguna palabra puede ser más larga que el lado: esa es la única cota
+    segura. Sin empaquetado denso las palabras se cruzan poco, así que se
+    parte además de lado² ≥ total de letras, una estimación heurística que
+    ahorra probar tamaños que casi nunca funcionan. Con empaquetado denso
+    las palabras comparten muchas celdas y esa estimación podría saltarse el
+    tamaño mínimo, así que se parte solo de la palabra más larga.
+
+    Args:
+        palabras: Palabras de la sopa
+        maximizar_solapamiento: Si se usará el empaquetado denso
+
+    Returns:
+        Tamaño desde el que buscar
+    """
+    palabras = [p.upper() for p in palabras]
+    mas_larga = max(map(len, palabras))
+    if maximizar_solapamiento:
+        return mas_larga
+    return max(mas_larga, math.ceil(math.sqrt(sum(map(len, palabras)))))
+
+
+def clave_palabras(
+    palabras: List[str],
+    orientaciones: List[str],
+    permitir_inversa: bool,
+    estrategia: str,
+    maximizar_solapamiento: bool = False
+) -> str:
+    """
+    Calcula la clave de caché de un conjunto de palabras y opciones de colocación.
+
+    Returns:
+        Hash SHA-256 en hexadecimal
+    """
+    datos = {
+        'palabras': sorted({p.upper() for p in palabras}),
+        'orientaciones': sorted(orientaciones),
+        'permitir_inversa': permitir_inversa,
+        'estrategia': estrategia,
+        'maximizar_solapamiento': maximizar_solapamiento,
+    }
+    texto = json.dumps(datos, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(texto.encode('utf-8')).hexdigest()
+
+
+def _leer_archivo_cache(archivo_cache: str) -> Dict[str, int]:
+    try:
+        with open(archivo_cache, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _guardar_en_archivo_cache(archivo_cache: str, clave: str, tamaño: int) -> None:
+    """Añade un resultado al archivo de caché con una escritura atómica."""
+    directorio = os.path.dirname(os.path.abspath(archivo_cache))
+    os.makedirs(directorio, exist_ok=True)
+    tamaños = _leer_archivo_cache(archivo_cache)
+    tamaños[clave] = tamaño
+    descriptor, temporal = tempfile.mkstemp(dir=directorio, suffix='.tmp')
+    try:
+        with os.fdopen(descriptor, 'w', encoding='utf-8') as f:
+            json.dump(tamaños, f)
+        os.replace(temporal, archivo_cache)
+    except BaseException:
+        try:
+            os.remove(temporal)
+        except OSError:
+            pass
+        raise
+
+
+def _genera(tamaño: int, semilla: int, **parametros) -> bool:
+    try:
+        WordSearchGenerator(tamaño=tamaño, semilla=semilla, **parametros).generar()
+    except ValueError:
+        return False
+    return True
+
+
+def elegir_tamaño(
+    palabras: List[str],
+    orientaciones: Optional[List[str]] = None,
+    alfabeto: str = Config.ALFABETO_EN,
+    permitir_inversa: bool = False,
+    estrategia: str = 'aleatoria',
+    maximizar_solapamiento: bool = False,
+    presupuesto: float = Config.PRESUPUESTO_TAMAÑO_AUTO,
+    intentos: int = Config.INTENTOS_TAMAÑO_AUTO,
+    archivo_cache: Optional[str] = None
+) -> int:
+    """
+    Busca el menor tamaño de cuadrícula con el que se generan las palabras.
+
+    Prueba los tamaños desde cota_inferior, con hasta `intentos` semillas
+    por tamaño. Si se agota el presupuesto de tiempo, pasa a crecer un 25%
+    por paso con un solo intento, de modo que la búsqueda siempre termina
+    pronto aunque el resultado no sea el mínimo.
+
+    Args:
+        palabras: Palabras de la sopa
+        orientaciones: Orientaciones permitidas (por defecto, básicas)
+        alfabeto: Alfabeto de relleno
+        permitir_inversa: Si se permiten palabras invertidas
+        estrategia: Estrategia de colocación
+        maximizar_solapamiento: Si se usa el empaquetado denso
+        presupuesto: Segundos para la búsqueda fina
+        intentos: Semillas a probar por tamaño durante la búsqueda fina
+        archivo_cache: Archivo JSON donde guardar y consultar resultados
+
+    Returns:
+        Tamaño de la cuadrícula
+
+    Raises:
+        ValueError: Si no hay palabras o ningún tamaño razonable funciona
+    """
+    if not palabras:
+        raise ValueError("Se necesita al menos una palabra para elegir el tamaño")
+    orientaciones = orientaciones or Config.ORIENTACIONES_BASICO
+
+    clave = clave_palabras(
+        palabras, orientaciones, permitir_inversa, estrategia, maximizar_solapamiento
+    )
+    if clave not in _TAMAÑOS_CONOCIDOS and archivo_cache:
+        conocido = _leer_archivo_cache(archivo_cache).get(clave)
+        if conocido is not None:
+            _TAMAÑOS_CONOCIDOS[clave] = conocido
+    if clave in _TAMAÑOS_CONOCIDOS:
+        return _TAMAÑOS_CONOCIDOS[clave]
+
+    parametros = dict(
+        palabras=palabras,
+        orientaciones=orientaciones,
+        alfabeto=alfabeto,
+        permitir_inversa=permitir_inversa,
+        estrategia=estrategia,
+        maximizar_solapamiento=maximizar_solapamiento,
+    )
+    minimo = cota_inferior(palabras, maximizar_solapamiento)
+    limite = 4 * minimo + 10
+    limite_tiempo = time.perf_counter() + presupuesto
+
+    tamaño = minimo
+    encontrado = None
+    while tamaño <= limite:
+        if time.perf_counter() < limite_tiempo:
+            if any(_genera(tamaño, semilla, **parametros) for semilla in range(intentos)):
+                encontrado = tamaño
+                break
+            tamaño += 1
+        else:
+            if _genera(tamaño, 0, **parametros):
+                encontrado = tamaño
+                break
+            tamaño += max(1, tamaño // 4)
+
+    if encontrado is None:
+        raise ValueError(
+            f"No se encontró un tamaño de cuadrícula entre {minimo} y {limite} "
+            f"que admita todas las palabras"
+        )
+
+    _TAMAÑOS_CONOCIDOS[clave] = encontrado
+    if archivo_cache:
+        _guardar_en_archivo_cache(archivo_cache, clave, encontrado)
+    return encontrado
@@ -0,0 +1,468 @@
+"""
+Exportadores vectoriales (SVG y PDF) para sopas de letras.
+
+Escriben la cuadrícula, las letras y la lista de palabras directamente como
+primitivas vectoriales, sin pasar por un mapa de bits, de modo que el tamaño
+del archivo y el tiempo de escritura no dependen de la resolución de salida.
+"""
+
+import os
+import re
+from html import escape
+from typing import BinaryIO, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from config import Config
+
+
+# Anchos de glifo de Helvetica (unidades de 1/1000 del tamaño de fuente),
+# usados para centrar cada letra en su celda en el PDF.
+_ANCHOS_HELVETICA = {
+    'A': 667, 'B': 667, 'C': 722, 'D': 722, 'E': 667, 'F': 611, 'G': 778,
+    'H': 722, 'I': 278, 'J': 500, 'K': 667, 'L': 556, 'M': 833, 'N': 722,
+    'Ñ': 722, 'O': 778, 'P': 667, 'Q': 778, 'R': 722, 'S': 667, 'T': 611,
+    'U': 722, 'V': 667, 'W': 944, 'X': 667, 'Y': 667, 'Z': 611,
+}
+_ANCHO_HELVETICA_POR_DEFECTO = 667
+_ALTURA_MAYUSCULAS_HELVETICA = 718
+
+# Colores CSS con nombre (la tabla completa de CSS Color Module Level 4),
+# para leer en el PDF los mismos colores que aceptan PNG y SVG sin cargar Pillow
+_COLORES_CSS = {
+    'aliceblue': '#f0f8ff', 'antiquewhite': '#faebd7', 'aqua': '#00ffff', 'aquamarine': '#7fffd4',
+    'azure': '#f0ffff', 'beige': '#f5f5dc', 'bisque': '#ffe4c4', 'black': '#000000',
+    'blanchedalmond': '#ffebcd', 'blue': '#0000ff', 'blueviolet': '#8a2be2', 'brown': '#a52a2a',
+    'burlywood': '#deb887', 'cadetblue': '#5f9ea0', 'chartreuse': '#7fff00',
+    'chocolate': '#d2691e', 'coral': '#ff7f50', 'cornflowerblue': '#6495ed',
+    'cornsilk': '#fff8dc', 'crimson': '#dc143c', 'cyan': '#00ffff', 'darkblue': '#00008b',
+    'darkcyan': '#008b8b', 'darkgoldenrod': '#b8860b', 'darkgray': '#a9a9a9',
+    'darkgreen': '#006400', 'darkgrey': '#a9a9a9', 'darkkhaki': '#bdb76b',
+    'darkmagenta': '#8b008b', 'darkolivegreen': '#556b2f', 'darkorange': '#ff8c00',
+    'darkorchid': '#9932cc', 'darkred': '#8b0000', 'darksalmon': '#e9967a',
+    'darkseagreen': '#8fbc8f', 'darkslateblue': '#483d8b', 'darkslategray': '#2f4f4f',
+    'darkslategrey': '#2f4f4f', 'darkturquoise': '#00ced1', 'darkviolet': '#9400d3',
+    'deeppink': '#ff1493', 'deepskyblue': '#00bfff', 'dimgray': '#696969', 'dimgrey': '#696969',
+    'dodgerblue': '#1e90ff', 'firebrick': '#b22222', 'floralwhite': '#fffaf0',
+    'forestgreen': '#228b22', 'fuchsia': '#ff00ff', 'gainsboro': '#dcdcdc',
+    'ghostwhite': '#f8f8ff', 'gold': '#ffd700', 'goldenrod': '#daa520', 'gray': '#808080',
+    'green': '#008000', 'greenyellow': '#adff2f', 'grey': '#808080', 'honeydew': '#f0fff0',
+    'hotpink': '#ff69b4', 'indianred': '#cd5c5c', 'indigo': '#4b0082', 'ivory': '#fffff0',
+    'khaki': '#f0e68c', 'lavender': '#e6e6fa', 'lavenderblush': '#fff0f5', 'lawngreen': '#7cfc00',
+    'lemonchiffon': '#fffacd', 'lightblue': '#add8e6', 'lightcoral': '#f08080',
+    'lightcyan': '#e0ffff', 'lightgoldenrodyellow': '#fafad2', 'lightgray': '#d3d3d3',
+    'lightgreen': '#90ee90', 'lightgrey': '#d3d3d3', 'lightpink': '#ffb6c1',
+    'lightsalmon': '#ffa07a', 'lightseagreen': '#20b2aa', 'lightskyblue': '#87cefa',
+    'lightslategray': '#778899', 'lightslategrey': '#778899', 'lightsteelblue': '#b0c4de',
+    'lightyellow': '#ffffe0', 'lime': '#00ff00', 'limegreen': '#32cd32', 'linen': '#faf0e6',
+    'magenta': '#ff00ff', 'maroon': '#800000', 'mediumaquamarine': '#66cdaa',
+    'mediumblue': '#0000cd', 'mediumorchid': '#ba55d3', 'mediumpurple': '#9370db',
+    'mediumseagreen': '#3cb371', 'mediumslateblue': '#7b68ee', 'mediumspringgreen': '#00fa9a',
+    'mediumturquoise': '#48d1cc', 'mediumvioletred': '#c71585', 'midnightblue': '#191970',
+    'mintcream': '#f5fffa', 'mistyrose': '#ffe4e1', 'moccasin': '#ffe4b5',
+    'navajowhite': '#ffdead', 'navy': '#000080', 'oldlace': '#fdf5e6', 'olive': '#808000',
+    'olivedrab': '#6b8e23', 'orange': '#ffa500', 'orangered': '#ff4500', 'orchid': '#da70d6',
+    'palegoldenrod': '#eee8aa', 'palegreen': '#98fb98', 'paleturquoise': '#afeeee',
+    'palevioletred': '#db7093', 'papayawhip': '#ffefd5', 'peachpuff': '#ffdab9',
+    'peru': '#cd853f', 'pink': '#ffc0cb', 'plum': '#dda0dd', 'powderblue': '#b0e0e6',
+    'purple': '#800080', 'rebeccapurple': '#663399', 'red': '#ff0000', 'rosybrown': '#bc8f8f',
+    'royalblue': '#4169e1', 'saddlebrown': '#8b4513', 'salmon': '#fa8072',
+    'sandybrown': '#f4a460', 'seagreen': '#2e8b57', 'seashell': '#fff5ee', 'sienna': '#a0522d',
+    'silver': '#c0c0c0', 'skyblue': '#87ceeb', 'slateblue': '#6a5acd', 'slategray': '#708090',
+    'slategrey': '#708090', 'snow': '#fffafa', 'springgreen': '#00ff7f', 'steelblue': '#4682b4',
+    'tan': '#d2b48c', 'teal': '#008080', 'thistle': '#d8bfd8', 'tomato': '#ff6347',
+    'turquoise': '#40e0d0', 'violet': '#ee82ee', 'wheat': '#f5deb3', 'white': '#ffffff',
+    'whitesmoke': '#f5f5f5', 'yellow': '#ffff00', 'yellowgreen': '#9acd32',
+}
+
+# Colores rgb(r, g, b) y rgba(r, g, b, a) con componentes enteros o en porcentaje
+_PATRON_RGB = re.compile(
+    r"rgba?\(\s*(\d+(?:\.\d+)?%?)\s*,\s*(\d+(?:\.\d+)?%?)\s*,\s*(\d+(?:\.\d+)?%?)"
+    r"\s*(?:,\s*\d*\.?\d+%?\s*)?\)"
+)
+
+
+def _lista_palabras(
+    palabras: List[str], imagen_tamaño: int, altura_extra: int
+) -> Iterator[Tuple[int, int, str]]:
+    """
+    Calcula la posición de cada entrada de la lista de palabras.
+
+    Sigue la misma distribución en columnas que exportar_imagen.
+
+    Args:
+        palabras: Palabras a listar
+        imagen_tamaño: Lado de la cuadrícula en píxeles
+        altura_extra: Alto del área de la lista
+
+    Yields:
+        Tuplas (x, y, texto) con la esquina superior izquierda de cada entrada
+    """
+    palabra_x = Config.MARGEN_PALABRAS_X
+    palabra_y = imagen_tamaño + Config.MARGEN_PALABRAS_Y
+    for palabra in palabras:
+        yield palabra_x, palabra_y, f"{Config.ESPACIADO_CHECKBOX}   {palabra}"
+        palabra_y += Config.ESPACIADO_ENTRE_PALABRAS
+        # Si se sale del espacio, crear nueva columna
+        if palabra_y > imagen_tamaño + altura_extra - 20:
+            palabra_y = imagen_tamaño + Config.MARGEN_PALABRAS_Y
+            palabra_x += Config.ANCHO_COLUMNA_PALABRAS
+
+
+def escribir_svg(
+    archivo: TextIO,
+    cuadrícula: List[List[str]],
+    palabras: List[str],
+    mostrar_palabras: bool = True,
+    imagen_tamaño: int = Config.IMAGEN_TAMAÑO,
+    color_fondo: str = Config.COLOR_FONDO,
+    color_lineas: str = Config.COLOR_LINEAS,
+    color_texto: str = Config.COLOR_TEXTO
+) -> None:
+    """
+    Escribe una sopa de letras como documento SVG, fila por fila.
+
+    Args:
+        archivo: Archivo de texto abierto donde escribir
+        cuadrícula: Matriz de letras
+        palabras: Palabras de la lista a mostrar
+        mostrar_palabras: Si se debe mostrar la lista de palabras
+        imagen_tamaño: Lado de la cuadrícula en unidades de usuario (píxeles)
+        color_fondo: Color de fondo
+        color_lineas: Color de las líneas de la cuadrícula
+        color_texto: Color del texto
+    """
+    tamaño = len(cuadrícula)
+    celda = imagen_tamaño / tamaño
+    altura_extra = Config.IMAGEN_EXTRA_ALTURA if mostrar_palabras else 0
+    alto = imagen_tamaño + altura_extra
+    tamaño_fuente = celda * Config.PROPORCION_FUENTE_VECTORIAL
+
+    archivo.write(
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{imagen_tamaño}" height="{alto}" '
+        f'viewBox="0 0 {imagen_tamaño} {alto}">\n'
+    )
+    archivo.write(f'<rect width="100%" height="100%" fill="{escape(color_fondo)}"/>\n')
+
+    # Todas las líneas de la cuadrícula en un único trazo
+    trazos = []
+    for i in range(tamaño + 1):
+        pos = round(i * celda, 3)
+        trazos.append(f"M0 {pos}H{imagen_tamaño}M{pos} 0V{imagen_tamaño}")
+    archivo.write(
+        f'<path d="{"".join(trazos)}" stroke="{escape(color_lineas)}" '
+        f'stroke-width="1" fill="none"/>\n'
+    )
+
+    archivo.write(
+        f'<g font-family="Helvetica, Arial, sans-serif" font-size="{round(tamaño_fuente, 3)}" '
+        f'fill="{escape(color_texto)}" text-anchor="middle" dominant-baseline="central">\n'
+    )
+    for fila in range(tamaño):
+        y = round((fila + 0.5) * celda, 3)
+        archivo.write(''.join(
+            f'<text x="{round((col + 0.5) * celda, 3)}" y="{y}">{escape(letra)}</text>'
+            for col, letra in enumerate(cuadrícula[fila])
+        ))
+        archivo.write('\n')
+    archivo.write('</g>\n')
+
+    if mostrar_palabras:
+        archivo.write(
+            f'<g font-family="Helvetica, Arial, sans-serif" font-size="{Config.TAMAÑO_FUENTE_LISTA}" '
+            f'fill="{escape(color_texto)}" dominant-baseline="hanging">\n'
+        )
+        for x, y, texto in _lista_palabras(palabras, imagen_tamaño, altura_extra):
+            archivo.write(f'<text x="{x}" y="{y}" xml:space="preserve">{escape(texto)}</text>\n')
+        archivo.write('</g>\n')
+
+    archivo.write('</svg>\n')
+
+
+def _color_pdf(color: str) -> str:
+    """
+    Convierte un color CSS en componentes RGB de PDF (0 a 1).
+
+    Args:
+        color: Color en hexadecimal (#rgb, #rgba, #rrggbb o #rrggbbaa),
+            rgb()/rgba() o nombre CSS; la transparencia se ignora
+
+    Returns:
+        Componentes rojo, verde y azul separados por espacios
+
+    Raises:
+        ValueError: Si el color no se reconoce
+    """
+    texto = color.strip().lower()
+    texto = _COLORES_CSS.get(texto, texto)
+    componentes = None
+    coincidencia = _PATRON_RGB.fullmatch(texto)
+    if coincidencia:
+        componentes = [
+            int(float(c[:-1]) * 255 / 100 + 0.5) if c.endswith('%') else int(float(c))
+            for c in coincidencia.groups()
+        ]
+    elif re.fullmatch(r"#[0-9a-f]{3,4}|#[0-9a-f]{6}(?:[0-9a-f]{2})?", texto):
+        digitos = texto[1:]
+        if len(digitos) <= 4:
+            digitos = ''.join(d * 2 for d in digitos)
+        componentes = [int(digitos[i:i + 2], 16) for i in (0, 2, 4)]
+    if componentes is None or any(c > 255 for c in componentes):
+        raise ValueError(f"Color no reconocido: {color!r}")
+    return ' '.join(f"{c / 255:.3f}" for c in componentes)
+
+
+def _texto_pdf(texto: str) -> str:
+    """Codifica un texto como cadena literal de PDF en WinAnsiEncoding."""
+    crudo = texto.encode('cp1252', errors='replace').decode('latin-1')
+    crudo = crudo.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+    return f"({crudo})"
+
+
+def contenido_pagina_pdf(
+    cuadrícula: List[List[str]],
+    palabras: List[str],
+    mostrar_palabras: bool = True,
+    imagen_tamaño: int = Config.IMAGEN_TAMAÑO,
+    color_fondo: str = Config.COLOR_FONDO,
+    color_lineas: str = Config.COLOR_LINEAS,
+    color_texto: str = Config.COLOR_TEXTO,
+    resaltadas: Optional[Iterable[Tuple[int, int]]] = None,
+    titulo: Optional[str] = None
+) -> Tuple[bytes, int, int]:
+    """
+    Construye el flujo de contenido de una página PDF con la sopa de letras.
+
+    Las coordenadas usan un punto por píxel de exportar_imagen.
+
+    Args:
+        cuadrícula: Matriz de letras
+        palabras: Palabras de la lista a mostrar
+        mostrar_palabras: Si se debe mostrar la lista de palabras
+        imagen_tamaño: Lado de la cuadrícula en puntos
+        color_fondo: Color de fondo
+        color_lineas: Color de las líneas de la cuadrícula
+        color_texto: Color del texto
+        resaltadas: Celdas (fila, columna) a sombrear, p. ej. en soluciones
+        titulo: Texto de una banda superior opcional (p. ej. "Sopa 3")
+
+    Returns:
+        Tupla (contenido, ancho, alto) de la página
+    """
+    tamaño = len(cuadrícula)
+    celda = imagen_tamaño / tamaño
+    altura_extra = Config.IMAGEN_EXTRA_ALTURA if mostrar_palabras else 0
+    altura_titulo = Config.ALTURA_TITULO_PDF if titulo else 0
+    alto = imagen_tamaño + altura_extra + altura_titulo
+    tamaño_fuente = celda * Config.PROPORCION_FUENTE_VECTORIAL
+    ajuste_base = _ALTURA_MAYUSCULAS_HELVETICA * tamaño_fuente / 2000
+    # Borde superior de la cuadrícula (el eje y de PDF crece hacia arriba)
+    techo = alto - altura_titulo
+
+    partes = [f"{_color_pdf(color_fondo)} rg 0 0 {imagen_tamaño} {alto} re f"]
+
+    if resaltadas:
+        partes.append(f"{_color_pdf(Config.COLOR_RESALTADO)} rg")
+        for fila, col in resaltadas:
+            partes.append(
+                f"{col * celda:.2f} {techo - (fila + 1) * celda:.2f} {celda:.2f} {celda:.2f} re f"
+            )
+
+    # Líneas de la cuadrícula
+    partes.append(f"{_color_pdf(color_lineas)} RG 1 w")
+    for i in range(tamaño + 1):
+        pos = i * celda
+        partes.append(f"0 {techo - pos:.2f} m {imagen_tamaño} {techo - pos:.2f} l")
+        partes.append(f"{pos:.2f} {techo} m {pos:.2f} {techo - imagen_tamaño} l")
+    partes.append("S")
+
+    partes.append(f"BT {_color_pdf(color_texto)} rg")
+    if titulo:
+        partes.append(
+            f"/F1 {Config.TAMAÑO_FUENTE_TITULO} Tf 1 0 0 1 {Config.MARGEN_PALABRAS_X} "
+            f"{alto - altura_titulo + Config.MARGEN_PALABRAS_Y} Tm {_texto_pdf(titulo)} Tj"
+        )
+    partes.append(f"/F1 {tamaño_fuente:.2f} Tf")
+    for fila in range(tamaño):
+        y = techo - (fila + 0.5) * celda - ajuste_base
+        for col, letra in enumerate(cuadrícula[fila]):
+            ancho = _ANCHOS_HELVETICA.get(letra, _ANCHO_HELVETICA_POR_DEFECTO)
+            x = (col + 0.5) * celda - ancho * tamaño_fuente / 2000
+            partes.append(f"1 0 0 1 {x:.2f} {y:.2f} Tm {_texto_pdf(letra)} Tj")
+
+    if mostrar_palabras:
+        partes.append(f"/F1 {Config.TAMAÑO_FUENTE_LISTA} Tf")
+        for x, y, texto in _lista_palabras(palabras, imagen_tamaño, altura_extra):
+            base = techo - y - Config.TAMAÑO_FUENTE_LISTA
+            partes.append(f"1 0 0 1 {x} {base} Tm {_texto_pdf(texto)} Tj")
+    partes.append("ET")
+
+    return '\n'.join(partes).encode('latin-1'), imagen_tamaño, alto
+
+
+class EscritorPDF:
+    """
+    Escritor incremental de documentos PDF.
+
+    Cada página se escribe en el archivo en cuanto se agrega y solo se
+    conservan en memoria los desplazamientos de los objetos, por lo que el
+    consumo no crece con el número de páginas.
+    """
+
+    # Objetos reservados: catálogo, árbol de páginas y fuente
+    _CATALOGO = 1
+    _PAGINAS = 2
+    _FUENTE = 3
+
+    def __init__(self, archivo: BinaryIO):
+        """
+        Inicializa el documento y escribe la cabecera.
+
+        Args:
+            archivo: Archivo binario abierto donde escribir
+        """
+        self._archivo = archivo
+        self._desplazamientos = {}
+        self._siguiente_objeto = 4
+        self._paginas: List[int] = []
+        self._archivo.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        self._escribir_objeto(
+            self._FUENTE,
+            b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica "
+            b"/Encoding /WinAnsiEncoding >>"
+        )
+
+    def _escribir_objeto(self, numero: int, cuerpo: bytes) -> None:
+        self._desplazamientos[numero] = self._archivo.tell()
+        self._archivo.write(f"{numero} 0 obj\n".encode('ascii') + cuerpo + b"\nendobj\n")
+
+    def _nuevo_objeto(self) -> int:
+        numero = self._siguiente_objeto
+        self._siguiente_objeto += 1
+        return numero
+
+    def agregar_pagina(self, contenido: bytes, ancho: float, alto: float) -> int:
+        """
+        Escribe una página y su flujo de contenido.
+
+        Args:
+            contenido: Flujo de operadores PDF de la página
+            ancho: Ancho de la página en puntos
+            alto: Alto de la página en puntos
+
+        Returns:
+            Número de objeto de la página
+        """
+        numero_contenido = self._nuevo_objeto()
+        self._escribir_objeto(
+            numero_contenido,
+            f"<< /Length {len(contenido)} >>\nstream\n".encode('ascii') + contenido + b"\nendstream"
+        )
+        numero_pagina = self._nuevo_objeto()
+        self._escribir_objeto(
+            numero_pagina,
+            (
+                f"<< /Type /Page /Parent {self._PAGINAS} 0 R /MediaBox [0 0 {ancho} {alto}] "
+                f"/Resources << /Font << /F1 {self._FUENTE} 0 R >> >> "
+                f"/Contents {numero_contenido} 0 R >>"
+            ).encode('ascii')
+        )
+        self._paginas.append(numero_pagina)
+        return numero_pagina
+
+    def cerrar(self, orden: Optional[List[int]] = None) -> None:
+        """
+        Escribe el árbol de páginas, el catálogo y la tabla de referencias.
+
+        Args:
+            orden: Orden final de las páginas (números de objeto); por
+                defecto, el orden en que se agregaron
+        """
+        paginas = orden if orden is not None else self._paginas
+        hijos = ' '.join(f"{numero} 0 R" for numero in paginas)
+        self._escribir_objeto(
+            self._PAGINAS,
+            f"<< /Type /Pages /Kids [{hijos}] /Count {len(paginas)} >>".encode('ascii')
+        )
+        self._escribir_objeto(
+            self._CATALOGO,
+            f"<< /Type /Catalog /Pages {self._PAGINAS} 0 R >>".encode('ascii')
+        )
+
+        inicio_xref = self._archivo.tell()
+        total = self._siguiente_objeto
+        lineas = [f"xref\n0 {total}\n", "0000000000 65535 f \n"]
+        for numero in range(1, total):
+            lineas.append(f"{self._desplazamientos[numero]:010d} 00000 n \n")
+        lineas.append(
+            f"trailer\n<< /Size {total} /Root {self._CATALOGO} 0 R >>\n"
+            f"startxref\n{inicio_xref}\n%%EOF\n"
+        )
+        self._archivo.write(''.join(lineas).encode('ascii'))
+
+
+def exportar_cuadernillo(
+    generadores: Iterable,
+    nombre_archivo: str,
+    con_soluciones: bool = True,
+    imagen_tamaño: int = Config.IMAGEN_TAMAÑO,
+    color_fondo: str = Config.COLOR_FONDO,
+    color_lineas: str = Config.COLOR_LINEAS,
+    color_texto: str = Config.COLOR_TEXTO
+) -> int:
+    """
+    Escribe un cuadernillo PDF con una página por sopa y las soluciones al final.
+
+    Cada sopa se escribe y se vuelca a disco en cuanto se obtiene del
+    iterador, junto con su página de solución. Solo se conservan los números
+    de objeto de las páginas para ordenarlas al cerrar, de modo que la
+    memoria no crece con la cantidad de sopas. El PDF se escribe en un
+    archivo temporal junto al destino y solo lo reemplaza al terminar, así
+    un fallo a medias no deja un PDF truncado.
+
+    Args:
+        generadores: Iterador de WordSearchGenerator ya generados
+        nombre_archivo: Ruta donde guardar el PDF
+        con_soluciones: Si se agregan las páginas de soluciones
+        imagen_tamaño: Tamaño de la cuadrícula en puntos
+        color_fondo: Color de fondo
+        color_lineas: Color de las líneas de la cuadrícula
+        color_texto: Color del texto
+
+    Returns:
+        Número de sopas escritas
+    """
+    colores = (color_fondo, color_lineas, color_texto)
+    paginas_sopas = []
+    paginas_soluciones = []
+
+    # Temporal en la misma carpeta para que os.replace no cambie de disco
+    temporal = f"{nombre_archivo}.{os.getpid()}.tmp"
+    try:
+        with open(temporal, 'wb') as f:
+            escritor = EscritorPDF(f)
+            for numero, generador in enumerate(generadores, start=1):
+                cuadrícula = generador.cuadrícula
+                paginas_sopas.append(escritor.agregar_pagina(*contenido_pagina_pdf(
+                    cuadrícula, generador.palabras, True, imagen_tamaño, *colores,
+                    titulo=f"Sopa de letras {numero}"
+                )))
+                if con_soluciones:
+                    resaltadas = {
+                        posicion
+                        for info in generador.palabras_colocadas.values()
+                        for posicion in info['posiciones']
+                    }
+                    paginas_soluciones.append(escritor.agregar_pagina(*contenido_pagina_pdf(
+                        cuadrícula, generador.palabras, True, imagen_tamaño, *colores,
+                        resaltadas=sorted(resaltadas), titulo=f"Solución {numero}"
+                    )))
+                f.flush()
+            escritor.cerrar(orden=paginas_sopas + paginas_soluciones)
+        os.replace(temporal, nombre_archivo)
+    except BaseException:
+        try:
+            os.remove(temporal)
+        except OSError:
+            pass
+        raise
+
+    return len(paginas_sopas)
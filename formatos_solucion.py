@@ -0,0 +1,201 @@
+"""
+Formatos estructurados para las soluciones de las sopas de letras.
+
+Además del informe de texto de exportar_solucion, las soluciones pueden
+guardarse como JSON Lines (una sopa por línea, con todas las posiciones y
+el vector de dirección de cada palabra) o en un formato binario compacto.
+Ambos se serializan en memoria y se escriben con una sola escritura por
+sopa, y admiten añadir muchas sopas al mismo archivo.
+
+Formato binario (little endian):
+    Cabecera del archivo: b'SOPA' y un byte de versión.
+    Cada sopa: uint32 con los bytes que siguen, uint64 identificador,
+    uint16 tamaño de la cuadrícula y uint16 número de palabras.
+    Cada palabra: uint8 bytes UTF-8 de la palabra, uint16 fila inicial,
+    uint16 columna inicial, int8 delta de fila, int8 delta de columna,
+    uint8 invertida (0/1) y la palabra en UTF-8. Las posiciones se
+    reconstruyen desde el inicio, la dirección y la longitud.
+"""
+
+import json
+import os
+import struct
+from typing import BinaryIO, Iterator, List, Optional
+
+FIRMA_BINARIA = b'SOPA'
+VERSION_BINARIA = 1
+
+_REGISTRO = struct.Struct('<IQHH')
+_PALABRA = struct.Struct('<BHHbbB')
+
+FORMATOS_SOLUCION = {
+    'texto': '.txt',
+    'jsonl': '.jsonl',
+    'binario': '.bin',
+}
+
+
+def formato_por_extension(nombre_archivo: str) -> str:
+    """
+    Deduce el formato de solución a partir de la extensión del archivo.
+
+    Args:
+        nombre_archivo: Ruta del archivo
+
+    Returns:
+        'texto', 'jsonl' o 'binario' (texto si la extensión no se reconoce)
+    """
+    extension = os.path.splitext(nombre_archivo)[1].lower()
+    for formato, extension_formato in FORMATOS_SOLUCION.items():
+        if extension == extension_formato:
+            return formato
+    return 'texto'
+
+
+def registro_jsonl(generador, identificador=None) -> bytes:
+    """
+    Serializa la solución de una sopa como una línea JSON.
+
+    Args:
+        generador: WordSearchGenerator ya generado
+        identificador: Identificador de la sopa (por defecto, su semilla)
+
+    Returns:
+        Línea JSON terminada en salto de línea, codificada en UTF-8
+    """
+    palabras = []
+    for palabra, info in generador.palabras_colocadas.items():
+        palabras.append({
+            'palabra': palabra,
+            'inicio': list(info.inicio),
+            'fin': list(info.fin),
+            'direccion': [info.delta_fila, info.delta_col],
+            'posiciones': [list(posicion) for posicion in info.posiciones],
+            'orientacion': info.orientacion,
+            'inversa': info['inversa'],
+        })
+    registro = {
+        'id': generador.semilla if identificador is None else identificador,
+        'tamaño': generador.tamaño,
+        'palabras': palabras,
+    }
+    return (json.dumps(registro, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+
+
+def registro_binario(generador, identificador: Optional[int] = None) -> bytes:
+    """
+    Serializa la solución de una sopa en el formato binario compacto.
+
+    Args:
+        generador: WordSearchGenerator ya generado
+        identificador: Entero de hasta 64 bits (por defecto, la semilla o 0)
+
+    Returns:
+        Registro binario de la sopa (sin la cabecera del archivo)
+    """
+    if identificador is None:
+        identificador = generador.semilla or 0
+    partes = []
+    for palabra, info in generador.palabras_colocadas.items():
+        texto = palabra.encode('utf-8')
+        partes.append(_PALABRA.pack(
+            len(texto), info.fila, info.col, info.delta_fila, info.delta_col, info.inversa
+        ))
+        partes.append(texto)
+    cuerpo = b''.join(partes)
+    cabecera = _REGISTRO.pack(
+        _REGISTRO.size - 4 + len(cuerpo),
+        identificador & 0xFFFFFFFFFFFFFFFF,
+        generador.tamaño,
+        len(generador.palabras_colocadas)
+    )
+    return cabecera + cuerpo
+
+
+def escribir_registros(nombre_archivo: str, registros: List[bytes], formato: str, anexar: bool = False) -> None:
+    """
+    Escribe varios registros ya serializados con una sola escritura.
+
+    Args:
+        nombre_archivo: Ruta del archivo
+        registros: Registros de registro_jsonl o registro_binario
+        formato: 'jsonl' o 'binario'
+        anexar: Si se añaden al final del archivo en lugar de reemplazarlo
+    """
+    with open(nombre_archivo, 'ab' if anexar else 'wb') as f:
+        datos = b''.join(registros)
+        if formato == 'binario' and f.tell() == 0:
+            datos = FIRMA_BINARIA + bytes([VERSION_BINARIA]) + datos
+        f.write(datos)
+
+
+def _leer_exacto(f: BinaryIO, cantidad: int) -> bytes:
+    datos = f.read(cantidad)
+    if len(datos) != cantidad:
+        raise ValueError("Archivo de soluciones binario truncado")
+    return datos
+
+
+def leer_soluciones_binarias(nombre_archivo: str) -> Iterator[dict]:
+    """
+    Lee un archivo de soluciones binario.
+
+    Args:
+        nombre_archivo: Ruta del archivo
+
+    Yields:
+        Diccionarios con 'id', 'tamaño' y 'palabras' (cada una con
+        'palabra', 'inicio', 'direccion', 'posiciones' e 'inversa')
+
+    Raises:
+        ValueError: Si el archivo no tiene el formato esperado
+    """
+    with open(nombre_archivo, 'rb') as f:
+        if f.read(len(FIRMA_BINARIA)) != FIRMA_BINARIA:
+            raise ValueError(f"'{nombre_archivo}' no es un archivo de soluciones binario")
+        version = _leer_exacto(f, 1)[0]
+        if version != VERSION_BINARIA:
+            raise ValueError(f"Versión de soluciones binarias no soportada: {version}")
+
+        while True:
+            inicio = f.read(_REGISTRO.size)
+            if not inicio:
+                return
+            if len(inicio) != _REGISTRO.size:
+                raise ValueError("Archivo de soluciones binario truncado")
+            longitud, identificador, tamaño, cantidad = _REGISTRO.unpack(inicio)
+            cuerpo = _leer_exacto(f, longitud - (_REGISTRO.size - 4))
+
+            palabras = []
+            desplazamiento = 0
+            for _ in range(cantidad):
+                largo, fila, col, delta_fila, delta_col, inversa = _PALABRA.unpack_from(cuerpo, desplazamiento)
+                desplazamiento += _PALABRA.size
+                palabra = cuerpo[desplazamiento:desplazamiento + largo].decode('utf-8')
+                desplazamiento += largo
+                palabras.append({
+                    'palabra': palabra,
+                    'inicio': [fila, col],
+                    'direccion': [delta_fila, delta_col],
+                    'posiciones': [
+                        [fila + i * delta_fila, col + i * delta_col] for i in range(len(palabra))
+                    ],
+                    'inversa': bool(inversa),
+                })
+            yield {'id': identificador, 'tamaño': tamaño, 'palabras': palabras}
+
+
+def leer_soluciones_jsonl(nombre_archivo: str) -> Iterator[dict]:
+    """
+    Lee un archivo de soluciones JSON Lines.
+
+    Args:
+        nombre_archivo: Ruta del archivo
+
+    Yields:
+        Un diccionario por sopa
+    """
+    with open(nombre_archivo, 'r', encoding='utf-8') as f:
+        for linea in f:
+            if linea.strip():
+                yield json.loads(linea)
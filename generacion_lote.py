@@ -0,0 +1,387 @@
+"""
+Generación de sopas de letras por lotes.
+Reparte la generación y el renderizado entre varios procesos, y elige la
+mejor de varias sopas candidatas generadas a la vez.
+"""
+
+import hashlib
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, Dict, List, Optional, Tuple
+
+from calidad import Metrica, puntuar
+from formatos_solucion import FORMATOS_SOLUCION, escribir_registros, registro_binario, registro_jsonl
+from word_search_generator import WordSearchGenerator
+
+SERIALIZADORES = {
+    'jsonl': registro_jsonl,
+    'binario': registro_binario,
+}
+
+
+def derivar_semilla(semilla: int, indice: int) -> int:
+    """
+    Deriva la semilla independiente de una sopa dentro de un lote.
+
+    La misma pareja (semilla, índice) produce siempre el mismo valor, de modo
+    que cualquier sopa de un lote puede regenerarse por separado.
+
+    Args:
+        semilla: Semilla base del lote
+        indice: Posición de la sopa en el lote
+
+    Returns:
+        Semilla de 64 bits para la sopa
+    """
+    resumen = hashlib.sha256(f"{semilla}:{indice}".encode('ascii')).digest()
+    return int.from_bytes(resumen[:8], 'big')
+
+
+def _procesar_bloque(tareas: List[dict]) -> List[dict]:
+    """
+    Genera y exporta un bloque de sopas de letras dentro de un proceso.
+
+    Args:
+        tareas: Lista de tareas; cada una contiene el índice, los archivos
+            de salida y los parámetros del generador
+
+    Returns:
+        Lista de resultados con el índice, el archivo y el error (si lo hubo);
+        con formatos de solución estructurados, también el registro
+        serializado en 'solucion' para que el proceso principal lo anexe
+    """
+    resultados = []
+    for tarea in tareas:
+        resultado = {
+            'indice': tarea['indice'],
+            'archivo': tarea['archivo'],
+            'semilla': tarea['opciones'].get('semilla'),
+            'error': None,
+            'solucion': None,
+        }
+        try:
+            generador = WordSearchGenerator(**tarea['opciones'])
+            generador.generar()
+            generador.exportar(tarea['archivo'])
+            if tarea['formato_solucion'] in SERIALIZADORES:
+                serializar = SERIALIZADORES[tarea['formato_solucion']]
+                resultado['solucion'] = serializar(generador, tarea['indice'])
+            elif tarea['archivo_solucion']:
+                generador.exportar_solucion(tarea['archivo_solucion'])
+        except (OSError, ValueError) as e:
+            # Un fallo al generar o al escribir solo afecta a esta sopa
+            resultado['error'] = str(e)
+        resultados.append(resultado)
+    return resultados
+
+
+def generar_lote(
+    palabras: List[str],
+    cantidad: int,
+    directorio: str = '.',
+    prefijo: str = 'sopa_de_letras',
+    workers: Optional[int] = None,
+    semilla: Optional[int] = None,
+    tamaño_bloque: Optional[int] = None,
+    formato: str = 'png',
+    exportar_solucion: bool = True,
+    formato_solucion: str = 'texto',
+    al_completar: Optional[Callable[[dict], None]] = None,
+    **opciones
+) -> Dict:
+    """
+    Genera muchas sopas de letras en paralelo usando un pool de procesos.
+
+    Las tareas se envían en bloques y se mantiene una ventana acotada de
+    bloques en vuelo, de modo que la memoria no crece con `cantidad`. Cada
+    proceso escribe sus archivos en cuanto termina cada sopa.
+
+    Args:
+        palabras: Lista de palabras de cada sopa
+        cantidad: Número de sopas a generar
+        directorio: Carpeta donde guardar las imágenes y soluciones
+        prefijo: Prefijo de los nombres de archivo
+        workers: Número de procesos (por defecto, uno por núcleo)
+        semilla: Semilla base; cada sopa recibe una semilla derivada con
+            derivar_semilla(semilla, índice), sin importar qué proceso la genere
+        tamaño_bloque: Sopas por tarea enviada al pool (por defecto automático)
+        formato: Formato de salida: 'png', 'svg' o 'pdf'
+        exportar_solucion: Si se exportan las soluciones
+        formato_solucion: 'texto' escribe un archivo por sopa; 'jsonl' y
+            'binario' reúnen todas las soluciones en un único archivo
+            <prefijo>_soluciones.<ext>, identificadas por su índice
+        al_completar: Función llamada con el resultado de cada sopa terminada
+        **opciones: Parámetros adicionales para WordSearchGenerator
+            (tamaño, orientaciones, alfabeto, permitir_inversa, estrategia...)
+
+    Returns:
+        Diccionario con totales, errores, segundos, sopas por segundo y el
+        archivo de soluciones conjunto (None si no se generó)
+
+    Raises:
+        ValueError: Si el formato de solución no es válido
+    """
+    if formato_solucion not in FORMATOS_SOLUCION:
+        raise ValueError(
+            f"Formato de solución '{formato_solucion}' no válido. "
+            f"Opciones: {', '.join(FORMATOS_SOLUCION)}"
+        )
+    workers = workers or os.cpu_count() or 1
+    if tamaño_bloque is None:
+        tamaño_bloque = max(1, min(32, cantidad // (workers * 4)))
+    os.makedirs(directorio, exist_ok=True)
+
+    ancho = len(str(max(cantidad - 1, 0)))
+    por_sopa = exportar_solucion and formato_solucion == 'texto'
+    archivo_soluciones = None
+    if exportar_solucion and not por_sopa:
+        archivo_soluciones = os.path.join(
+            directorio, f"{prefijo}_soluciones{FORMATOS_SOLUCION[formato_solucion]}"
+        )
+        # Empezar vacío: cada bloque terminado se añade al final
+        escribir_registros(archivo_soluciones, [], formato_solucion)
+
+    def crear_tarea(indice: int) -> dict:
+        base = os.path.join(directorio, f"{prefijo}_{indice:0{ancho}d}")
+        return {
+            'indice': indice,
+            'archivo': f"{base}.{formato}",
+            'archivo_solucion': f"{base}_solucion.txt" if por_sopa else None,
+            'formato_solucion': formato_solucion if archivo_soluciones else None,
+            'opciones': dict(
+                opciones,
+                palabras=palabras,
+                semilla=derivar_semilla(semilla, indice) if semilla is not None else None
+            ),
+        }
+
+    inicio = time.perf_counter()
+    exitosos = 0
+    errores = []
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pendientes = set()
+        siguiente = 0
+        while siguiente < cantidad or pendientes:
+            # Mantener una ventana acotada de bloques en vuelo
+            while siguiente < cantidad and len(pendientes) < workers * 2:
+                fin = min(siguiente + tamaño_bloque, cantidad)
+                tareas = [crear_tarea(i) for i in range(siguiente, fin)]
+                pendientes.add(executor.submit(_procesar_bloque, tareas))
+                siguiente = fin
+
+            terminados, pendientes = wait(pendientes, return_when=FIRST_COMPLETED)
+            for futuro in terminados:
+                resultados = futuro.result()
+                if archivo_soluciones:
+                    # Una sola escritura por bloque terminado
+                    escribir_registros(
+                        archivo_soluciones,
+                        [r['solucion'] for r in resultados if r['solucion'] is not None],
+                        formato_solucion,
+                        anexar=True
+                    )
+                for resultado in resultados:
+                    del resultado['solucion']
+                    if resultado['error'] is None:
+                        exitosos += 1
+                    else:
+                        errores.append(resultado)
+                    if al_completar:
+                        al_completar(resultado)
+
+    segundos = time.perf_counter() - inicio
+    return {
+        'total': cantidad,
+        'exitosos': exitosos,
+        'fallidos': len(errores),
+        'errores': errores,
+        'workers': workers,
+        'segundos': segundos,
+        'sopas_por_segundo': cantidad / segundos if segundos > 0 else 0.0,
+        'archivo_soluciones': archivo_soluciones,
+    }
+
+
+def _evaluar_candidato(indice: int, opciones: dict, metricas: Optional[Dict[str, Metrica]]) -> dict:
+    """
+    Genera y puntúa una sopa candidata dentro de un proceso.
+
+    Args:
+        indice: Posición de la candidata
+        opciones: Parámetros de WordSearchGenerator
+        metricas: Métricas de calidad (None usa las de calidad.METRICAS)
+
+    Returns:
+        Resultado con el índice, la semilla, la puntuación total y por
+        métrica, y la sopa (cuadrícula y solución) para restaurarla; si no se
+        pudo generar, 'error' con el motivo
+    """
+    resultado = {'indice': indice, 'semilla': opciones.get('semilla'), 'error': None}
+    try:
+        generador = WordSearchGenerator(**opciones)
+        generador.generar()
+    except ValueError as e:
+        resultado['error'] = str(e)
+        return resultado
+    resultado['puntuacion'], resultado['metricas'] = puntuar(generador, metricas)
+    resultado['cuadricula'] = generador.cuadrícula
+    resultado['solucion'] = generador.obtener_solucion()
+    return resultado
+
+
+def _elegir(resultados: Dict[int, dict], candidatos: int, umbral: Optional[float]) -> Optional[dict]:
+    """
+    Decide si ya hay ganadora entre las candidatas terminadas.
+
+    Con umbral gana la primera candidata, por índice, que lo alcanza, en
+    cuanto todas las anteriores han terminado; así el resultado es el mismo
+    que generándolas una tras otra, sin importar cuál acabe antes. Sin
+    umbral, o si ninguna lo alcanza, gana la de mejor puntuación (la de
+    menor índice en caso de empate) cuando han terminado todas.
+
+    Returns:
+        Resultado ganador, o None si hay que esperar más candidatas
+    """
+    if umbral is not None:
+        for indice in range(candidatos):
+            resultado = resultados.get(indice)
+            if resultado is None:
+                return None
+            if resultado['error'] is None and resultado['puntuacion'] >= umbral:
+                return resultado
+    if len(resultados) < candidatos:
+        return None
+    validos = [r for r in resultados.values() if r['error'] is None]
+    if not validos:
+        return None
+    return max(validos, key=lambda r: (r['puntuacion'], -r['indice']))
+
+
+def _detener_pool(executor: ProcessPoolExecutor) -> None:
+    """
+    Cierra un pool sin esperar a las tareas que aún corren.
+
+    Cancela las tareas que no empezaron y termina los procesos que siguen
+    trabajando; sin esto, la salida del intérprete esperaría a que acabaran.
+
+    Args:
+        executor: Pool de procesos a cerrar
+    """
+    # ProcessPoolExecutor no expone sus procesos antes de Python 3.14
+    procesos = list((executor._processes or {}).values())
+    executor.shutdown(wait=False, cancel_futures=True)
+    for proceso in procesos:
+        if proceso.is_alive():
+            proceso.terminate()
+    for proceso in procesos:
+        proceso.join()
+
+
+def generar_mejor(
+    palabras: List[str],
+    candidatos: int = 8,
+    umbral: Optional[float] = None,
+    metricas: Optional[Dict[str, Metrica]] = None,
+    workers: Optional[int] = None,
+    semilla: Optional[int] = None,
+    **opciones
+) -> Tuple[WordSearchGenerator, Dict]:
+    """
+    Genera varias sopas candidatas en paralelo y devuelve la mejor.
+
+    Cada candidata usa la semilla derivar_semilla(semilla, índice) y se
+    puntúa con las métricas de calidad en el propio proceso. Se mantienen
+    como mucho `workers` candidatas en vuelo: en cuanto una alcanza el
+    umbral no se envían más y se detienen los procesos que siguen
+    generando, así la parada temprana ahorra tiempo real.
+
+    Args:
+        palabras: Lista de palabras de la sopa
+        candidatos: Máximo de sopas candidatas a generar (K)
+        umbral: Puntuación entre 0 y 1 que basta para aceptar una sopa; sin
+            umbral se generan las K y se elige la mejor
+        metricas: Diccionario nombre -> métrica (por defecto, calidad.METRICAS);
+            con varios procesos deben poder serializarse con pickle
+        workers: Número de procesos (por defecto, uno por núcleo); con 1 las
+            candidatas se generan en este proceso, una tras otra
+        semilla: Semilla base; con la misma semilla se elige siempre la misma sopa
+        **opciones: Parámetros adicionales para WordSearchGenerator
+
+    Returns:
+        Tupla (generador con la sopa elegida, resumen con su índice, semilla,
+        puntuación y métricas, si alcanzó el umbral, candidatas evaluadas,
+        fallidas, detenidas a medias y sin generar, procesos y segundos)
+
+    Raises:
+        ValueError: Si el número de candidatas no es válido o ninguna
+            candidata pudo generarse
+    """
+    if candidatos < 1:
+        raise ValueError("El número de candidatas debe ser al menos 1")
+    workers = min(workers or os.cpu_count() or 1, candidatos)
+
+    def opciones_candidata(indice: int) -> dict:
+        return dict(
+            opciones,
+            palabras=palabras,
+            semilla=derivar_semilla(semilla, indice) if semilla is not None else None
+        )
+
+    inicio = time.perf_counter()
+    resultados: Dict[int, dict] = {}
+    ganador = None
+    detenidas = 0
+
+    if workers == 1:
+        for indice in range(candidatos):
+            resultados[indice] = _evaluar_candidato(indice, opciones_candidata(indice), metricas)
+            ganador = _elegir(resultados, candidatos, umbral)
+            if ganador is not None:
+                break
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        pendientes = set()
+        try:
+            siguiente = 0
+            while ganador is None and (siguiente < candidatos or pendientes):
+                while siguiente < candidatos and len(pendientes) < workers:
+                    pendientes.add(executor.submit(
+                        _evaluar_candidato, siguiente, opciones_candidata(siguiente), metricas
+                    ))
+                    siguiente += 1
+
+                terminados, pendientes = wait(pendientes, return_when=FIRST_COMPLETED)
+                for futuro in terminados:
+                    resultado = futuro.result()
+                    resultados[resultado['indice']] = resultado
+                ganador = _elegir(resultados, candidatos, umbral)
+        finally:
+            detenidas = len(pendientes)
+            if pendientes:
+                _detener_pool(executor)
+            else:
+                executor.shutdown()
+
+    fallidas = [r for r in resultados.values() if r['error'] is not None]
+    if ganador is None:
+        motivo = fallidas[0]['error'] if fallidas else "sin candidatas"
+        raise ValueError(f"Ninguna de las {candidatos} sopas candidatas pudo generarse: {motivo}")
+
+    generador = WordSearchGenerator(**opciones_candidata(ganador['indice']))
+    generador.restaurar(ganador['cuadricula'], ganador['solucion'])
+    resumen = {
+        'indice': ganador['indice'],
+        'semilla': ganador['semilla'],
+        'puntuacion': ganador['puntuacion'],
+        'metricas': ganador['metricas'],
+        'cumple_umbral': umbral is not None and ganador['puntuacion'] >= umbral,
+        'evaluadas': len(resultados),
+        'fallidas': len(fallidas),
+        'detenidas': detenidas,
+        'sin_generar': candidatos - len(resultados) - detenidas,
+        'workers': workers,
+        'segundos': time.perf_counter() - inicio,
+    }
+    return generador, resumen
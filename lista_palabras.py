@@ -0,0 +1,289 @@
+"""
+Carga de listas de palabras externas.
+
+Lee diccionarios de texto, CSV o JSON Lines línea a línea (sin cargar el
+archivo completo en memoria), normaliza mayúsculas y acentos según el
+alfabeto, descarta repetidos y construye índices por longitud y por
+conjunto de letras. Con el índice construido, elegir las palabras de cada
+sopa no vuelve a recorrer el archivo.
+"""
+
+import bisect
+import csv
+import json
+import os
+import random
+import unicodedata
+from array import array
+from typing import Dict, Iterator, List, Optional
+
+from config import Config
+
+FORMATOS_LISTA = {
+    '.txt': 'texto',
+    '.csv': 'csv',
+    '.jsonl': 'jsonl',
+}
+
+# Separadores que se eliminan de las entradas compuestas ("PAPA-NOEL")
+_SEPARADORES = str.maketrans('', '', " -'’")
+
+
+def normalizar_palabra(palabra: str, alfabeto: str) -> Optional[str]:
+    """
+    Convierte una palabra a las letras de un alfabeto.
+
+    Pasa a mayúsculas y quita los acentos que el alfabeto no tenga: con
+    ALFABETO_ES 'niño' queda 'NIÑO', con ALFABETO_EN queda 'NINO'.
+
+    Args:
+        palabra: Palabra tal como aparece en la fuente
+        alfabeto: Letras permitidas
+
+    Returns:
+        Palabra normalizada, o None si contiene caracteres sin equivalente
+    """
+    letras = []
+    for letra in palabra.strip().upper().translate(_SEPARADORES):
+        if letra not in alfabeto:
+            letra = unicodedata.normalize('NFD', letra)[0]
+            if letra not in alfabeto:
+                return None
+        letras.append(letra)
+    return ''.join(letras) or None
+
+
+def leer_palabras(
+    nombre_archivo: str,
+    formato: Optional[str] = None,
+    columna=0,
+    campo: str = 'palabra'
+) -> Iterator[str]:
+    """
+    Recorre las palabras de un archivo sin cargarlo completo.
+
+    Args:
+        nombre_archivo: Ruta del archivo
+        formato: 'texto' (una palabra por línea), 'csv' o 'jsonl'; por
+            defecto, según la extensión
+        columna: Columna del CSV (índice o nombre de la cabecera)
+        campo: Campo de cada objeto JSON (las líneas pueden ser también
+            textos JSON sueltos)
+
+    Yields:
+        Palabras sin normalizar
+
+    Raises:
+        ValueError: Si el formato no es válido
+    """
+    formato = formato or FORMATOS_LISTA.get(os.path.splitext(nombre_archivo)[1].lower(), 'texto')
+    if formato not in FORMATOS_LISTA.values():
+        raise ValueError(
+            f"Formato de lista '{formato}' no válido. "
+            f"Opciones: {', '.join(FORMATOS_LISTA.values())}"
+        )
+
+    with open(nombre_archivo, 'r', encoding='utf-8', newline='') as f:
+        if formato == 'texto':
+            for linea in f:
+                linea = linea.strip()
+                if linea and not linea.startswith('#'):
+                    yield linea
+        elif formato == 'csv':
+            lector = csv.reader(f)
+            indice = columna
+            if isinstance(columna, str):
+                cabecera = next(lector, [])
+                indice = cabecera.index(columna)
+            for fila in lector:
+                if len(fila) > indice and fila[indice].strip():
+                    yield fila[indice]
+        else:
+            for linea in f:
+                if not linea.strip():
+                    continue
+                valor = json.loads(linea)
+                if isinstance(valor, dict):
+                    valor = valor.get(campo)
+                if isinstance(valor, str) and valor.strip():
+                    yield valor
+
+
+class IndicePalabras:
+    """
+    Índice en memoria de una lista de palabras normalizadas.
+
+    Guarda cada palabra una sola vez, los índices de las palabras de cada
+    longitud y una máscara de bits con las letras que usa cada una, para
+    filtrar por letras permitidas sin recorrer los textos.
+
+    Attributes:
+        alfabeto: Alfabeto usado al normalizar
+        palabras: Palabras sin repetir, en el orden en que aparecieron
+        por_largo: Longitud -> índices de las palabras de esa longitud
+        mascaras: Máscara de letras de cada palabra (bit i = alfabeto[i])
+        descartadas: Entradas descartadas por repetidas, cortas o con
+            caracteres fuera del alfabeto
+    """
+
+    def __init__(self, alfabeto: str = Config.ALFABETO_EN):
+        """
+        Crea un índice vacío.
+
+        Args:
+            alfabeto: Alfabeto al que se normalizan las palabras
+        """
+        self.alfabeto = alfabeto
+        self.palabras: List[str] = []
+        self.por_largo: Dict[int, array] = {}
+        self.mascaras = array('Q')
+        self.descartadas = 0
+        self._bits = {letra: 1 << i for i, letra in enumerate(alfabeto)}
+        self._vistas = set()
+        self._filtradas: Dict[tuple, array] = {}
+
+    @classmethod
+    def desde_archivo(
+        cls,
+        nombre_archivo: str,
+        alfabeto: str = Config.ALFABETO_EN,
+        formato: Optional[str] = None,
+        min_largo: int = 3,
+        max_largo: Optional[int] = None,
+        **opciones
+    ) -> 'IndicePalabras':
+        """
+        Construye el índice leyendo el archivo una sola vez.
+
+        Args:
+            nombre_archivo: Ruta del archivo
+            alfabeto: Alfabeto al que normalizar
+            formato: 'texto', 'csv' o 'jsonl' (por defecto, según la extensión)
+            min_largo: Longitud mínima de las palabras
+            max_largo: Longitud máxima de las palabras (None sin límite)
+            **opciones: Opciones de leer_palabras (columna, campo)
+
+        Returns:
+            Índice con las palabras válidas
+        """
+        indice = cls(alfabeto)
+        for palabra in leer_palabras(nombre_archivo, formato, **opciones):
+            indice.agregar(palabra, min_largo, max_largo)
+        return indice
+
+    def agregar(self, palabra: str, min_largo: int = 1, max_largo: Optional[int] = None) -> bool:
+        """
+        Normaliza una palabra y la añade si es nueva y válida.
+
+        Returns:
+            True si se añadió
+        """
+        normalizada = normalizar_palabra(palabra, self.alfabeto)
+        if (normalizada is None or normalizada in self._vistas
+                or len(normalizada) < min_largo
+                or (max_largo is not None and len(normalizada) > max_largo)):
+            self.descartadas += 1
+            return False
+
+        self._vistas.add(normalizada)
+        mascara = 0
+        for letra in normalizada:
+            mascara |= self._bits[letra]
+        self.por_largo.setdefault(len(normalizada), array('I')).append(len(self.palabras))
+        self.palabras.append(normalizada)
+        self.mascaras.append(mascara)
+        self._filtradas.clear()
+        return True
+
+    def __len__(self) -> int:
+        return len(self.palabras)
+
+    def mascara_letras(self, letras: str) -> int:
+        """Máscara de bits de un conjunto de letras del alfabeto."""
+        mascara = 0
+        for letra in letras:
+            mascara |= self._bits.get(letra, 0)
+        return mascara
+
+    def filtrar_por_letras(self, letras: str, tamaño: int) -> array:
+        """
+        Índices de las palabras que solo usan ciertas letras y caben en la cuadrícula.
+
+        El resultado se guarda, así los muestreos siguientes con las mismas
+        letras y tamaño no vuelven a recorrer las máscaras.
+
+        Args:
+            letras: Letras permitidas
+            tamaño: Longitud máxima de las palabras
+
+        Returns:
+            Índices de palabras en self.palabras
+        """
+        prohibidas = ((1 << len(self.alfabeto)) - 1) & ~self.mascara_letras(letras)
+        clave = (prohibidas, tamaño)
+        if clave not in self._filtradas:
+            mascaras = self.mascaras
+            self._filtradas[clave] = array('I', (
+                indice
+                for largo in sorted(self.por_largo) if largo <= tamaño
+                for indice in self.por_largo[largo]
+                if not mascaras[indice] & prohibidas
+            ))
+        return self._filtradas[clave]
+
+    def muestrear(
+        self,
+        cantidad: int,
+        tamaño: int,
+        rng: Optional[random.Random] = None,
+        letras: Optional[str] = None,
+        densidad: float = Config.DENSIDAD_MAXIMA_MUESTREO
+    ) -> List[str]:
+        """
+        Elige palabras distintas al azar que quepan en una cuadrícula.
+
+        Solo considera las listas de longitud menor o igual al tamaño y
+        evita superar `densidad` * tamaño² letras en total, de modo que la
+        colocación tenga margen.
+
+        Args:
+            cantidad: Número de palabras deseado
+            tamaño: Tamaño de la cuadrícula (NxN)
+            rng: Generador aleatorio (por defecto, uno nuevo)
+            letras: Si se indica, solo palabras formadas con estas letras
+            densidad: Fracción máxima de celdas ocupadas por las palabras
+
+        Returns:
+            Hasta `cantidad` palabras (menos si no hay suficientes)
+        """
+        rng = rng or random.Random()
+        if letras is None:
+            grupos = [self.por_largo[largo] for largo in sorted(self.por_largo) if largo <= tamaño]
+        else:
+            grupos = [self.filtrar_por_letras(letras, tamaño)]
+        acumulado = []
+        total = 0
+        for grupo in grupos:
+            total += len(grupo)
+            acumulado.append(total)
+
+        presupuesto = int(densidad * tamaño * tamaño)
+        elegidas = []
+        vistos = set()
+        intentos = 0
+        # Muestreo por rechazo: cada intento cuesta O(log grupos), nunca un recorrido completo
+        while len(elegidas) < cantidad and len(vistos) < total and intentos < 20 * (cantidad + 10):
+            intentos += 1
+            posicion = rng.randrange(total)
+            if posicion in vistos:
+                continue
+            vistos.add(posicion)
+            grupo = bisect.bisect_right(acumulado, posicion)
+            inicio = acumulado[grupo - 1] if grupo else 0
+            indice = grupos[grupo][posicion - inicio]
+            palabra = self.palabras[indice]
+            if len(palabra) > presupuesto:
+                continue
+            presupuesto -= len(palabra)
+            elegidas.append(palabra)
+        return elegidas
@@ -5,9 +5,17 @@ Proporciona una interfaz de línea de comandos para crear sopas personalizadas.
 """
 
 import argparse
+import os
+import random
 import sys
+from functools import partial
 from word_search_generator import WordSearchGenerator
+from calidad import METRICAS, invertidas
+from exportadores_vectoriales import exportar_cuadernillo
+from solucionador import leer_cuadricula, resolver_cuadricula
+from tableros import TABLEROS
 from config import Config
+from formatos_solucion import FORMATOS_SOLUCION
 
 
 # Temas predefinidos de palabras
@@ -159,6 +167,141 @@ def crear_sopa_interactiva():
         sys.exit(1)
 
 
+def generar_en_lote(args, palabras, orientaciones, alfabeto, permitir_inversa, formato):
+    """Genera varias sopas de letras en paralelo y muestra el rendimiento."""
+    from generacion_lote import generar_lote
+
+    directorio = os.path.dirname(args.output) or '.'
+    prefijo = os.path.splitext(os.path.basename(args.output))[0]
+
+    print(f"⏳ Generando {args.cantidad} sopas de letras con {len(palabras)} palabras...")
+    resumen = generar_lote(
+        palabras,
+        args.cantidad,
+        directorio=directorio,
+        prefijo=prefijo,
+        workers=args.workers,
+        semilla=args.seed,
+        formato=formato,
+        exportar_solucion=not args.sin_solucion,
+        formato_solucion=args.formato_solucion,
+        tamaño=args.size,
+        orientaciones=orientaciones,
+        alfabeto=alfabeto,
+        permitir_inversa=permitir_inversa,
+        estrategia=args.estrategia,
+        backend=args.backend,
+        relleno=args.relleno,
+        maximizar_solapamiento=args.solapamiento
+    )
+
+    print(f"\n✅ Lote completado en {resumen['segundos']:.2f} s "
+          f"con {resumen['workers']} procesos")
+    print(f"   Sopas generadas: {resumen['exitosos']}/{resumen['total']}")
+    print(f"   Rendimiento: {resumen['sopas_por_segundo']:.1f} sopas/s")
+    print(f"   Carpeta: {directorio}")
+    if resumen['archivo_soluciones']:
+        print(f"   Soluciones: {resumen['archivo_soluciones']}")
+    for error in resumen['errores'][:5]:
+        print(f"   ❌ {error['archivo']}: {error['error']}")
+    if resumen['fallidos']:
+        sys.exit(1)
+
+
+def generar_cuadernillo(args, palabras, orientaciones, alfabeto, permitir_inversa):
+    """Genera un cuadernillo PDF con varias sopas y sus soluciones."""
+    from generacion_lote import derivar_semilla
+
+    def sopas():
+        for indice in range(args.cantidad):
+            generador = WordSearchGenerator(
+                palabras=palabras,
+                tamaño=args.size,
+                orientaciones=orientaciones,
+                alfabeto=alfabeto,
+                permitir_inversa=permitir_inversa,
+                estrategia=args.estrategia,
+                backend=args.backend,
+                relleno=args.relleno,
+                maximizar_solapamiento=args.solapamiento,
+                semilla=derivar_semilla(args.seed, indice) if args.seed is not None else None
+            )
+            generador.generar()
+            yield generador
+
+    print(f"⏳ Generando cuadernillo con {args.cantidad} sopas de letras...")
+    try:
+        total = exportar_cuadernillo(sopas(), args.output, con_soluciones=not args.sin_solucion)
+    except (OSError, ValueError) as e:
+        print(f"\n❌ Error: {e}")
+        sys.exit(1)
+    print(f"\n✅ Cuadernillo generado: {args.output} ({total} sopas)")
+
+
+def tamaño_cuadricula(valor):
+    """Tipo de argparse para --size: un entero positivo o 'auto'."""
+    if valor == 'auto':
+        return valor
+    try:
+        tamaño = int(valor)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"'{valor}' no es un número ni 'auto'")
+    if tamaño < 1:
+        raise argparse.ArgumentTypeError("El tamaño debe ser positivo")
+    return tamaño
+
+
+def metricas_elegidas(args):
+    """Métricas de calidad de --metricas, con el objetivo de --invertidas si se dio."""
+    metricas = {nombre: METRICAS[nombre] for nombre in args.metricas}
+    if args.invertidas is not None and 'invertidas' in metricas:
+        metricas['invertidas'] = partial(invertidas, objetivo=args.invertidas)
+    return metricas
+
+
+def muestrear_archivo(args, alfabeto):
+    """Elige al azar palabras de un diccionario externo que quepan en la cuadrícula."""
+    from lista_palabras import IndicePalabras
+
+    # Con --size auto se eligen palabras para el tamaño por defecto
+    tamaño = 15 if args.size == 'auto' else args.size
+    try:
+        indice = IndicePalabras.desde_archivo(args.archivo_palabras, alfabeto, max_largo=tamaño)
+    except (OSError, ValueError) as e:
+        print(f"\n❌ Error: {e}")
+        sys.exit(1)
+
+    palabras = indice.muestrear(args.num_palabras, tamaño, random.Random(args.seed))
+    if not palabras:
+        print(f"\n❌ Error: '{args.archivo_palabras}' no tiene palabras válidas para "
+              f"una cuadrícula de {tamaño}x{tamaño}")
+        sys.exit(1)
+    print(f"📖 {len(indice)} palabras leídas de {args.archivo_palabras}; "
+          f"elegidas {len(palabras)}: {', '.join(palabras)}")
+    return palabras
+
+
+def resolver_archivo(nombre_archivo, palabras):
+    """Busca las palabras en una cuadrícula guardada en un archivo de texto."""
+    try:
+        cuadrícula = leer_cuadricula(nombre_archivo)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+    apariciones = resolver_cuadricula(cuadrícula, palabras)
+    encontradas = {aparicion['palabra'] for aparicion in apariciones}
+    print(f"🔍 {len(apariciones)} apariciones en la cuadrícula de "
+          f"{len(cuadrícula)}x{len(cuadrícula[0]) if cuadrícula else 0}")
+    for aparicion in apariciones:
+        inicio, fin = aparicion['posiciones'][0], aparicion['posiciones'][-1]
+        print(f"   • {aparicion['palabra']}: {aparicion['orientacion']}, "
+              f"fila {inicio[0]} columna {inicio[1]} → fila {fin[0]} columna {fin[1]}")
+    faltantes = [p for p in dict.fromkeys(p.upper() for p in palabras) if p not in encontradas]
+    if faltantes:
+        print(f"   ❌ No encontradas: {', '.join(faltantes)}")
+
+
 def main():
     """Función principal."""
     parser = argparse.ArgumentParser(
@@ -176,6 +319,51 @@ Ejemplos de uso:
   Generar sopa avanzada con palabras personalizadas:
     python main.py -p "PYTHON,CODIGO,PROGRAMA" -d avanzado -s 20
 
+  Cuadrícula muy densa con búsqueda con retroceso:
+    python main.py -t harry_potter -d avanzado -s 13 --estrategia backtracking
+
+  Rellenar sin que ninguna palabra aparezca dos veces por casualidad:
+    python main.py -t frutas -d avanzado --relleno sin_duplicados
+
+  Generar 1000 sopas en paralelo con 8 procesos:
+    python main.py -t animales --cantidad 1000 --workers 8 -o lote/animales.png
+
+  Regenerar exactamente la misma sopa:
+    python main.py -t lugares -d avanzado --seed 1234
+
+  Exportar en formato vectorial para imprenta:
+    python main.py -t derechos -s 18 -o derechos.pdf
+
+  Póster PNG de 500x500 con celdas de 20 px (renderizado por franjas):
+    python main.py -t animales -s 500 --tamaño-celda 20 -o poster.png
+
+  Servir de nuevo la misma sopa desde la caché en disco:
+    python main.py -t animales --seed 7 --cache .cache_sopas
+
+  Lote de 10000 sopas con todas las soluciones en un solo archivo JSONL:
+    python main.py -t frutas --cantidad 10000 --formato-solucion jsonl -o lote/frutas.png
+
+  Elegir 15 palabras al azar de un diccionario propio:
+    python main.py --archivo-palabras diccionario.txt --num-palabras 15 --alfabeto es
+
+  Solo texto, sin cargar Pillow (cuadrícula y solución JSON Lines):
+    python main.py -t frutas -o sopa.txt
+
+  Usar la cuadrícula más pequeña en la que caben las palabras:
+    python main.py -t harry_potter -d avanzado --size auto
+
+  Cruzar las palabras todo lo posible para que quepan en menos celdas:
+    python main.py -t harry_potter -d avanzado -s 12 --estrategia backtracking --solapamiento
+
+  Generar hasta 16 sopas en paralelo y quedarse con la primera de calidad 0.9:
+    python main.py -t animales -d avanzado --mejor-de 16 --calidad-minima 0.9 --seed 5
+
+  Cuadernillo PDF de 200 sopas con sus soluciones:
+    python main.py -t frutas --cantidad 200 --cuadernillo -o frutas.pdf
+
+  Buscar las palabras de un tema en una cuadrícula de texto:
+    python main.py -t animales --resolver cuadricula.txt
+
   Listar temas disponibles:
     python main.py --listar-temas
         """
@@ -208,9 +396,17 @@ Ejemplos de uso:
 
     parser.add_argument(
         '-s', '--size',
-        type=int,
+        type=tamaño_cuadricula,
         default=15,
-        help='Tamaño de la cuadrícula (default: 15)'
+        help="Tamaño de la cuadrícula, o 'auto' para buscar el menor posible (default: 15)"
+    )
+
+    parser.add_argument(
+        '--tiempo-auto',
+        type=float,
+        default=Config.PRESUPUESTO_TAMAÑO_AUTO,
+        metavar='SEG',
+        help=f'Segundos de búsqueda con --size auto (default: {Config.PRESUPUESTO_TAMAÑO_AUTO})'
     )
 
     parser.add_argument(
@@ -220,6 +416,40 @@ Ejemplos de uso:
         help='Nombre del archivo de salida (default: sopa_de_letras.png)'
     )
 
+    parser.add_argument(
+        '-f', '--formato',
+        choices=Config.FORMATOS_SALIDA,
+        default=None,
+        help='Formato de salida: png, svg, pdf o txt; txt no necesita Pillow '
+             '(default: según la extensión de -o)'
+    )
+
+    parser.add_argument(
+        '--tamaño-celda',
+        type=int,
+        default=None,
+        metavar='PX',
+        help='Solo PNG: celdas de PX píxeles, dibujando la imagen por franjas '
+             '(para cuadrículas muy grandes)'
+    )
+
+    parser.add_argument(
+        '--formato-solucion',
+        choices=list(FORMATOS_SOLUCION),
+        default=None,
+        help='Formato de las soluciones: texto, jsonl o binario; en lotes, jsonl y '
+             'binario reúnen todas las soluciones en un archivo '
+             '(default: texto, o jsonl con el formato txt)'
+    )
+
+    parser.add_argument(
+        '--cache',
+        type=str,
+        default=None,
+        metavar='DIRECTORIO',
+        help='Carpeta de caché: con --seed, las sopas repetidas no se recalculan'
+    )
+
     parser.add_argument(
         '--alfabeto',
         choices=['es', 'en'],
@@ -227,6 +457,116 @@ Ejemplos de uso:
         help='Alfabeto a usar (default: en)'
     )
 
+    parser.add_argument(
+        '--estrategia',
+        choices=Config.ESTRATEGIAS,
+        default='aleatoria',
+        help='Estrategia de colocación: aleatoria o backtracking (default: aleatoria)'
+    )
+
+    parser.add_argument(
+        '--relleno',
+        choices=Config.RELLENOS,
+        default='aleatorio',
+        help='Relleno de las celdas libres: aleatorio o sin_duplicados (default: aleatorio)'
+    )
+
+    parser.add_argument(
+        '--solapamiento',
+        action='store_true',
+        help='Empaquetado denso: colocar cada palabra donde comparta más letras'
+    )
+
+    parser.add_argument(
+        '--backend',
+        choices=list(TABLEROS),
+        default='lista',
+        help='Almacenamiento de la cuadrícula; numpy requiere NumPy, bitboard es el '
+             'más rápido en cuadrículas grandes y lineas busca con expresiones '
+             'regulares por línea (default: lista)'
+    )
+
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=None,
+        help='Semilla para obtener siempre la misma sopa (en lotes, semilla base)'
+    )
+
+    parser.add_argument(
+        '--cantidad',
+        type=int,
+        default=1,
+        help='Número de sopas a generar en lote (default: 1)'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Procesos para la generación en lote o con --mejor-de (default: uno por núcleo)'
+    )
+
+    parser.add_argument(
+        '--mejor-de',
+        type=int,
+        default=1,
+        metavar='K',
+        help='Generar hasta K sopas candidatas en paralelo y quedarse con la mejor (default: 1)'
+    )
+
+    parser.add_argument(
+        '--calidad-minima',
+        type=float,
+        default=None,
+        metavar='U',
+        help='Con --mejor-de: aceptar la primera candidata con calidad >= U (entre 0 y 1) '
+             'y cancelar el resto'
+    )
+
+    parser.add_argument(
+        '--metricas',
+        nargs='+',
+        choices=list(METRICAS),
+        default=list(METRICAS),
+        help='Métricas de calidad con --mejor-de (default: todas)'
+    )
+
+    parser.add_argument(
+        '--invertidas',
+        type=int,
+        default=None,
+        metavar='N',
+        help='Palabras invertidas deseadas por la métrica invertidas (default: la mitad)'
+    )
+
+    parser.add_argument(
+        '--cuadernillo',
+        action='store_true',
+        help='Reunir las --cantidad sopas y sus soluciones en un único PDF'
+    )
+
+    parser.add_argument(
+        '--resolver',
+        metavar='ARCHIVO',
+        help='Buscar las palabras de -t/-p en una cuadrícula de texto existente'
+    )
+
+    parser.add_argument(
+        '--archivo-palabras',
+        type=str,
+        default=None,
+        metavar='ARCHIVO',
+        help='Diccionario de palabras (.txt, .csv o .jsonl) del que elegir al azar'
+    )
+
+    parser.add_argument(
+        '--num-palabras',
+        type=int,
+        default=12,
+        help='Palabras a elegir de --archivo-palabras (default: 12)'
+    )
+
     parser.add_argument(
         '--listar-temas',
         action='store_true',
@@ -241,6 +581,16 @@ Ejemplos de uso:
 
     args = parser.parse_args()
 
+    # Opciones que solo se aplican a una sopa suelta
+    if args.cantidad > 1 or args.cuadernillo:
+        modo = '--cuadernillo' if args.cuadernillo else '--cantidad mayor que 1'
+        if args.tamaño_celda is not None:
+            parser.error(f"--tamaño-celda no se admite con {modo}")
+        if args.mejor_de > 1:
+            parser.error(f"--mejor-de no se admite con {modo}")
+        if args.cache and args.size != 'auto':
+            parser.error(f"con {modo}, --cache solo se usa junto con --size auto")
+
     # Listar temas
     if args.listar_temas:
         listar_temas()
@@ -251,17 +601,28 @@ Ejemplos de uso:
         crear_sopa_interactiva()
         return
 
+    # Configurar alfabeto
+    alfabeto = Config.ALFABETO_ES if args.alfabeto == 'es' else Config.ALFABETO_EN
+
     # Obtener palabras
     if args.palabras:
         palabras = [p.strip() for p in args.palabras.split(',')]
     elif args.tema:
         palabras = TEMAS[args.tema]
+    elif args.archivo_palabras:
+        palabras = muestrear_archivo(args, alfabeto)
     else:
-        print("❌ Error: Debes especificar un tema (-t) o palabras personalizadas (-p)")
+        print("❌ Error: Debes especificar un tema (-t), palabras personalizadas (-p) "
+              "o un archivo de palabras (--archivo-palabras)")
         print("    O usa el modo interactivo con -i")
         parser.print_help()
         sys.exit(1)
 
+    # Resolver una cuadrícula existente
+    if args.resolver:
+        resolver_archivo(args.resolver, palabras)
+        return
+
     # Configurar orientaciones según dificultad
     if args.dificultad == 'basico':
         orientaciones = Config.ORIENTACIONES_BASICO
@@ -273,28 +634,117 @@ Ejemplos de uso:
         orientaciones = Config.ORIENTACIONES_AVANZADO
         permitir_inversa = True
 
-    # Configurar alfabeto
-    alfabeto = Config.ALFABETO_ES if args.alfabeto == 'es' else Config.ALFABETO_EN
+    # Buscar el menor tamaño de cuadrícula que admite las palabras
+    tamaño_auto = args.size == 'auto'
+    if tamaño_auto:
+        from dimensionado import elegir_tamaño
+
+        try:
+            args.size = elegir_tamaño(
+                palabras, orientaciones, alfabeto, permitir_inversa, args.estrategia,
+                maximizar_solapamiento=args.solapamiento,
+                presupuesto=args.tiempo_auto,
+                archivo_cache=os.path.join(args.cache, 'tamaños.json') if args.cache else None
+            )
+        except ValueError as e:
+            print(f"\n❌ Error: {e}")
+            sys.exit(1)
+        print(f"📐 Tamaño automático: {args.size}x{args.size}")
+
+    # Determinar el formato de salida y ajustar la extensión del archivo
+    base, extension = os.path.splitext(args.output)
+    formato = args.formato or extension.lstrip('.').lower() or 'png'
+    if formato not in Config.FORMATOS_SALIDA:
+        print(f"❌ Error: Formato '{formato}' no soportado. "
+              f"Usa uno de: {', '.join(Config.FORMATOS_SALIDA)}")
+        sys.exit(1)
+    args.output = f"{base}.{formato}"
+    if args.formato_solucion is None:
+        # El camino solo texto acompaña la cuadrícula con la solución en JSON
+        args.formato_solucion = 'jsonl' if formato == 'txt' else 'texto'
+    if args.tamaño_celda is not None and formato != 'png':
+        print("❌ Error: --tamaño-celda solo se aplica al formato png")
+        sys.exit(1)
+
+    # Generar un cuadernillo PDF con varias sopas
+    if args.cuadernillo:
+        if formato != 'pdf':
+            args.output = f"{base}.pdf"
+        generar_cuadernillo(args, palabras, orientaciones, alfabeto, permitir_inversa)
+        return
+
+    # Generar un lote de sopas de letras
+    if args.cantidad > 1:
+        generar_en_lote(args, palabras, orientaciones, alfabeto, permitir_inversa, formato)
+        return
 
     # Generar sopa de letras
     print(f"⏳ Generando sopa de letras con {len(palabras)} palabras...")
 
     try:
-        generador = WordSearchGenerator(
+        parametros = dict(
             palabras=palabras,
             tamaño=args.size,
             orientaciones=orientaciones,
             alfabeto=alfabeto,
-            permitir_inversa=permitir_inversa
+            permitir_inversa=permitir_inversa,
+            estrategia=args.estrategia,
+            backend=args.backend,
+            relleno=args.relleno,
+            maximizar_solapamiento=args.solapamiento,
+            semilla=args.seed
         )
-
-        generador.generar()
-        generador.exportar_imagen(args.output)
+        opciones = {'tamaño_celda': args.tamaño_celda} if args.tamaño_celda else {}
+        # El tamaño automático se halló con otras semillas: si esta falla, crecer un poco
+        reintentos = Config.MAX_REINTENTOS_TAMAÑO_AUTO if tamaño_auto else 0
+
+        resumen_calidad = None
+
+        while True:
+            try:
+                if args.mejor_de > 1:
+                    from generacion_lote import generar_mejor
+
+                    if args.cache:
+                        print("ℹ️  La caché no se usa con --mejor-de")
+                    generador, resumen_calidad = generar_mejor(
+                        candidatos=args.mejor_de,
+                        umbral=args.calidad_minima,
+                        metricas=metricas_elegidas(args),
+                        workers=args.workers,
+                        **parametros
+                    )
+                    generador.exportar(args.output, formato=formato, **opciones)
+                elif args.cache:
+                    from cache_sopas import CacheSopas
+
+                    # Reutilizar la sopa ya renderizada si se pidió antes con la misma semilla
+                    cache = CacheSopas(args.cache)
+                    generador, contenido, acierto = cache.obtener(formato, opciones, **parametros)
+                    with open(args.output, 'wb') as f:
+                        f.write(contenido)
+                    if args.seed is None:
+                        print("ℹ️  La caché solo se usa con --seed")
+                    else:
+                        print(f"💾 Caché: {'acierto' if acierto else 'fallo'} ({args.cache})")
+                else:
+                    generador = WordSearchGenerator(**parametros)
+                    generador.generar()
+                    generador.exportar(args.output, formato=formato, **opciones)
+                break
+            except ValueError:
+                if not reintentos:
+                    raise
+                reintentos -= 1
+                parametros['tamaño'] += 1
 
         # Generar soluciones si se solicita
         if not args.sin_solucion:
-            nombre_solucion = args.output.replace('.png', '_solucion.txt')
-            generador.exportar_solucion(nombre_solucion)
+            nombre_solucion = (
+                os.path.splitext(args.output)[0] + '_solucion'
+                + FORMATOS_SOLUCION[args.formato_solucion]
+            )
+            generador.exportar_solucion(nombre_solucion, formato=args.formato_solucion)
             print(f"✅ Soluciones guardadas en: {nombre_solucion}")
 
         # Mostrar estadísticas
@@ -303,6 +753,18 @@ Ejemplos de uso:
         print(f"   Archivo: {args.output}")
         print(f"   Palabras: {stats['palabras_colocadas']}/{stats['total_palabras']}")
         print(f"   Tamaño: {stats['tamaño_cuadricula']}x{stats['tamaño_cuadricula']}")
+        if resumen_calidad:
+            detalle = ', '.join(f"{nombre} {valor:.2f}"
+                                for nombre, valor in resumen_calidad['metricas'].items())
+            print(f"   Calidad: {resumen_calidad['puntuacion']:.2f} ({detalle})")
+            print(f"   Candidata {resumen_calidad['indice']} de {args.mejor_de}: "
+                  f"{resumen_calidad['evaluadas']} evaluadas, "
+                  f"{resumen_calidad['detenidas']} detenidas y "
+                  f"{resumen_calidad['sin_generar']} sin generar en "
+                  f"{resumen_calidad['segundos']:.2f} s con {resumen_calidad['workers']} procesos")
+            if args.calidad_minima is not None and not resumen_calidad['cumple_umbral']:
+                print(f"   ⚠️  Ninguna candidata alcanzó la calidad {args.calidad_minima}; "
+                      f"se usa la mejor")
 
     except Exception as e:
         print(f"\n❌ Error: {e}")
@@ -0,0 +1,291 @@
+"""
+Utilidades de renderizado compartidas por los exportadores de imagen.
+
+Mantiene en memoria las fuentes cargadas, un atlas de glifos por fuente,
+tamaño y color (cada letra se rasteriza una sola vez por proceso) y las
+plantillas de cuadrícula vacía de las geometrías usadas recientemente.
+También incluye un escritor de PNG por franjas para imágenes que no caben
+cómodamente en memoria.
+"""
+
+import struct
+import zlib
+from collections import OrderedDict
+from functools import lru_cache
+from typing import BinaryIO, Dict, Optional, Tuple
+
+from PIL import Image, ImageDraw, ImageFont
+
+from config import Config
+
+
+@lru_cache(maxsize=None)
+def cargar_fuente(
+    ruta: Optional[str] = Config.FUENTE_POR_DEFECTO,
+    tamaño: Optional[int] = Config.TAMAÑO_FUENTE
+):
+    """
+    Carga una fuente una sola vez por proceso.
+
+    Args:
+        ruta: Archivo de fuente TrueType (None usa la fuente por defecto de PIL)
+        tamaño: Tamaño de la fuente en puntos (None usa el tamaño por defecto)
+
+    Returns:
+        Objeto de fuente de PIL
+    """
+    if ruta is None:
+        if tamaño is None:
+            return ImageFont.load_default()
+        return ImageFont.load_default(size=tamaño)
+    return ImageFont.truetype(ruta, tamaño or 10)
+
+
+class AtlasGlifos:
+    """
+    Atlas de glifos ya rasterizados para una fuente, tamaño y color.
+
+    Cada letra se dibuja una vez en una máscara recortada a su tinta; al
+    renderizar una celda solo se pega el color a través de esa máscara.
+
+    Attributes:
+        fuente: Fuente de PIL usada para rasterizar
+        color: Color de las letras
+    """
+
+    def __init__(self, fuente, color: str):
+        """
+        Inicializa un atlas vacío.
+
+        Args:
+            fuente: Fuente de PIL
+            color: Color de las letras
+        """
+        self.fuente = fuente
+        self.color = color
+        self._glifos: Dict[str, Tuple[Image.Image, Image.Image, int, int, int, int]] = {}
+        self._desplazamientos: Dict[Tuple[str, int], Tuple[int, int]] = {}
+
+    def glifo(self, letra: str) -> Tuple[Image.Image, Image.Image, int, int, int, int]:
+        """
+        Devuelve el glifo de una letra, rasterizándolo la primera vez.
+
+        Args:
+            letra: Letra a obtener
+
+        Returns:
+            Tupla (relleno, máscara, izquierda, arriba, ancho, alto), donde
+            izquierda y arriba son el desplazamiento de la tinta respecto
+            al origen del texto
+        """
+        if letra not in self._glifos:
+            izquierda, arriba, derecha, abajo = self.fuente.getbbox(letra)
+            ancho = max(derecha - izquierda, 1)
+            alto = max(abajo - arriba, 1)
+            mascara = Image.new('L', (ancho, alto), 0)
+            ImageDraw.Draw(mascara).text((-izquierda, -arriba), letra, font=self.fuente, fill=255)
+            relleno = Image.new('RGB', (ancho, alto), self.color)
+            self._glifos[letra] = (
+                relleno, mascara, izquierda, arriba, derecha - izquierda, abajo - arriba
+            )
+        return self._glifos[letra]
+
+    def desplazamiento(self, letra: str, tamaño_celda: int) -> Tuple[int, int]:
+        """
+        Calcula dónde pegar el glifo para centrarlo en una celda.
+
+        Args:
+            letra: Letra a centrar
+            tamaño_celda: Lado de la celda en píxeles
+
+        Returns:
+            Desplazamiento (x, y) de la máscara respecto a la esquina de la celda
+        """
+        clave = (letra, tamaño_celda)
+        if clave not in self._desplazamientos:
+            _, _, izquierda, arriba, ancho, alto = self.glifo(letra)
+            self._desplazamientos[clave] = (
+                (tamaño_celda - ancho) // 2 + izquierda,
+                (tamaño_celda - alto) // 2 + arriba,
+            )
+        return self._desplazamientos[clave]
+
+    def pegar(self, imagen: Image.Image, letra: str, x: int, y: int, tamaño_celda: int) -> None:
+        """
+        Pega una letra centrada en la celda cuya esquina es (x, y).
+
+        Args:
+            imagen: Imagen destino
+            letra: Letra a dibujar
+            x: Coordenada x de la esquina de la celda
+            y: Coordenada y de la esquina de la celda
+            tamaño_celda: Lado de la celda en píxeles
+        """
+        relleno, mascara, _, _, _, _ = self.glifo(letra)
+        dx, dy = self.desplazamiento(letra, tamaño_celda)
+        imagen.paste(relleno, (x + dx, y + dy), mascara)
+
+
+_ATLAS: Dict[Tuple[Optional[str], Optional[int], str], AtlasGlifos] = {}
+
+
+def obtener_atlas(
+    color: str,
+    ruta: Optional[str] = Config.FUENTE_POR_DEFECTO,
+    tamaño: Optional[int] = Config.TAMAÑO_FUENTE
+) -> AtlasGlifos:
+    """
+    Devuelve el atlas compartido para una fuente, tamaño y color.
+
+    Args:
+        color: Color de las letras
+        ruta: Archivo de fuente (None usa la fuente por defecto de PIL)
+        tamaño: Tamaño de la fuente (None usa el tamaño por defecto)
+
+    Returns:
+        Atlas de glifos reutilizable entre celdas y entre sopas
+    """
+    clave = (ruta, tamaño, color)
+    if clave not in _ATLAS:
+        _ATLAS[clave] = AtlasGlifos(cargar_fuente(ruta, tamaño), color)
+    return _ATLAS[clave]
+
+
+_PLANTILLAS: "OrderedDict[Tuple[int, int, bool, str, str], Image.Image]" = OrderedDict()
+
+
+def obtener_plantilla(
+    tamaño: int,
+    imagen_tamaño: int,
+    mostrar_palabras: bool,
+    color_fondo: str,
+    color_lineas: str
+) -> Image.Image:
+    """
+    Devuelve una copia de la plantilla vacía para una geometría.
+
+    La plantilla contiene el fondo, las líneas de la cuadrícula y el área de
+    la lista de palabras. Se dibuja una sola vez por geometría y se guarda en
+    una caché LRU de hasta Config.MAX_PLANTILLAS_CACHE entradas.
+
+    Args:
+        tamaño: Tamaño de la cuadrícula (NxN)
+        imagen_tamaño: Tamaño de la imagen en píxeles
+        mostrar_palabras: Si se reserva el área para la lista de palabras
+        color_fondo: Color de fondo
+        color_lineas: Color de las líneas de la cuadrícula
+
+    Returns:
+        Imagen nueva, lista para dibujar encima
+    """
+    clave = (tamaño, imagen_tamaño, mostrar_palabras, color_fondo, color_lineas)
+    plantilla = _PLANTILLAS.get(clave)
+    if plantilla is not None:
+        _PLANTILLAS.move_to_end(clave)
+        return plantilla.copy()
+
+    cell_size = imagen_tamaño // tamaño
+    altura_extra = Config.IMAGEN_EXTRA_ALTURA if mostrar_palabras else 0
+    plantilla = Image.new('RGB', (imagen_tamaño, imagen_tamaño + altura_extra), color_fondo)
+    draw = ImageDraw.Draw(plantilla)
+    for i in range(tamaño + 1):
+        # Líneas horizontales
+        draw.line(
+            [(0, i * cell_size), (imagen_tamaño, i * cell_size)],
+            fill=color_lineas
+        )
+        # Líneas verticales
+        draw.line(
+            [(i * cell_size, 0), (i * cell_size, imagen_tamaño)],
+            fill=color_lineas
+        )
+
+    _PLANTILLAS[clave] = plantilla
+    if len(_PLANTILLAS) > Config.MAX_PLANTILLAS_CACHE:
+        _PLANTILLAS.popitem(last=False)
+    return plantilla.copy()
+
+
+class EscritorPNG:
+    """
+    Escritor de PNG RGB que codifica la imagen franja a franja.
+
+    Solo guarda en memoria la franja que se está escribiendo y el estado del
+    compresor; los datos comprimidos se vuelcan al archivo en bloques IDAT
+    en cuanto superan Config.TAMAÑO_BLOQUE_PNG bytes.
+
+    Attributes:
+        ancho: Ancho de la imagen en píxeles
+        alto: Alto de la imagen en píxeles
+        filas_escritas: Filas de píxeles escritas hasta ahora
+    """
+
+    FIRMA = b'\x89PNG\r\n\x1a\n'
+
+    def __init__(self, archivo: BinaryIO, ancho: int, alto: int):
+        """
+        Escribe la cabecera del PNG.
+
+        Args:
+            archivo: Archivo binario abierto para escritura
+            ancho: Ancho de la imagen en píxeles
+            alto: Alto de la imagen en píxeles
+        """
+        self.archivo = archivo
+        self.ancho = ancho
+        self.alto = alto
+        self.filas_escritas = 0
+        self._compresor = zlib.compressobj()
+        self._pendiente = bytearray()
+
+        archivo.write(self.FIRMA)
+        # Profundidad de 8 bits, color RGB, sin entrelazado
+        self._escribir_bloque(b'IHDR', struct.pack('>IIBBBBB', ancho, alto, 8, 2, 0, 0, 0))
+
+    def _escribir_bloque(self, tipo: bytes, datos: bytes) -> None:
+        self.archivo.write(struct.pack('>I', len(datos)))
+        self.archivo.write(tipo)
+        self.archivo.write(datos)
+        self.archivo.write(struct.pack('>I', zlib.crc32(datos, zlib.crc32(tipo))))
+
+    def escribir_franja(self, franja: Image.Image) -> None:
+        """
+        Añade una franja horizontal de la imagen.
+
+        Args:
+            franja: Imagen RGB del mismo ancho que el PNG
+
+        Raises:
+            ValueError: Si el ancho no coincide o se excede el alto declarado
+        """
+        if franja.width != self.ancho:
+            raise ValueError(f"La franja mide {franja.width} px de ancho; se esperaban {self.ancho}")
+        if self.filas_escritas + franja.height > self.alto:
+            raise ValueError("La franja excede el alto declarado del PNG")
+
+        datos = franja.convert('RGB').tobytes()
+        paso = self.ancho * 3
+        for inicio in range(0, len(datos), paso):
+            # Cada fila va precedida del tipo de filtro (0: ninguno)
+            self._pendiente += self._compresor.compress(b'\x00' + datos[inicio:inicio + paso])
+        self.filas_escritas += franja.height
+
+        if len(self._pendiente) >= Config.TAMAÑO_BLOQUE_PNG:
+            self._escribir_bloque(b'IDAT', bytes(self._pendiente))
+            self._pendiente.clear()
+
+    def cerrar(self) -> None:
+        """
+        Termina la compresión y escribe el final del PNG.
+
+        Raises:
+            ValueError: Si no se escribieron todas las filas declaradas
+        """
+        if self.filas_escritas != self.alto:
+            raise ValueError(
+                f"Se escribieron {self.filas_escritas} filas de {self.alto} declaradas"
+            )
+        self._pendiente += self._compresor.flush()
+        self._escribir_bloque(b'IDAT', bytes(self._pendiente))
+        self._pendiente.clear()
+        self._escribir_bloque(b'IEND', b'')
@@ -0,0 +1,504 @@
+"""
+Servidor HTTP local de sopas de letras.
+
+Atiende peticiones con asyncio (solo biblioteca estándar) y reparte la
+generación y el renderizado entre un pool de procesos que se calienta al
+arrancar, de modo que cada petición no paga el arranque del intérprete ni
+la carga de Pillow y las fuentes.
+
+Rutas:
+    POST /sopa    Cuerpo JSON con 'palabras' y opciones; responde JSON con la
+                  imagen en base64, la solución y las estadísticas
+    POST /imagen  Igual que /sopa, pero responde solo la imagen
+    GET  /estado  Contadores de peticiones y de la cola
+
+Las peticiones que no caben en la cola reciben 503 con Retry-After, las que
+no terminan de enviarse a tiempo 408 y las sopas que no se generan a tiempo
+504.
+"""
+
+import argparse
+import asyncio
+import base64
+import io
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Tuple
+
+from cache_sopas import CacheSopas
+from config import Config
+from word_search_generator import DIRECCIONES, WordSearchGenerator
+
+
+TIPOS_CONTENIDO = {
+    'png': 'image/png',
+    'svg': 'image/svg+xml',
+    'pdf': 'application/pdf',
+    'txt': 'text/plain; charset=utf-8',
+}
+
+MENSAJES_ESTADO = {
+    200: 'OK',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    408: 'Request Timeout',
+    413: 'Payload Too Large',
+    422: 'Unprocessable Entity',
+    500: 'Internal Server Error',
+    503: 'Service Unavailable',
+    504: 'Gateway Timeout',
+}
+
+# Opciones del cuerpo JSON que se pasan a WordSearchGenerator y su tipo
+OPCIONES_GENERADOR = {
+    'tamaño': int,
+    'orientaciones': list,
+    'permitir_inversa': bool,
+    'estrategia': str,
+    'relleno': str,
+    'maximizar_solapamiento': bool,
+    'semilla': int,
+}
+
+TAMAÑO_BLOQUE_RESPUESTA = 1 << 16
+
+
+class ErrorPeticion(Exception):
+    """Error de la petición que se responde con un código HTTP."""
+
+    def __init__(self, estado: int, mensaje: str):
+        super().__init__(mensaje)
+        self.estado = estado
+
+
+def _calentar() -> int:
+    """Importa y ejecuta una vez el camino completo dentro de un proceso del pool."""
+    generador = WordSearchGenerator(["SOPA"], tamaño=5, semilla=0)
+    generador.generar()
+    generador.exportar_imagen(io.BytesIO())
+    return os.getpid()
+
+
+# Caché de cada proceso del pool por directorio
+_CACHES: Dict[str, CacheSopas] = {}
+
+
+def _generar_sopa(parametros: Dict, directorio_cache: Optional[str] = None) -> Dict:
+    """
+    Genera y renderiza una sopa de letras dentro de un proceso del pool.
+
+    Args:
+        parametros: Parámetros ya validados (ver validar_parametros)
+        directorio_cache: Carpeta de la caché en disco (None para no usarla)
+
+    Returns:
+        Diccionario con la imagen en bytes, la solución, las estadísticas y
+        si la sopa salió de la caché
+
+    Raises:
+        ValueError: Si las palabras no caben en la cuadrícula
+    """
+    formato = parametros['formato']
+    opciones = {'mostrar_palabras': parametros['mostrar_palabras']}
+
+    if directorio_cache is not None:
+        if directorio_cache not in _CACHES:
+            _CACHES[directorio_cache] = CacheSopas(directorio_cache)
+        generador, contenido, acierto = _CACHES[directorio_cache].obtener(
+            formato, opciones, **parametros['generador']
+        )
+    else:
+        generador = WordSearchGenerator(**parametros['generador'])
+        generador.generar()
+        salida = io.StringIO() if formato in Config.FORMATOS_TEXTO else io.BytesIO()
+        generador.exportar(salida, formato=formato, **opciones)
+        contenido = salida.getvalue()
+        if formato in Config.FORMATOS_TEXTO:
+            contenido = contenido.encode('utf-8')
+        acierto = False
+
+    return {
+        'contenido': contenido,
+        'solucion': generador.obtener_solucion(),
+        'estadisticas': generador.obtener_estadisticas(),
+        'cache': acierto,
+    }
+
+
+def validar_parametros(datos) -> Dict:
+    """
+    Valida el cuerpo JSON de una petición.
+
+    Args:
+        datos: Objeto JSON decodificado
+
+    Returns:
+        Parámetros con 'formato', 'mostrar_palabras' y las opciones del
+        generador
+
+    Raises:
+        ErrorPeticion: Si falta algún campo o tiene un tipo o valor no válido
+    """
+    if not isinstance(datos, dict):
+        raise ErrorPeticion(400, "El cuerpo debe ser un objeto JSON")
+
+    palabras = datos.get('palabras')
+    if (not isinstance(palabras, list) or not palabras
+            or not all(isinstance(p, str) and p for p in palabras)):
+        raise ErrorPeticion(400, "'palabras' debe ser una lista de textos no vacía")
+
+    conocidas = set(OPCIONES_GENERADOR) | {'palabras', 'alfabeto', 'formato', 'mostrar_palabras'}
+    desconocidas = sorted(set(datos) - conocidas)
+    if desconocidas:
+        raise ErrorPeticion(400, f"Opciones desconocidas: {', '.join(desconocidas)}")
+
+    generador = {'palabras': palabras}
+    for clave, tipo in OPCIONES_GENERADOR.items():
+        if clave in datos:
+            valor = datos[clave]
+            if not isinstance(valor, tipo) or (tipo is int and isinstance(valor, bool)):
+                raise ErrorPeticion(400, f"'{clave}' debe ser de tipo {tipo.__name__}")
+            generador[clave] = valor
+
+    if not 1 <= generador.get('tamaño', 15) <= Config.SERVIDOR_MAX_TAMAÑO:
+        raise ErrorPeticion(400, f"'tamaño' debe estar entre 1 y {Config.SERVIDOR_MAX_TAMAÑO}")
+    # Acota el trabajo de cada petición para que ningún proceso quede ocupado sin límite
+    if generador.get('tamaño', 15) * len(palabras) > Config.SERVIDOR_MAX_TRABAJO:
+        raise ErrorPeticion(
+            400, f"'tamaño' × número de palabras no puede superar {Config.SERVIDOR_MAX_TRABAJO}"
+        )
+    generador['max_nodos'] = Config.SERVIDOR_MAX_NODOS
+    if not all(isinstance(o, str) and o in DIRECCIONES for o in generador.get('orientaciones', [])):
+        raise ErrorPeticion(400, f"'orientaciones' admite: {', '.join(DIRECCIONES)}")
+    if 'estrategia' in generador and generador['estrategia'] not in Config.ESTRATEGIAS:
+        raise ErrorPeticion(400, f"Estrategia no válida: {generador['estrategia']}")
+    if 'relleno' in generador and generador['relleno'] not in Config.RELLENOS:
+        raise ErrorPeticion(400, f"Relleno no válido: {generador['relleno']}")
+
+    alfabeto = datos.get('alfabeto', 'en')
+    if alfabeto not in ('es', 'en'):
+        raise ErrorPeticion(400, "'alfabeto' debe ser 'es' o 'en'")
+    generador['alfabeto'] = Config.ALFABETO_ES if alfabeto == 'es' else Config.ALFABETO_EN
+
+    formato = datos.get('formato', 'png')
+    if formato not in Config.FORMATOS_SALIDA:
+        raise ErrorPeticion(400, f"'formato' debe ser uno de: {', '.join(Config.FORMATOS_SALIDA)}")
+
+    return {
+        'formato': formato,
+        'mostrar_palabras': bool(datos.get('mostrar_palabras', True)),
+        'generador': generador,
+    }
+
+
+class ServidorSopas:
+    """
+    Servidor HTTP asyncio con un pool de procesos precalentado.
+
+    Como mucho `workers` sopas se generan a la vez; hasta `max_pendientes`
+    peticiones pueden estar admitidas entre la cola y el pool, y el resto se
+    rechaza de inmediato con 503. Una petición admitida que espera más de
+    `tiempo_espera` segundos por un proceso libre también recibe 503, y una
+    sopa que tarda más de `tiempo_generacion` segundos recibe 504; así la
+    latencia queda acotada aunque lleguen ráfagas. Los clientes que tardan
+    más de `tiempo_lectura` segundos en enviar la petición reciben 408.
+
+    Attributes:
+        host: Dirección en la que escucha
+        puerto: Puerto en el que escucha (el real, si se pidió el 0)
+        workers: Número de procesos del pool
+        max_pendientes: Peticiones admitidas a la vez
+        tiempo_espera: Segundos máximos de espera por un proceso libre
+        tiempo_lectura: Segundos máximos para recibir la petición
+        tiempo_generacion: Segundos máximos esperando el resultado del pool
+        contadores: Peticiones atendidas, rechazadas y con error, y
+            aciertos y fallos de la caché
+    """
+
+    def __init__(
+        self,
+        host: str = Config.SERVIDOR_HOST,
+        puerto: int = Config.SERVIDOR_PUERTO,
+        workers: Optional[int] = None,
+        max_pendientes: int = Config.SERVIDOR_MAX_PENDIENTES,
+        tiempo_espera: float = Config.SERVIDOR_TIEMPO_ESPERA,
+        directorio_cache: Optional[str] = None,
+        tiempo_lectura: float = Config.SERVIDOR_TIEMPO_LECTURA,
+        tiempo_generacion: float = Config.SERVIDOR_TIEMPO_GENERACION
+    ):
+        """
+        Configura el servidor sin arrancarlo.
+
+        Args:
+            host: Dirección en la que escuchar
+            puerto: Puerto (0 elige uno libre)
+            workers: Procesos del pool (por defecto, uno por núcleo)
+            max_pendientes: Peticiones admitidas a la vez (cola + en proceso)
+            tiempo_espera: Segundos máximos esperando un proceso libre
+            directorio_cache: Carpeta de caché en disco compartida por los
+                procesos (las sopas con semilla repetidas no se recalculan)
+            tiempo_lectura: Segundos máximos para recibir cabeceras y cuerpo
+            tiempo_generacion: Segundos máximos esperando una sopa del pool
+        """
+        self.host = host
+        self.puerto = puerto
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pendientes = max_pendientes
+        self.tiempo_espera = tiempo_espera
+        self.directorio_cache = directorio_cache
+        self.tiempo_lectura = tiempo_lectura
+        self.tiempo_generacion = tiempo_generacion
+        self.contadores = {
+            'atendidas': 0, 'rechazadas': 0, 'errores': 0,
+            'cache_aciertos': 0, 'cache_fallos': 0,
+        }
+        self._pendientes = 0
+        self._en_proceso = 0
+        self._ranuras: Optional[asyncio.Semaphore] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._servidor: Optional[asyncio.AbstractServer] = None
+
+    async def iniciar(self) -> None:
+        """Arranca y calienta el pool de procesos y empieza a escuchar."""
+        loop = asyncio.get_running_loop()
+        self._ranuras = asyncio.Semaphore(self.workers)
+        self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        await asyncio.gather(*(
+            loop.run_in_executor(self._executor, _calentar) for _ in range(self.workers)
+        ))
+        self._servidor = await asyncio.start_server(self._atender, self.host, self.puerto)
+        self.puerto = self._servidor.sockets[0].getsockname()[1]
+
+    async def servir(self) -> None:
+        """Atiende peticiones hasta que se cancele la tarea."""
+        if self._servidor is None:
+            await self.iniciar()
+        async with self._servidor:
+            await self._servidor.serve_forever()
+
+    async def detener(self) -> None:
+        """Deja de escuchar y cierra el pool de procesos."""
+        if self._servidor is not None:
+            self._servidor.close()
+            await self._servidor.wait_closed()
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+
+    def estado(self) -> Dict:
+        """Devuelve los contadores y la ocupación actual."""
+        return dict(
+            self.contadores,
+            pendientes=self._pendientes,
+            en_proceso=self._en_proceso,
+            workers=self.workers,
+            max_pendientes=self.max_pendientes,
+        )
+
+    async def _leer_peticion(self, reader: asyncio.StreamReader) -> Tuple[str, str, bytes]:
+        """
+        Lee la petición completa en como mucho `tiempo_lectura` segundos.
+
+        Returns:
+            Tupla (método, ruta, cuerpo)
+
+        Raises:
+            ErrorPeticion: 408 si el cliente no la envía a tiempo; 400 o 413
+                si está mal formada o es demasiado grande
+        """
+        try:
+            return await asyncio.wait_for(self._leer_mensaje(reader), self.tiempo_lectura)
+        except asyncio.TimeoutError:
+            raise ErrorPeticion(408, "La petición no llegó a tiempo")
+
+    async def _leer_mensaje(self, reader: asyncio.StreamReader) -> Tuple[str, str, bytes]:
+        """Lee la línea de petición, las cabeceras y el cuerpo."""
+        linea = (await reader.readline()).decode('latin-1').split()
+        if len(linea) != 3:
+            raise ErrorPeticion(400, "Línea de petición no válida")
+        metodo, ruta, _ = linea
+
+        largo = 0
+        while True:
+            cabecera = (await reader.readline()).decode('latin-1').strip()
+            if not cabecera:
+                break
+            nombre, _, valor = cabecera.partition(':')
+            if nombre.strip().lower() == 'content-length':
+                try:
+                    largo = int(valor)
+                except ValueError:
+                    raise ErrorPeticion(400, "Content-Length no válido")
+                if largo < 0:
+                    raise ErrorPeticion(400, "Content-Length no válido")
+
+        if largo > Config.SERVIDOR_MAX_CUERPO:
+            raise ErrorPeticion(413, f"El cuerpo supera {Config.SERVIDOR_MAX_CUERPO} bytes")
+        cuerpo = await reader.readexactly(largo) if largo else b''
+        return metodo, ruta.split('?', 1)[0], cuerpo
+
+    async def _responder(
+        self,
+        writer: asyncio.StreamWriter,
+        estado: int,
+        contenido: bytes,
+        tipo: str = 'application/json',
+        cabeceras: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Escribe la respuesta por bloques respetando el ritmo del cliente."""
+        lineas = [
+            f"HTTP/1.1 {estado} {MENSAJES_ESTADO[estado]}",
+            f"Content-Type: {tipo}",
+            f"Content-Length: {len(contenido)}",
+            "Connection: close",
+        ]
+        lineas += [f"{nombre}: {valor}" for nombre, valor in (cabeceras or {}).items()]
+        writer.write(('\r\n'.join(lineas) + '\r\n\r\n').encode('latin-1'))
+        vista = memoryview(contenido)
+        for inicio in range(0, len(vista), TAMAÑO_BLOQUE_RESPUESTA):
+            writer.write(vista[inicio:inicio + TAMAÑO_BLOQUE_RESPUESTA])
+            await writer.drain()
+        await writer.drain()
+
+    async def _responder_json(self, writer, estado: int, datos, cabeceras=None) -> None:
+        contenido = json.dumps(datos, ensure_ascii=False).encode('utf-8')
+        await self._responder(writer, estado, contenido, 'application/json; charset=utf-8', cabeceras)
+
+    async def _generar(self, parametros: Dict) -> Dict:
+        """
+        Envía una sopa al pool aplicando la política de admisión.
+
+        Raises:
+            ErrorPeticion: 503 si la cola está llena o no hay proceso libre a
+                tiempo; 504 si la sopa no llega en `tiempo_generacion`
+                segundos; 422 si las palabras no caben en la cuadrícula
+        """
+        if self._pendientes >= self.max_pendientes:
+            raise ErrorPeticion(503, "Servidor ocupado, inténtalo de nuevo")
+
+        self._pendientes += 1
+        try:
+            try:
+                await asyncio.wait_for(self._ranuras.acquire(), self.tiempo_espera)
+            except asyncio.TimeoutError:
+                raise ErrorPeticion(503, "No se liberó ningún proceso a tiempo")
+            self._en_proceso += 1
+            loop = asyncio.get_running_loop()
+            futuro = loop.run_in_executor(
+                self._executor, _generar_sopa, parametros, self.directorio_cache
+            )
+            # El proceso solo queda libre cuando termina, aunque ya se haya respondido
+            futuro.add_done_callback(self._liberar_proceso)
+            try:
+                return await asyncio.wait_for(asyncio.shield(futuro), self.tiempo_generacion)
+            except asyncio.TimeoutError:
+                raise ErrorPeticion(504, "La sopa no se generó a tiempo")
+            except ValueError as e:
+                raise ErrorPeticion(422, str(e))
+        finally:
+            self._pendientes -= 1
+
+    def _liberar_proceso(self, futuro: asyncio.Future) -> None:
+        """Devuelve la ranura de un proceso del pool al terminar su trabajo."""
+        self._en_proceso -= 1
+        self._ranuras.release()
+        if not futuro.cancelled():
+            futuro.exception()  # Evita el aviso de excepción no recuperada
+
+    async def _atender(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Atiende una conexión con una sola petición."""
+        try:
+            try:
+                metodo, ruta, cuerpo = await self._leer_peticion(reader)
+                if ruta == '/estado':
+                    if metodo != 'GET':
+                        raise ErrorPeticion(405, "Usa GET en /estado")
+                    await self._responder_json(writer, 200, self.estado())
+                    return
+                if ruta not in ('/sopa', '/imagen'):
+                    raise ErrorPeticion(404, f"Ruta desconocida: {ruta}")
+                if metodo != 'POST':
+                    raise ErrorPeticion(405, f"Usa POST en {ruta}")
+
+                try:
+                    datos = json.loads(cuerpo.decode('utf-8'))
+                except (UnicodeDecodeError, json.JSONDecodeError):
+                    raise ErrorPeticion(400, "El cuerpo no es JSON válido")
+                parametros = validar_parametros(datos)
+                resultado = await self._generar(parametros)
+            except ErrorPeticion as e:
+                clave = 'rechazadas' if e.estado == 503 else 'errores'
+                self.contadores[clave] += 1
+                cabeceras = {'Retry-After': '1'} if e.estado == 503 else None
+                await self._responder_json(writer, e.estado, {'error': str(e)}, cabeceras)
+                return
+            except Exception as e:
+                self.contadores['errores'] += 1
+                await self._responder_json(writer, 500, {'error': f"Error interno: {e}"})
+                return
+
+            self.contadores['atendidas'] += 1
+            if self.directorio_cache is not None and parametros['generador'].get('semilla') is not None:
+                self.contadores['cache_aciertos' if resultado['cache'] else 'cache_fallos'] += 1
+            formato = parametros['formato']
+            if ruta == '/imagen':
+                await self._responder(writer, 200, resultado['contenido'], TIPOS_CONTENIDO[formato])
+            else:
+                await self._responder_json(writer, 200, {
+                    'formato': formato,
+                    'tipo': TIPOS_CONTENIDO[formato],
+                    'imagen': base64.b64encode(resultado['contenido']).decode('ascii'),
+                    'solucion': resultado['solucion'],
+                    'estadisticas': resultado['estadisticas'],
+                    'cache': resultado['cache'],
+                })
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+def main():
+    """Punto de entrada del servidor."""
+    parser = argparse.ArgumentParser(description='Servidor HTTP local de sopas de letras')
+    parser.add_argument('--host', default=Config.SERVIDOR_HOST,
+                        help=f'Dirección en la que escuchar (default: {Config.SERVIDOR_HOST})')
+    parser.add_argument('--puerto', type=int, default=Config.SERVIDOR_PUERTO,
+                        help=f'Puerto (default: {Config.SERVIDOR_PUERTO})')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Procesos del pool (default: uno por núcleo)')
+    parser.add_argument('--max-pendientes', type=int, default=Config.SERVIDOR_MAX_PENDIENTES,
+                        help='Peticiones admitidas a la vez antes de responder 503')
+    parser.add_argument('--tiempo-espera', type=float, default=Config.SERVIDOR_TIEMPO_ESPERA,
+                        help='Segundos máximos esperando un proceso libre')
+    parser.add_argument('--cache', default=None, metavar='DIRECTORIO',
+                        help='Carpeta de caché en disco para sopas con semilla')
+    parser.add_argument('--tiempo-lectura', type=float, default=Config.SERVIDOR_TIEMPO_LECTURA,
+                        help='Segundos máximos para recibir cada petición')
+    parser.add_argument('--tiempo-generacion', type=float, default=Config.SERVIDOR_TIEMPO_GENERACION,
+                        help='Segundos máximos esperando una sopa antes de responder 504')
+    args = parser.parse_args()
+
+    servidor = ServidorSopas(
+        args.host, args.puerto, args.workers, args.max_pendientes, args.tiempo_espera,
+        args.cache, args.tiempo_lectura, args.tiempo_generacion
+    )
+
+    async def ejecutar():
+        await servidor.iniciar()
+        print(f"✅ Servidor escuchando en http://{servidor.host}:{servidor.puerto} "
+              f"con {servidor.workers} procesos")
+        try:
+            await servidor.servir()
+        finally:
+            await servidor.detener()
+
+    try:
+        asyncio.run(ejecutar())
+    except KeyboardInterrupt:
+        print("\n👋 Servidor detenido")
+
+
+if __name__ == '__main__':
+    main()
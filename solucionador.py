@@ -0,0 +1,208 @@
+"""
+Solucionador de sopas de letras.
+
+Busca todas las apariciones de una lista de palabras en una cuadrícula
+recorriendo cada línea (filas, columnas y ambas diagonales) en los dos
+sentidos con un autómata de Aho-Corasick, de modo que todas las palabras se
+buscan a la vez en una sola pasada por línea.
+"""
+
+from typing import Dict, Iterator, List, Tuple
+
+
+# Las 8 direcciones de búsqueda: (delta_fila, delta_col) -> nombre legible
+DIRECCIONES_BUSQUEDA = {
+    (0, 1): 'Horizontal',
+    (1, 0): 'Vertical',
+    (1, 1): 'Diagonal',
+    (1, -1): 'Diagonal Secundaria',
+    (0, -1): 'Horizontal Inversa',
+    (-1, 0): 'Vertical Inversa',
+    (-1, -1): 'Diagonal Inversa',
+    (-1, 1): 'Diagonal Secundaria Inversa',
+}
+
+# Carácter con el que se buscan las celdas vacías; no aparece en ninguna palabra
+_CELDA_VACIA = '\0'
+
+
+class AutomataAhoCorasick:
+    """
+    Autómata de Aho-Corasick para buscar muchas palabras a la vez.
+
+    Attributes:
+        palabras: Palabras reconocidas por el autómata
+    """
+
+    def __init__(self, palabras: List[str]):
+        """
+        Construye el trie y los enlaces de fallo.
+
+        Args:
+            palabras: Palabras a buscar
+        """
+        self.palabras = palabras
+        self._transiciones: List[Dict[str, int]] = [{}]
+        self._fallo: List[int] = [0]
+        self._salida: List[List[int]] = [[]]
+
+        for indice, palabra in enumerate(palabras):
+            estado = 0
+            for letra in palabra:
+                siguiente = self._transiciones[estado].get(letra)
+                if siguiente is None:
+                    siguiente = len(self._transiciones)
+                    self._transiciones[estado][letra] = siguiente
+                    self._transiciones.append({})
+                    self._fallo.append(0)
+                    self._salida.append([])
+                estado = siguiente
+            self._salida[estado].append(indice)
+
+        # Enlaces de fallo en anchura; cada estado hereda las salidas de su fallo
+        cola = list(self._transiciones[0].values())
+        for estado in cola:
+            for letra, siguiente in self._transiciones[estado].items():
+                fallo = self._fallo[estado]
+                while fallo and letra not in self._transiciones[fallo]:
+                    fallo = self._fallo[fallo]
+                destino = self._transiciones[fallo].get(letra, 0)
+                self._fallo[siguiente] = destino if destino != siguiente else 0
+                self._salida[siguiente] = self._salida[siguiente] + self._salida[self._fallo[siguiente]]
+                cola.append(siguiente)
+
+    def buscar(self, texto: str) -> Iterator[Tuple[int, int]]:
+        """
+        Recorre un texto y devuelve cada palabra reconocida.
+
+        Args:
+            texto: Texto a recorrer
+
+        Yields:
+            Tuplas (índice de la última letra, índice de la palabra)
+        """
+        transiciones = self._transiciones
+        fallo = self._fallo
+        salida = self._salida
+        estado = 0
+        for posicion, letra in enumerate(texto):
+            while estado and letra not in transiciones[estado]:
+                estado = fallo[estado]
+            estado = transiciones[estado].get(letra, 0)
+            for indice in salida[estado]:
+                yield posicion, indice
+
+
+def _lineas(tamaño_filas: int, tamaño_cols: int) -> Iterator[Tuple[Tuple[int, int], List[Tuple[int, int]]]]:
+    """
+    Enumera las líneas de la cuadrícula en sus cuatro ejes.
+
+    Yields:
+        Tuplas (dirección del eje, celdas de la línea en ese sentido)
+    """
+    for fila in range(tamaño_filas):
+        yield (0, 1), [(fila, col) for col in range(tamaño_cols)]
+    for col in range(tamaño_cols):
+        yield (1, 0), [(fila, col) for fila in range(tamaño_filas)]
+    for inicio in range(-(tamaño_filas - 1), tamaño_cols):
+        # Diagonal principal: col - fila constante
+        yield (1, 1), [
+            (fila, fila + inicio)
+            for fila in range(tamaño_filas) if 0 <= fila + inicio < tamaño_cols
+        ]
+    for suma in range(tamaño_filas + tamaño_cols - 1):
+        # Diagonal secundaria: fila + col constante
+        yield (1, -1), [
+            (fila, suma - fila)
+            for fila in range(tamaño_filas) if 0 <= suma - fila < tamaño_cols
+        ]
+
+
+def resolver_cuadricula(cuadrícula: List[List[str]], palabras: List[str]) -> List[dict]:
+    """
+    Busca todas las apariciones de las palabras en las 8 direcciones.
+
+    Args:
+        cuadrícula: Matriz de letras; las celdas vacías ('') no forman parte
+            de ninguna palabra
+        palabras: Palabras a buscar (se convierten a mayúsculas)
+
+    Returns:
+        Lista de apariciones; cada una con 'palabra', 'posiciones',
+        'orientacion' y 'direccion' (delta_fila, delta_col). Las palabras
+        capicúa se reportan una sola vez por grupo de celdas.
+
+    Raises:
+        ValueError: Si alguna celda tiene más de un carácter
+    """
+    palabras = list(dict.fromkeys(p.upper() for p in palabras if p))
+    if not cuadrícula or not palabras:
+        return []
+
+    # Cada celda debe ocupar exactamente un carácter del texto de su línea
+    for fila, letras in enumerate(cuadrícula):
+        for col, letra in enumerate(letras):
+            if len(letra) > 1:
+                raise ValueError(f"La celda ({fila}, {col}) tiene más de una letra: {letra!r}")
+    cuadrícula = [[letra or _CELDA_VACIA for letra in letras] for letras in cuadrícula]
+
+    automata = AutomataAhoCorasick(palabras)
+    apariciones = []
+    vistas = set()
+
+    for (delta_fila, delta_col), celdas in _lineas(len(cuadrícula), len(cuadrícula[0])):
+        texto = ''.join(cuadrícula[fila][col] for fila, col in celdas)
+        for sentido in (1, -1):
+            recorrido = celdas if sentido == 1 else celdas[::-1]
+            texto_sentido = texto if sentido == 1 else texto[::-1]
+            for fin, indice in automata.buscar(texto_sentido):
+                palabra = palabras[indice]
+                posiciones = recorrido[fin - len(palabra) + 1:fin + 1]
+                clave = (palabra, min(posiciones[0], posiciones[-1]), max(posiciones[0], posiciones[-1]))
+                if clave in vistas:
+                    continue
+                vistas.add(clave)
+                direccion = (delta_fila * sentido, delta_col * sentido)
+                apariciones.append({
+                    'palabra': palabra,
+                    'posiciones': posiciones,
+                    'orientacion': DIRECCIONES_BUSQUEDA[direccion],
+                    'direccion': direccion,
+                })
+
+    return apariciones
+
+
+def leer_cuadricula(nombre_archivo: str) -> List[List[str]]:
+    """
+    Lee una cuadrícula desde un archivo de texto.
+
+    Cada línea no vacía es una fila; las letras pueden ir separadas por
+    espacios (como en imprimir_cuadricula) o juntas.
+
+    Args:
+        nombre_archivo: Ruta del archivo de texto
+
+    Returns:
+        Matriz de letras en mayúsculas
+
+    Raises:
+        ValueError: Si las filas no tienen todas la misma longitud o alguna
+            celda separada por espacios tiene más de una letra
+    """
+    cuadrícula = []
+    with open(nombre_archivo, 'r', encoding='utf-8') as f:
+        for numero, linea in enumerate(f, start=1):
+            linea = linea.strip().upper()
+            if not linea:
+                continue
+            fila = linea.split() if ' ' in linea else list(linea)
+            if any(len(letra) > 1 for letra in fila):
+                raise ValueError(
+                    f"La línea {numero} de '{nombre_archivo}' tiene celdas de más de una letra"
+                )
+            cuadrícula.append(fila)
+
+    if any(len(fila) != len(cuadrícula[0]) for fila in cuadrícula):
+        raise ValueError(f"Las filas de '{nombre_archivo}' no tienen todas la misma longitud")
+    return cuadrícula
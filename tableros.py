@@ -0,0 +1,755 @@
+"""
+Representaciones de la cuadrícula de la sopa de letras.
+
+Cada tablero guarda las letras colocadas y sabe comprobar, escribir y
+enumerar posiciones de palabras. El generador trabaja siempre a través de
+esta interfaz, de modo que el almacenamiento puede cambiarse sin tocarlo.
+"""
+
+import bisect
+import random
+import re
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Pattern, Tuple
+
+# NumPy es opcional y tarda en importarse: solo se carga al crear un TableroNumpy
+np = None
+as_strided = None
+
+
+def _cargar_numpy() -> None:
+    """
+    Importa NumPy la primera vez que se necesita.
+
+    Raises:
+        ImportError: Si NumPy no está instalado
+    """
+    global np, as_strided
+    if np is not None:
+        return
+    try:
+        import numpy
+        from numpy.lib.stride_tricks import as_strided as _as_strided
+    except ImportError:
+        raise ImportError(
+            "El backend 'numpy' requiere NumPy. Instálalo con: pip install numpy"
+        ) from None
+    np, as_strided = numpy, _as_strided
+
+
+class TableroBase:
+    """
+    Interfaz común de los tableros.
+
+    Attributes:
+        tamaño: Tamaño de la cuadrícula (NxN)
+        simbolos: Letras que pueden aparecer en la cuadrícula
+        version: Contador de escrituras; cambia cada vez que se escribe o
+            vacía alguna celda
+    """
+
+    def __init__(self, tamaño: int, simbolos: str):
+        """
+        Inicializa un tablero vacío.
+
+        Args:
+            tamaño: Tamaño de la cuadrícula
+            simbolos: Letras que pueden aparecer (alfabeto de relleno primero)
+        """
+        self.tamaño = tamaño
+        self.simbolos = simbolos
+        self.version = 0
+
+    def _rango_inicio(self, longitud: int, delta: int) -> range:
+        """
+        Calcula el rango de índices iniciales válidos para un eje.
+
+        Args:
+            longitud: Longitud de la palabra
+            delta: Incremento por letra en ese eje (-1, 0 o 1)
+
+        Returns:
+            Rango de índices donde la palabra no se sale de la cuadrícula
+        """
+        if delta > 0:
+            return range(0, self.tamaño - longitud + 1)
+        if delta < 0:
+            return range(longitud - 1, self.tamaño)
+        return range(self.tamaño)
+
+    def rangos_inicio(self, longitud: int, delta_fila: int, delta_col: int) -> Tuple[range, range]:
+        """
+        Filas y columnas iniciales con las que una palabra no se sale de la cuadrícula.
+
+        Args:
+            longitud: Longitud de la palabra
+            delta_fila: Incremento de fila por cada letra
+            delta_col: Incremento de columna por cada letra
+
+        Returns:
+            Tupla (rango de filas, rango de columnas)
+        """
+        return self._rango_inicio(longitud, delta_fila), self._rango_inicio(longitud, delta_col)
+
+    def celda(self, fila: int, col: int) -> str:
+        """Devuelve la letra de una celda ('' si está vacía)."""
+        raise NotImplementedError
+
+    def puede_colocar(
+        self, palabra: str, fila: int, col: int, delta_fila: int, delta_col: int
+    ) -> bool:
+        """Indica si la palabra cabe en la posición sin contradecir letras."""
+        raise NotImplementedError
+
+    def colocar(
+        self, palabra: str, fila: int, col: int, delta_fila: int, delta_col: int
+    ) -> List[Tuple[int, int]]:
+        """Escribe la palabra y devuelve las posiciones que ocupa."""
+        raise NotImplementedError
+
+    def vaciar(self, celdas: List[Tuple[int, int]]) -> None:
+        """Deja vacías las celdas indicadas."""
+        raise NotImplementedError
+
+    def asignar(self, fila: int, col: int, letra: str) -> None:
+        """Escribe una letra en una celda."""
+        raise NotImplementedError
+
+    def rellenar(self, alfabeto: str, rng: random.Random) -> None:
+        """Rellena las celdas vacías con letras del alfabeto elegidas con `rng`."""
+        raise NotImplementedError
+
+    def filas(self) -> List[List[str]]:
+        """Devuelve la cuadrícula como lista de listas de letras."""
+        raise NotImplementedError
+
+    def inicios_validos(
+        self, palabra: str, delta_fila: int, delta_col: int
+    ) -> Sequence[Tuple[int, int]]:
+        """
+        Enumera las celdas iniciales donde la palabra puede colocarse.
+
+        Args:
+            palabra: Palabra a colocar
+            delta_fila: Incremento de fila por cada letra
+            delta_col: Incremento de columna por cada letra
+
+        Returns:
+            Secuencia de posiciones (fila, columna) iniciales válidas, en
+            orden de filas y columnas; puede ser perezosa (admite len e
+            índices)
+        """
+        longitud = len(palabra)
+        return [
+            (fila, col)
+            for fila in self._rango_inicio(longitud, delta_fila)
+            for col in self._rango_inicio(longitud, delta_col)
+            if self.puede_colocar(palabra, fila, col, delta_fila, delta_col)
+        ]
+
+
+class TableroLista(TableroBase):
+    """
+    Tablero basado en listas de listas de caracteres.
+
+    Attributes:
+        cuadrícula: Matriz de letras; '' representa una celda vacía
+    """
+
+    def __init__(self, tamaño: int, simbolos: str):
+        super().__init__(tamaño, simbolos)
+        self.cuadrícula = [['' for _ in range(tamaño)] for _ in range(tamaño)]
+
+    def celda(self, fila: int, col: int) -> str:
+        return self.cuadrícula[fila][col]
+
+    def puede_colocar(
+        self, palabra: str, fila: int, col: int, delta_fila: int, delta_col: int
+    ) -> bool:
+        for i in range(len(palabra)):
+            r = fila + i * delta_fila
+            c = col + i * delta_col
+            if self.cuadrícula[r][c] not in ('', palabra[i]):
+                return False
+        return True
+
+    def colocar(
+        self, palabra: str, fila: int, col: int, delta_fila: int, delta_col: int
+    ) -> List[Tuple[int, int]]:
+        self.version += 1
+        posiciones = []
+        for i in range(len(palabra)):
+            r = fila + i * delta_fila
+            c = col + i * delta_col
+            self.cuadrícula[r][c] = palabra[i]
+            posiciones.append((r, c))
+        return posiciones
+
+    def vaciar(self, celdas: List[Tuple[int, int]]) -> None:
+        self.version += 1
+        for fila, col in celdas:
+            self.cuadrícula[fila][col] = ''
+
+    def asignar(self, fila: int, col: int, letra: str) -> None:
+        self.version += 1
+        self.cuadrícula[fila][col] = letra
+
+    def rellenar(self, alfabeto: str, rng: random.Random) -> None:
+        self.version += 1
+        for fila in range(self.tamaño):
+            for col in range(self.tamaño):
+                if self.cuadrícula[fila][col] == '':
+                    self.cuadrícula[fila][col] = rng.choice(alfabeto)
+
+    def filas(self) -> List[List[str]]:
+        return self.cuadrícula
+
+
+# Sentido directo de cada eje (filas, columnas y las dos diagonales); las
+# orientaciones inversas se comprueban como la palabra invertida en el
+# sentido directo
+EJES = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+
+def _sentido_directo(palabra: str, delta_fila: int, delta_col: int) -> Tuple[Tuple[int, int], str, int]:
+    """
+    Lleva una orientación a su sentido directo.
+
+    Returns:
+        Tupla (eje, palabra en ese sentido, letras desde el inicio del
+        tramo hasta la primera letra de la palabra)
+    """
+    if (delta_fila, delta_col) in EJES:
+        return (delta_fila, delta_col), palabra, 0
+    return (-delta_fila, -delta_col), palabra[::-1], len(palabra) - 1
+
+
+class _IniciosPorFilas(Sequence):
+    """
+    Inicios válidos guardados como una máscara de columnas por fila.
+
+    Se comporta como la lista de posiciones en orden de filas, pero solo
+    construye las tuplas que se piden: contar cuesta una pasada por las
+    filas y acceder a la posición k, recorrer una fila.
+    """
+
+    def __init__(self, mascaras: List[Tuple[int, int]], desplazamiento: Tuple[int, int]):
+        """
+        Args:
+            mascaras: Pares (fila, máscara de columnas) con máscara no nula
+            desplazamiento: Suma a aplicar a cada (fila, columna) del bit
+        """
+        self._mascaras = mascaras
+        self._desplazamiento = desplazamiento
+        self._acumulados = []
+        total = 0
+        for _, mascara in mascaras:
+            total += bin(mascara).count('1')
+            self._acumulados.append(total)
+
+    def __len__(self) -> int:
+        return self._acumulados[-1] if self._acumulados else 0
+
+    def __getitem__(self, indice: int) -> Tuple[int, int]:
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("índice de inicio fuera de rango")
+        posicion = bisect.bisect_right(self._acumulados, indice)
+        fila, mascara = self._mascaras[posicion]
+        resto = indice - (self._acumulados[posicion - 1] if posicion else 0)
+        for _ in range(resto):
+            mascara &= mascara - 1  # Quitar el bit más bajo
+        col = (mascara & -mascara).bit_length() - 1
+        return fila + self._desplazamiento[0], col + self._desplazamiento[1]
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        delta_fila, delta_col = self._desplazamiento
+        for fila, mascara in self._mascaras:
+            fila += delta_fila
+            for col, bit in enumerate(bin(mascara)[:1:-1]):  # bit 0 primero
+                if bit == '1':
+                    yield fila, col + delta_col
+
+
+class TableroBitboard(TableroLista):
+    """
+    Tablero de listas que además mantiene máscaras de bits por fila.
+
+    Cada fila tiene un entero con un bit por celda ocupada y, por cada
+    letra, otro con las celdas que la contienen. Una letra puede ir en una
+    celda si está libre o ya la tiene, así que sus celdas permitidas son
+    `libres | letra`. Para una palabra, la máscara de inicios válidos de la
+    fila f es el AND de las permitidas de cada letra i en la fila por la
+    que pasa (f en horizontal, f + i en el resto), desplazadas i columnas
+    según la orientación. Así cada fila se resuelve con unas pocas
+    operaciones sobre enteros en vez de comprobar celda a celda cada
+    candidato, y columnas y diagonales no necesitan máscaras propias.
+
+    inicios_validos devuelve una secuencia perezosa en el mismo orden que
+    TableroLista, de modo que una semilla da la misma sopa con ambos.
+    """
+
+    def __init__(self, tamaño: int, simbolos: str):
+        super().__init__(tamaño, simbolos)
+        self._completa = (1 << tamaño) - 1
+        self._ocupadas = [0] * tamaño
+        # letra -> máscara de cada fila
+        self._letras: Dict[str, List[int]] = {}
+
+    def _marcar(self, fila: int, col: int, letra: str, ocupar: bool) -> None:
+        """Pone o quita la celda en las máscaras de su fila."""
+        mascaras = self._letras.get(letra)
+        if mascaras is None:
+            mascaras = self._letras[letra] = [0] * self.tamaño
+        if ocupar:
+            self._ocupadas[fila] |= 1 << col
+            mascaras[fila] |= 1 << col
+        else:
+            self._ocupadas[fila] &= ~(1 << col)
+            mascaras[fila] &= ~(1 << col)
+
+    def _permitidas(self, letra: str, fila: int) -> int:
+        """Columnas de la fila donde puede ir la letra."""
+        libres = ~self._ocupadas[fila] & self._completa
+        mascaras = self._letras.get(letra)
+        return libres | mascaras[fila] if mascaras else libres
+
+    def _validas(self, palabra: str, fila: int, eje: Tuple[int, int], columnas: int) -> int:
+        """
+        Filtra las columnas iniciales de una fila en las que cabe la palabra.
+
+        Args:
+            palabra: Palabra en el sentido directo del eje
+            fila: Fila de la primera letra
+            eje: Sentido directo (ver EJES)
+            columnas: Máscara de columnas iniciales candidatas
+
+        Returns:
+            Máscara de las columnas iniciales válidas
+        """
+        paso_fila, paso_col = eje
+        for i, letra in enumerate(palabra):
+            permitidas = self._permitidas(letra, fila + i * paso_fila)
+            if paso_col > 0:
+                permitidas >>= i
+            elif paso_col < 0:
+                permitidas <<= i
+            columnas &= permitidas
+            if not columnas:
+                break
+        return columnas
+
+    def puede_colocar(
+        self, palabra: str, fila: int, col: int, delta_fila: int, delta_col: int
+    ) -> bool:
+        eje, directa, ajuste = _sentido_directo(palabra, delta_fila, delta_col)
+        fila -= ajuste * eje[0]
+        col -= ajuste * eje[1]
+        return bool(self._validas(directa, fila, eje, 1 << col))
+
+    def colocar(
+        self, palabra: str, fila: int, col: int, delta_fila: int, delta_col: int
+    ) -> List[Tuple[int, int]]:
+        self.version += 1
+        posiciones = []
+        for i, letra in enumerate(palabra):
+            r = fila + i * delta_fila
+            c = col + i * delta_col
+            if self.cuadrícula[r][c] != letra:
+                self.cuadrícula[r][c] = letra
+                self._marcar(r, c, letra, True)
+            posiciones.append((r, c))
+        return posiciones
+
+    def vaciar(self, celdas: List[Tuple[int, int]]) -> None:
+        self.version += 1
+        for fila, col in celdas:
+            letra = self.cuadrícula[fila][col]
+            if letra != '':
+                self._marcar(fila, col, letra, False)
+                self.cuadrícula[fila][col] = ''
+
+    def asignar(self, fila: int, col: int, letra: str) -> None:
+        self.version += 1
+        anterior = self.cuadrícula[fila][col]
+        if anterior == letra:
+            return
+        if anterior != '':
+            self._marcar(fila, col, anterior, False)
+        self.cuadrícula[fila][col] = letra
+        if letra != '':
+            self._marcar(fila, col, letra, True)
+
+    def rellenar(self, alfabeto: str, rng: random.Random) -> None:
+        for fila in range(self.tamaño):
+            for col in range(self.tamaño):
+                if self.cuadrícula[fila][col] == '':
+                    self.asignar(fila, col, rng.choice(alfabeto))
+
+    def inicios_validos(
+        self, palabra: str, delta_fila: int, delta_col: int
+    ) -> Sequence[Tuple[int, int]]:
+        eje, directa, ajuste = _sentido_directo(palabra, delta_fila, delta_col)
+        longitud = len(palabra)
+        if longitud > self.tamaño:
+            return _IniciosPorFilas([], (0, 0))
+
+        # Columnas donde el tramo no se sale de la cuadrícula
+        if eje[1] > 0:
+            columnas = (1 << (self.tamaño - longitud + 1)) - 1
+        elif eje[1] < 0:
+            columnas = self._completa & ~((1 << (longitud - 1)) - 1)
+        else:
+            columnas = self._completa
+        filas = self.tamaño - (longitud - 1) * eje[0]
+
+        mascaras = []
+        for fila in range(filas):
+            validas = self._validas(directa, fila, eje, columnas)
+            if validas:
+                mascaras.append((fila, validas))
+        return _IniciosPorFilas(mascaras, (ajuste * eje[0], ajuste * eje[1]))
+
+
+# Marca de celda vacía en los patrones de línea (no aparece en ninguna palabra)
+VACIA = '\x00'
+
+
+@lru_cache(maxsize=1024)
+def _patron_palabra(palabra: str) -> Pattern:
+    """
+    Compila el patrón que reconoce los tramos donde cabe una palabra.
+
+    Cada letra admite su propio carácter o una celda vacía, y todo va dentro
+    de una búsqueda anticipada para encontrar también los tramos solapados.
+    """
+    clases = ''.join(f'[{re.escape(letra)}{VACIA}]' for letra in palabra)
+    return re.compile(f'(?={clases})')
+
+
+def _linea_de_celda(eje: Tuple[int, int], fila: int, col: int, tamaño: int) -> Tuple[int, int]:
+    """Línea del eje que pasa por la celda y posición de la celda en ella."""
+    if eje == (0, 1):
+        return fila, col
+    if eje == (1, 0):
+        return col, fila
+    if eje == (1, 1):
+        return col - fila + tamaño - 1, min(fila, col)
+    return fila + col, fila - max(0, fila + col - tamaño + 1)
+
+
+def _primera_celda(eje: Tuple[int, int], linea: int, tamaño: int) -> Tuple[int, int]:
+    """Celda de la posición 0 de una línea; la posición p está p pasos más allá."""
+    if eje == (0, 1):
+        return linea, 0
+    if eje == (1, 0):
+        return 0, linea
+    if eje == (1, 1):
+        desplazamiento = linea - (tamaño - 1)
+        return max(0, -desplazamiento), max(0, desplazamiento)
+    fila = max(0, linea - tamaño + 1)
+    return fila, linea - fila
+
+
+class _IniciosPorLineas(Sequence):
+    """
+    Inicios válidos de una orientación, línea a línea.
+
+    Guarda el texto de cada línea con algún tramo válido y cuántos tiene
+    (contados con findall, sin crear objetos por coincidencia); las
+    posiciones solo se calculan al pedirlas, recorriendo la línea que toca.
+    Las líneas vacías se guardan sin texto: en ellas vale cualquier posición.
+    """
+
+    def __init__(
+        self,
+        patron: Pattern,
+        lineas: List[Tuple[Optional[str], Tuple[int, int], int]],
+        eje: Tuple[int, int],
+        ajuste: int
+    ):
+        """
+        Args:
+            patron: Patrón de la palabra en el sentido directo del eje
+            lineas: Tuplas (texto o None si está vacía, primera celda,
+                tramos válidos)
+            eje: Sentido directo de las líneas
+            ajuste: Letras desde el inicio del tramo hasta la primera letra
+        """
+        self._patron = patron
+        self._lineas = lineas
+        self._eje = eje
+        self._ajuste = ajuste
+        self._acumulados = []
+        total = 0
+        for _, _, cantidad in lineas:
+            total += cantidad
+            self._acumulados.append(total)
+
+    def __len__(self) -> int:
+        return self._acumulados[-1] if self._acumulados else 0
+
+    def _celda(self, primera: Tuple[int, int], posicion: int) -> Tuple[int, int]:
+        posicion += self._ajuste
+        return primera[0] + posicion * self._eje[0], primera[1] + posicion * self._eje[1]
+
+    def __getitem__(self, indice: int) -> Tuple[int, int]:
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("índice de inicio fuera de rango")
+        numero = bisect.bisect_right(self._acumulados, indice)
+        texto, primera, _ = self._lineas[numero]
+        resto = indice - (self._acumulados[numero - 1] if numero else 0)
+        if texto is None:
+            return self._celda(primera, resto)
+        for i, coincidencia in enumerate(self._patron.finditer(texto)):
+            if i == resto:
+                return self._celda(primera, coincidencia.start())
+        raise IndexError("índice de inicio fuera de rango")
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        for texto, primera, cantidad in self._lineas:
+            if texto is None:
+                for posicion in range(cantidad):
+                    yield self._celda(primera, posicion)
+                continue
+            for coincidencia in self._patron.finditer(texto):
+                yield self._celda(primera, coincidencia.start())
+
+
+class TableroLineas(TableroLista):
+    """
+    Tablero de listas que además guarda cada línea como texto.
+
+    Cada fila, columna y diagonal se mantiene como una cadena con la letra
+    de cada celda o VACIA. Los tramos donde cabe una palabra son las
+    coincidencias de un único patrón compilado (ver _patron_palabra), así
+    que encontrarlos cuesta una búsqueda por línea en C en lugar de una
+    comprobación por celda inicial y letra. Al escribir una celda solo se
+    reescriben las cuatro líneas que pasan por ella.
+
+    Los inicios se devuelven línea a línea: con la misma semilla la sopa es
+    reproducible, pero distinta de la de TableroLista.
+    """
+
+    def __init__(self, tamaño: int, simbolos: str):
+        super().__init__(tamaño, simbolos)
+        self._lineas = {
+            eje: [VACIA * tamaño] * tamaño if eje[0] == 0 or eje[1] == 0 else [
+                VACIA * (tamaño - abs(linea - (tamaño - 1))) for linea in range(2 * tamaño - 1)
+            ]
+            for eje in EJES
+        }
+
+    def _escribir(self, fila: int, col: int, letra: str) -> None:
+        """Escribe la celda en la cuadrícula y en sus cuatro líneas."""
+        self.cuadrícula[fila][col] = letra
+        caracter = letra or VACIA
+        for eje, lineas in self._lineas.items():
+            linea, posicion = _linea_de_celda(eje, fila, col, self.tamaño)
+            texto = lineas[linea]
+            lineas[linea] = texto[:posicion] + caracter + texto[posicion + 1:]
+
+    def puede_colocar(
+        self, palabra: str, fila: int, col: int, delta_fila: int, delta_col: int
+    ) -> bool:
+        eje, directa, ajuste = _sentido_directo(palabra, delta_fila, delta_col)
+        linea, posicion = _linea_de_celda(
+            eje, fila - ajuste * eje[0], col - ajuste * eje[1], self.tamaño
+        )
+        return _patron_palabra(directa).match(self._lineas[eje][linea], posicion) is not None
+
+    def colocar(
+        self, palabra: str, fila: int, col: int, delta_fila: int, delta_col: int
+    ) -> List[Tuple[int, int]]:
+        self.version += 1
+        posiciones = []
+        for i, letra in enumerate(palabra):
+            r = fila + i * delta_fila
+            c = col + i * delta_col
+            if self.cuadrícula[r][c] != letra:
+                self._escribir(r, c, letra)
+            posiciones.append((r, c))
+        return posiciones
+
+    def vaciar(self, celdas: List[Tuple[int, int]]) -> None:
+        self.version += 1
+        for fila, col in celdas:
+            if self.cuadrícula[fila][col] != '':
+                self._escribir(fila, col, '')
+
+    def asignar(self, fila: int, col: int, letra: str) -> None:
+        self.version += 1
+        if self.cuadrícula[fila][col] != letra:
+            self._escribir(fila, col, letra)
+
+    def rellenar(self, alfabeto: str, rng: random.Random) -> None:
+        super().rellenar(alfabeto, rng)
+        # Reconstruir las líneas de una vez en lugar de celda a celda
+        for eje in EJES:
+            lineas = self._lineas[eje]
+            for linea in range(len(lineas)):
+                fila, col = _primera_celda(eje, linea, self.tamaño)
+                lineas[linea] = ''.join(
+                    self.cuadrícula[fila + i * eje[0]][col + i * eje[1]]
+                    for i in range(len(lineas[linea]))
+                )
+
+    def inicios_validos(
+        self, palabra: str, delta_fila: int, delta_col: int
+    ) -> Sequence[Tuple[int, int]]:
+        eje, directa, ajuste = _sentido_directo(palabra, delta_fila, delta_col)
+        patron = _patron_palabra(directa)
+        longitud = len(palabra)
+
+        lineas = []
+        for linea, texto in enumerate(self._lineas[eje]):
+            if len(texto) < longitud:
+                continue
+            if not texto.strip(VACIA):
+                # Línea vacía: la palabra cabe en todas las posiciones
+                lineas.append((None, _primera_celda(eje, linea, self.tamaño),
+                               len(texto) - longitud + 1))
+                continue
+            cantidad = len(patron.findall(texto))
+            if cantidad:
+                lineas.append((texto, _primera_celda(eje, linea, self.tamaño), cantidad))
+        return _IniciosPorLineas(patron, lineas, eje, ajuste)
+
+
+class TableroNumpy(TableroBase):
+    """
+    Tablero compacto sobre un arreglo `uint8` de NumPy.
+
+    Cada celda guarda el índice de su letra en `simbolos` más uno, y 0
+    representa una celda vacía. Las comprobaciones y escrituras recorren la
+    palabra con un único corte con paso sobre el arreglo aplanado, y la
+    enumeración de posiciones evalúa todas las ventanas de una orientación
+    a la vez.
+
+    Attributes:
+        matriz: Arreglo (tamaño, tamaño) de códigos de letra
+    """
+
+    def __init__(self, tamaño: int, simbolos: str):
+        _cargar_numpy()
+        if len(simbolos) > 255:
+            raise ValueError("El backend 'numpy' admite como máximo 255 letras distintas")
+        super().__init__(tamaño, simbolos)
+        self.matriz = np.zeros((tamaño, tamaño), dtype=np.uint8)
+        self._codigos = {letra: i + 1 for i, letra in enumerate(simbolos)}
+        self._letras = np.array([''] + list(simbolos), dtype=object)
+
+    def _codificar(self, palabra: str):
+        return np.fromiter((self._codigos[letra] for letra in palabra), dtype=np.uint8)
+
+    def _segmento(self, fila: int, col: int, delta_fila: int, delta_col: int, longitud: int):
+        """Vista del arreglo aplanado que recorre la palabra con un solo paso."""
+        paso = delta_fila * self.tamaño + delta_col
+        inicio = fila * self.tamaño + col
+        fin = inicio + paso * longitud
+        plano = self.matriz.reshape(-1)
+        return plano[inicio:fin if fin >= 0 else None:paso]
+
+    def celda(self, fila: int, col: int) -> str:
+        return self._letras[self.matriz[fila, col]]
+
+    def puede_colocar(
+        self, palabra: str, fila: int, col: int, delta_fila: int, delta_col: int
+    ) -> bool:
+        segmento = self._segmento(fila, col, delta_fila, delta_col, len(palabra))
+        codigos = self._codificar(palabra)
+        return bool(((segmento == 0) | (segmento == codigos)).all())
+
+    def colocar(
+        self, palabra: str, fila: int, col: int, delta_fila: int, delta_col: int
+    ) -> List[Tuple[int, int]]:
+        self.version += 1
+        segmento = self._segmento(fila, col, delta_fila, delta_col, len(palabra))
+        segmento[:] = self._codificar(palabra)
+        return [(fila + i * delta_fila, col + i * delta_col) for i in range(len(palabra))]
+
+    def vaciar(self, celdas: List[Tuple[int, int]]) -> None:
+        self.version += 1
+        if celdas:
+            filas, cols = zip(*celdas)
+            self.matriz[list(filas), list(cols)] = 0
+
+    def asignar(self, fila: int, col: int, letra: str) -> None:
+        self.version += 1
+        self.matriz[fila, col] = self._codigos[letra]
+
+    def rellenar(self, alfabeto: str, rng: random.Random) -> None:
+        self.version += 1
+        # Las letras del alfabeto ocupan los primeros códigos de `simbolos`
+        vacias = self.matriz == 0
+        generador = np.random.default_rng(rng.getrandbits(64))
+        self.matriz[vacias] = generador.integers(
+            1, len(alfabeto) + 1, size=int(vacias.sum()), dtype=np.uint8
+        )
+
+    def filas(self) -> List[List[str]]:
+        return self._letras[self.matriz].tolist()
+
+    def inicios_validos(
+        self, palabra: str, delta_fila: int, delta_col: int
+    ) -> List[Tuple[int, int]]:
+        # Las orientaciones inversas se evalúan como la palabra invertida en
+        # la orientación directa; el inicio real es el final de la ventana.
+        inversa = delta_fila < 0 or delta_col < 0
+        paso_fila, paso_col = (-delta_fila, -delta_col) if inversa else (delta_fila, delta_col)
+        codigos = self._codificar(palabra[::-1] if inversa else palabra)
+
+        longitud = len(palabra)
+        alto = self.tamaño - (longitud - 1) * paso_fila
+        ancho = self.tamaño - (longitud - 1) * paso_col
+        if alto <= 0 or ancho <= 0:
+            return []
+
+        salto_fila, salto_col = self.matriz.strides
+        ventanas = as_strided(
+            self.matriz,
+            shape=(alto, ancho, longitud),
+            strides=(salto_fila, salto_col, paso_fila * salto_fila + paso_col * salto_col),
+            writeable=False
+        )
+        validas = ((ventanas == 0) | (ventanas == codigos)).all(axis=2)
+        filas, cols = np.nonzero(validas)
+        if inversa:
+            filas = filas + (longitud - 1) * paso_fila
+            cols = cols + (longitud - 1) * paso_col
+        return list(zip(filas.tolist(), cols.tolist()))
+
+
+# Tableros disponibles por nombre de backend
+TABLEROS = {
+    'lista': TableroLista,
+    'numpy': TableroNumpy,
+    'bitboard': TableroBitboard,
+    'lineas': TableroLineas,
+}
+
+
+def crear_tablero(backend: str, tamaño: int, simbolos: str) -> TableroBase:
+    """
+    Crea un tablero vacío del backend indicado.
+
+    Args:
+        backend: Nombre del backend (ver TABLEROS)
+        tamaño: Tamaño de la cuadrícula
+        simbolos: Letras que pueden aparecer en la cuadrícula
+
+    Returns:
+        Instancia del tablero
+
+    Raises:
+        ValueError: Si el backend no existe
+    """
+    if backend not in TABLEROS:
+        raise ValueError(
+            f"Backend '{backend}' no válido. Opciones: {', '.join(TABLEROS)}"
+        )
+    return TABLEROS[backend](tamaño, simbolos)
@@ -0,0 +1,87 @@
+"""
+Tests unitarios para la caché en disco de sopas de letras.
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+import time
+
+# Agregar el directorio padre al path para poder importar los módulos
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from cache_sopas import CacheSopas
+
+
+class TestCacheSopas(unittest.TestCase):
+    """Tests para la clase CacheSopas."""
+
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.cache = CacheSopas(self.directorio.name)
+        self.parametros = dict(palabras=["PYTHON", "CODIGO", "TEST"], tamaño=10, semilla=5)
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def test_segunda_peticion_es_acierto(self):
+        """Test: La misma petición se sirve desde la caché sin cambios."""
+        generador, contenido, acierto = self.cache.obtener('png', **self.parametros)
+        self.assertFalse(acierto)
+        repetido, contenido_repetido, acierto = self.cache.obtener('png', **self.parametros)
+        self.assertTrue(acierto)
+        self.assertEqual(contenido_repetido, contenido)
+        self.assertEqual(repetido.cuadrícula, generador.cuadrícula)
+        self.assertEqual(repetido.palabras_colocadas, generador.palabras_colocadas)
+        self.assertEqual(self.cache.contadores['aciertos'], 1)
+        self.assertEqual(self.cache.contadores['fallos'], 1)
+
+    def test_opciones_distintas_son_claves_distintas(self):
+        """Test: Cambiar el formato o las opciones de dibujo no reutiliza la entrada."""
+        self.cache.obtener('png', **self.parametros)
+        _, contenido, acierto = self.cache.obtener('svg', **self.parametros)
+        self.assertFalse(acierto)
+        self.assertTrue(contenido.startswith(b'<?xml') or b'<svg' in contenido)
+        _, _, acierto = self.cache.obtener('png', {'mostrar_palabras': False}, **self.parametros)
+        self.assertFalse(acierto)
+
+    def test_sin_semilla_no_se_cachea(self):
+        """Test: Las sopas sin semilla siempre se generan de nuevo."""
+        parametros = dict(self.parametros, semilla=None)
+        self.cache.obtener('png', **parametros)
+        _, _, acierto = self.cache.obtener('png', **parametros)
+        self.assertFalse(acierto)
+        self.assertEqual(self.cache.contadores['escrituras'], 0)
+
+    def test_desalojo_por_tamaño_borra_las_menos_usadas(self):
+        """Test: Al superar max_bytes se borran primero las entradas más antiguas."""
+        for clave in ('a1', 'b2', 'c3'):
+            self.cache.guardar(clave, {}, b'x' * 100)
+        antigua = os.path.join(self.directorio.name, 'a1', 'a1' + CacheSopas.EXTENSION)
+        os.utime(antigua, (time.time() - 100, time.time() - 100))
+        self.cache.max_bytes = 250
+        self.assertEqual(self.cache.desalojar(), 1)
+        self.assertIsNone(self.cache.leer('a1'))
+        self.assertIsNotNone(self.cache.leer('c3'))
+
+    def test_desalojo_por_edad(self):
+        """Test: Las entradas sin usar más de max_edad se borran."""
+        self.cache.guardar('d4', {}, b'datos')
+        ruta = os.path.join(self.directorio.name, 'd4', 'd4' + CacheSopas.EXTENSION)
+        os.utime(ruta, (time.time() - 1000, time.time() - 1000))
+        self.cache.max_edad = 10
+        self.cache.desalojar()
+        self.assertIsNone(self.cache.leer('d4'))
+
+    def test_entrada_dañada_es_fallo(self):
+        """Test: Una entrada truncada se trata como inexistente."""
+        self.cache.guardar('e5', {}, b'contenido completo')
+        ruta = os.path.join(self.directorio.name, 'e5', 'e5' + CacheSopas.EXTENSION)
+        with open(ruta, 'r+b') as f:
+            f.truncate(os.path.getsize(ruta) - 3)
+        self.assertIsNone(self.cache.leer('e5'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+"""
+Tests unitarios para las métricas de calidad de las sopas de letras.
+"""
+
+import unittest
+import os
+import sys
+from functools import partial
+
+# Agregar el directorio padre al path para poder importar los módulos
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from calidad import METRICAS, dispersion, invertidas, puntuar, variedad_orientaciones
+from config import Config
+from word_search_generator import Colocacion, WordSearchGenerator
+
+
+def _sopa(colocaciones, orientaciones=None, permitir_inversa=False, tamaño=8):
+    """Crea un generador con las palabras colocadas a mano."""
+    generador = WordSearchGenerator(
+        list(colocaciones), tamaño=tamaño,
+        orientaciones=orientaciones, permitir_inversa=permitir_inversa
+    )
+    generador.palabras_colocadas = dict(colocaciones)
+    return generador
+
+
+class TestMetricas(unittest.TestCase):
+    """Tests para las métricas de calidad."""
+
+    def test_orientaciones_repartidas_puntuan_uno(self):
+        """Test: Una palabra por orientación permitida da la máxima variedad."""
+        generador = _sopa({
+            'SOL': Colocacion(0, 0, 0, 1, 3, False),
+            'MAR': Colocacion(2, 0, 1, 0, 3, False),
+        })
+        self.assertAlmostEqual(variedad_orientaciones(generador), 1.0)
+
+    def test_orientacion_unica_puntua_cero(self):
+        """Test: Todas las palabras en la misma orientación dan variedad 0."""
+        generador = _sopa({
+            'SOL': Colocacion(0, 0, 0, 1, 3, False),
+            'MAR': Colocacion(2, 0, 0, 1, 3, False),
+        })
+        self.assertEqual(variedad_orientaciones(generador), 0.0)
+
+    def test_dispersion_penaliza_una_esquina(self):
+        """Test: Las palabras apiñadas en un cuadrante puntúan menos que repartidas."""
+        esquina = _sopa({
+            'SOL': Colocacion(0, 0, 0, 1, 3, False),
+            'MAR': Colocacion(1, 0, 0, 1, 3, False),
+        })
+        repartida = _sopa({
+            'SOL': Colocacion(0, 0, 0, 1, 3, False),
+            'MAR': Colocacion(7, 5, 0, 1, 3, False),
+            'LUZ': Colocacion(0, 7, 1, 0, 3, False),
+            'PAN': Colocacion(5, 0, 1, 0, 3, False),
+        })
+        self.assertEqual(dispersion(esquina), 0.0)
+        self.assertAlmostEqual(dispersion(repartida), 1.0)
+
+    def test_invertidas_respecto_al_objetivo(self):
+        """Test: La métrica baja a medida que se aleja del objetivo."""
+        generador = _sopa({
+            'SOL': Colocacion(0, 0, 0, 1, 3, True),
+            'MAR': Colocacion(2, 0, 0, 1, 3, False),
+            'LUZ': Colocacion(4, 0, 0, 1, 3, False),
+        }, permitir_inversa=True)
+        self.assertEqual(invertidas(generador, objetivo=1), 1.0)
+        self.assertAlmostEqual(invertidas(generador, objetivo=3), 1 / 3)
+        self.assertAlmostEqual(invertidas(generador, objetivo=0), 2 / 3)
+
+    def test_invertidas_sin_inversion_no_penaliza(self):
+        """Test: Si la sopa no admite palabras invertidas la métrica no aplica."""
+        generador = _sopa({'SOL': Colocacion(0, 0, 0, 1, 3, False)})
+        self.assertEqual(invertidas(generador, objetivo=1), 1.0)
+
+    def test_puntuar_promedia_las_metricas(self):
+        """Test: La puntuación total es la media de las métricas elegidas."""
+        generador = WordSearchGenerator(
+            ["PYTHON", "CODIGO", "TEST", "DATOS"], tamaño=10,
+            orientaciones=Config.ORIENTACIONES_AVANZADO, permitir_inversa=True, semilla=3
+        )
+        generador.generar()
+        metricas = {'dispersion': dispersion, 'invertidas': partial(invertidas, objetivo=0)}
+        total, detalle = puntuar(generador, metricas)
+        self.assertEqual(set(detalle), {'dispersion', 'invertidas'})
+        self.assertAlmostEqual(total, sum(detalle.values()) / 2)
+        total, detalle = puntuar(generador)
+        self.assertEqual(set(detalle), set(METRICAS))
+        for valor in detalle.values():
+            self.assertGreaterEqual(valor, 0.0)
+            self.assertLessEqual(valor, 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
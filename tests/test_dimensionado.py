@@ -0,0 +1,87 @@
+"""
+Tests unitarios para la elección automática del tamaño de cuadrícula.
+"""
+
+import unittest
+import json
+import os
+import sys
+import tempfile
+
+# Agregar el directorio padre al path para poder importar los módulos
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import dimensionado
+from dimensionado import clave_palabras, cota_inferior, elegir_tamaño
+from word_search_generator import WordSearchGenerator
+
+
+class TestCotaInferior(unittest.TestCase):
+    """Tests para la cota inferior del tamaño."""
+
+    def test_palabra_mas_larga(self):
+        """Test: La cuadrícula no puede ser menor que la palabra más larga."""
+        self.assertEqual(cota_inferior(['MARIPOSA', 'SOL']), 8)
+
+    def test_total_de_letras(self):
+        """Test: La cuadrícula debe tener al menos tantas celdas como letras."""
+        self.assertEqual(cota_inferior(['ABCD'] * 10), 7)
+
+    def test_solapamiento_parte_de_la_palabra_mas_larga(self):
+        """Test: Con empaquetado denso no se aplica la estimación por total de letras."""
+        self.assertEqual(cota_inferior(['ABCD'] * 10, maximizar_solapamiento=True), 4)
+
+
+class TestElegirTamaño(unittest.TestCase):
+    """Tests para la búsqueda del tamaño mínimo."""
+
+    def setUp(self):
+        dimensionado._TAMAÑOS_CONOCIDOS.clear()
+        self.palabras = ['PYTHON', 'CODIGO', 'SOPA', 'LETRAS', 'JUEGO']
+
+    def test_tamaño_elegido_genera(self):
+        """Test: El tamaño elegido admite las palabras."""
+        tamaño = elegir_tamaño(self.palabras)
+        self.assertGreaterEqual(tamaño, cota_inferior(self.palabras))
+        generador = WordSearchGenerator(tamaño=tamaño, palabras=self.palabras, semilla=0)
+        generador.generar()
+        self.assertEqual(len(generador.palabras_colocadas), len(self.palabras))
+
+    def test_solapamiento_permite_tamaños_bajo_la_estimacion(self):
+        """Test: Con empaquetado denso se prueban tamaños menores que √(total de letras)."""
+        palabras = ['ABCD', 'BCDA', 'CDAB', 'DABC', 'ABC', 'BCD', 'CDA', 'DAB', 'BCA']
+        tamaño = elegir_tamaño(palabras, maximizar_solapamiento=True)
+        self.assertLess(tamaño, cota_inferior(palabras))
+        self.assertGreaterEqual(tamaño, 4)
+
+    def test_sin_palabras(self):
+        """Test: Sin palabras no hay tamaño que elegir."""
+        with self.assertRaises(ValueError):
+            elegir_tamaño([])
+
+    def test_archivo_cache_evita_busqueda(self):
+        """Test: Un resultado guardado en disco se reutiliza sin buscar."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            archivo = os.path.join(tmpdir, 'tamaños.json')
+            tamaño = elegir_tamaño(self.palabras, archivo_cache=archivo)
+            with open(archivo, 'r', encoding='utf-8') as f:
+                guardados = json.load(f)
+            clave = clave_palabras(self.palabras, ['H', 'V'], False, 'aleatoria')
+            self.assertEqual(guardados[clave], tamaño)
+
+            # Un valor imposible de obtener buscando demuestra que se leyó del archivo
+            dimensionado._TAMAÑOS_CONOCIDOS.clear()
+            with open(archivo, 'w', encoding='utf-8') as f:
+                json.dump({clave: 99}, f)
+            self.assertEqual(elegir_tamaño(self.palabras, archivo_cache=archivo), 99)
+
+    def test_clave_independiente_del_orden(self):
+        """Test: El orden y las mayúsculas de las palabras no cambian la clave."""
+        self.assertEqual(
+            clave_palabras(['sol', 'LUNA'], ['H', 'V'], False, 'aleatoria'),
+            clave_palabras(['LUNA', 'SOL'], ['V', 'H'], False, 'aleatoria')
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,169 @@
+"""
+Tests unitarios para los exportadores vectoriales (SVG y PDF).
+"""
+
+import unittest
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import xml.etree.ElementTree as ET
+
+# Agregar el directorio padre al path para poder importar los módulos
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from word_search_generator import WordSearchGenerator
+from config import Config
+from exportadores_vectoriales import exportar_cuadernillo
+
+
+def verificar_referencias_pdf(datos: bytes) -> int:
+    """Comprueba la tabla xref de un PDF y devuelve el número de objetos."""
+    inicio_xref = int(re.search(rb"startxref\n(\d+)", datos).group(1))
+    cabecera = re.match(rb"xref\n0 (\d+)\n", datos[inicio_xref:])
+    total = int(cabecera.group(1))
+    entradas = datos[inicio_xref + cabecera.end():].split(b"\n")[:total]
+    for numero, entrada in enumerate(entradas[1:], start=1):
+        desplazamiento = int(entrada[:10])
+        assert datos.startswith(f"{numero} 0 obj".encode('ascii'), desplazamiento)
+    return total
+
+
+class TestExportadoresVectoriales(unittest.TestCase):
+    """Tests para exportar_svg y exportar_pdf."""
+
+    def setUp(self):
+        """Configuración antes de cada test."""
+        self.generador = WordSearchGenerator(
+            palabras=["NIÑO", "ESPAÑA", "PYTHON"],
+            tamaño=8,
+            alfabeto=Config.ALFABETO_ES,
+            semilla=1
+        )
+        self.generador.generar()
+        self.directorio = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Limpieza después de cada test."""
+        self.directorio.cleanup()
+
+    def ruta(self, nombre):
+        return os.path.join(self.directorio.name, nombre)
+
+    def test_exportar_svg(self):
+        """Test: El SVG es XML válido con una letra por celda."""
+        self.generador.exportar_svg(self.ruta('sopa.svg'))
+        raiz = ET.parse(self.ruta('sopa.svg')).getroot()
+        textos = [t.text for t in raiz.iter('{http://www.w3.org/2000/svg}text')]
+        self.assertEqual(len(textos), 8 * 8 + 3)
+        self.assertIn('[ ]   NIÑO', textos)
+
+    def test_exportar_pdf(self):
+        """Test: El PDF tiene una página y referencias cruzadas correctas."""
+        self.generador.exportar_pdf(self.ruta('sopa.pdf'))
+        with open(self.ruta('sopa.pdf'), 'rb') as f:
+            datos = f.read()
+        self.assertTrue(datos.startswith(b'%PDF-1.4'))
+        self.assertTrue(datos.endswith(b'%%EOF\n'))
+        self.assertIn(b'/Count 1', datos)
+        verificar_referencias_pdf(datos)
+
+    def test_pdf_acepta_los_colores_css_de_png_y_svg(self):
+        """Test: El PDF entiende nombres CSS no básicos y rgb()."""
+        self.generador.exportar_pdf(
+            self.ruta('sopa.pdf'), color_fondo='lightblue', color_lineas='rgb(200, 0, 0)'
+        )
+        with open(self.ruta('sopa.pdf'), 'rb') as f:
+            datos = f.read()
+        self.assertIn(b'0.678 0.847 0.902 rg', datos)
+        self.assertIn(b'0.784 0.000 0.000 RG', datos)
+        with self.assertRaises(ValueError):
+            self.generador.exportar_pdf(self.ruta('otra.pdf'), color_fondo='no-es-un-color')
+
+    def test_exportar_vectorial_no_importa_pillow(self):
+        """Test: Exportar SVG y PDF, también con soluciones, no carga Pillow."""
+        codigo = (
+            "import sys, io, os, tempfile\n"
+            "from word_search_generator import WordSearchGenerator\n"
+            "from exportadores_vectoriales import exportar_cuadernillo\n"
+            "g = WordSearchGenerator(['SOPA', 'LETRAS'], tamaño=8, semilla=1)\n"
+            "g.generar()\n"
+            "g.exportar(io.StringIO(), formato='svg')\n"
+            "with tempfile.TemporaryDirectory() as d:\n"
+            "    exportar_cuadernillo([g], os.path.join(d, 'c.pdf'))\n"
+            "print('PIL' in sys.modules)\n"
+        )
+        raiz = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+        salida = subprocess.run(
+            [sys.executable, '-c', codigo], cwd=raiz, capture_output=True, text=True, check=True
+        )
+        self.assertEqual(salida.stdout.split(), ['False'])
+
+    def test_tamaño_vectorial_no_depende_de_resolucion(self):
+        """Test: El tamaño del archivo apenas cambia con la resolución."""
+        self.generador.exportar_pdf(self.ruta('chico.pdf'), imagen_tamaño=300)
+        self.generador.exportar_pdf(self.ruta('grande.pdf'), imagen_tamaño=6000)
+        chico = os.path.getsize(self.ruta('chico.pdf'))
+        grande = os.path.getsize(self.ruta('grande.pdf'))
+        self.assertLess(grande, chico * 1.2)
+
+    def test_exportar_por_extension(self):
+        """Test: exportar elige el formato según la extensión."""
+        for formato in Config.FORMATOS_SALIDA:
+            self.generador.exportar(self.ruta(f'sopa.{formato}'))
+            self.assertTrue(os.path.exists(self.ruta(f'sopa.{formato}')))
+        with self.assertRaises(ValueError):
+            self.generador.exportar(self.ruta('sopa.gif'))
+
+    def test_cuadernillo_con_soluciones_al_final(self):
+        """Test: El cuadernillo tiene una página por sopa más las soluciones."""
+        generados = []
+
+        def sopas():
+            for semilla in range(5):
+                generador = WordSearchGenerator(palabras=["SOL", "LUNA"], tamaño=6, semilla=semilla)
+                generador.generar()
+                generados.append(semilla)
+                yield generador
+
+        total = exportar_cuadernillo(sopas(), self.ruta('cuadernillo.pdf'))
+        with open(self.ruta('cuadernillo.pdf'), 'rb') as f:
+            datos = f.read()
+
+        self.assertEqual(total, 5)
+        self.assertEqual(generados, list(range(5)))
+        self.assertIn(b'/Count 10', datos)
+        verificar_referencias_pdf(datos)
+
+        # Las páginas de soluciones van después de todas las sopas
+        hijos = re.search(rb"/Kids \[([^\]]*)\]", datos).group(1).split(b" 0 R")
+        paginas = [int(h) for h in hijos if h.strip()]
+        titulos = []
+        for pagina in paginas:
+            contenido = int(re.search(
+                rf"{pagina} 0 obj\n.*?/Contents (\d+) 0 R".encode('ascii'), datos, re.S
+            ).group(1))
+            inicio = datos.index(f"{contenido} 0 obj".encode('ascii'))
+            titulos.append(re.search(rb"\((Sopa de letras|Soluci)", datos[inicio:]).group(1))
+        self.assertEqual(titulos, [b'Sopa de letras'] * 5 + [b'Soluci'] * 5)
+
+    def test_cuadernillo_fallido_no_deja_archivo(self):
+        """Test: Si una sopa falla a medias no queda un PDF truncado."""
+        ruta = self.ruta('cuadernillo.pdf')
+        with open(ruta, 'wb') as f:
+            f.write(b'anterior')
+
+        def sopas():
+            yield self.generador
+            raise ValueError("Las palabras no caben")
+
+        with self.assertRaises(ValueError):
+            exportar_cuadernillo(sopas(), ruta)
+        with open(ruta, 'rb') as f:
+            self.assertEqual(f.read(), b'anterior')
+        self.assertEqual(os.listdir(self.directorio.name), ['cuadernillo.pdf'])
+
+
+if __name__ == '__main__':
+    unittest.main()
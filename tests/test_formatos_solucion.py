@@ -0,0 +1,107 @@
+"""
+Tests unitarios para los formatos estructurados de solución.
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+
+# Agregar el directorio padre al path para poder importar los módulos
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from config import Config
+from formatos_solucion import leer_soluciones_binarias, leer_soluciones_jsonl
+from generacion_lote import generar_lote
+from word_search_generator import WordSearchGenerator
+
+
+class TestFormatosSolucion(unittest.TestCase):
+    """Tests para las soluciones en JSON Lines y en binario."""
+
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.generador = WordSearchGenerator(
+            palabras=["NIÑO", "PYTHON", "SOL"],
+            tamaño=10,
+            orientaciones=Config.ORIENTACIONES_AVANZADO,
+            alfabeto=Config.ALFABETO_ES,
+            permitir_inversa=True,
+            semilla=8
+        )
+        self.generador.generar()
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def posiciones_esperadas(self):
+        return {
+            palabra: [list(p) for p in info['posiciones']]
+            for palabra, info in self.generador.palabras_colocadas.items()
+        }
+
+    def test_jsonl_incluye_posiciones_y_direccion(self):
+        """Test: Cada palabra lleva todas sus posiciones y su vector de dirección."""
+        archivo = os.path.join(self.directorio.name, 'solucion.jsonl')
+        self.generador.exportar_solucion(archivo)
+        registros = list(leer_soluciones_jsonl(archivo))
+        self.assertEqual(len(registros), 1)
+        self.assertEqual(registros[0]['id'], 8)
+        for palabra in registros[0]['palabras']:
+            fila, col = palabra['inicio']
+            delta_fila, delta_col = palabra['direccion']
+            self.assertEqual(palabra['posiciones'], [
+                [fila + i * delta_fila, col + i * delta_col] for i in range(len(palabra['palabra']))
+            ])
+        self.assertEqual(
+            {p['palabra']: p['posiciones'] for p in registros[0]['palabras']},
+            self.posiciones_esperadas()
+        )
+
+    def test_binario_ida_y_vuelta_anexando(self):
+        """Test: El binario anexado se lee de vuelta sopa por sopa."""
+        archivo = os.path.join(self.directorio.name, 'soluciones.bin')
+        for identificador in range(3):
+            self.generador.exportar_solucion(archivo, anexar=True, identificador=identificador)
+        registros = list(leer_soluciones_binarias(archivo))
+        self.assertEqual([r['id'] for r in registros], [0, 1, 2])
+        self.assertEqual(
+            {p['palabra']: p['posiciones'] for p in registros[0]['palabras']},
+            self.posiciones_esperadas()
+        )
+
+    def test_binario_truncado_lanza_error(self):
+        """Test: Un archivo binario cortado lanza ValueError."""
+        archivo = os.path.join(self.directorio.name, 'soluciones.bin')
+        self.generador.exportar_solucion(archivo)
+        with open(archivo, 'r+b') as f:
+            f.truncate(os.path.getsize(archivo) - 2)
+        with self.assertRaises(ValueError):
+            list(leer_soluciones_binarias(archivo))
+
+    def test_formato_invalido_lanza_error(self):
+        """Test: Un formato de solución desconocido lanza ValueError."""
+        with self.assertRaises(ValueError):
+            self.generador.exportar_solucion(
+                os.path.join(self.directorio.name, 'x.txt'), formato='xml'
+            )
+
+    def test_lote_reune_soluciones_en_un_archivo(self):
+        """Test: En lotes, las soluciones JSONL van a un único archivo."""
+        resumen = generar_lote(
+            ["SOL", "LUNA"],
+            6,
+            directorio=self.directorio.name,
+            prefijo='lote',
+            workers=2,
+            tamaño_bloque=2,
+            formato_solucion='jsonl',
+            tamaño=8
+        )
+        registros = list(leer_soluciones_jsonl(resumen['archivo_soluciones']))
+        self.assertEqual(sorted(r['id'] for r in registros), list(range(6)))
+        self.assertFalse(any(n.endswith('_solucion.txt') for n in os.listdir(self.directorio.name)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,177 @@
+"""
+Tests unitarios para la generación de sopas de letras por lotes.
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+import time
+
+# Agregar el directorio padre al path para poder importar los módulos
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from config import Config
+from generacion_lote import derivar_semilla, generar_lote, generar_mejor
+from word_search_generator import WordSearchGenerator
+
+
+class TestGeneracionLote(unittest.TestCase):
+    """Tests para la función generar_lote."""
+
+    def test_lote_genera_todos_los_archivos(self):
+        """Test: El lote escribe una imagen y una solución por sopa."""
+        with tempfile.TemporaryDirectory() as directorio:
+            resumen = generar_lote(
+                ["PYTHON", "CODIGO", "TEST"],
+                5,
+                directorio=directorio,
+                prefijo='lote',
+                workers=2,
+                tamaño_bloque=2,
+                tamaño=10
+            )
+            self.assertEqual(resumen['exitosos'], 5)
+            self.assertEqual(resumen['fallidos'], 0)
+            for indice in range(5):
+                self.assertTrue(os.path.exists(os.path.join(directorio, f'lote_{indice}.png')))
+                self.assertTrue(os.path.exists(
+                    os.path.join(directorio, f'lote_{indice}_solucion.txt')
+                ))
+
+    def test_lote_reporta_errores(self):
+        """Test: Las sopas imposibles se cuentan como fallidas."""
+        completados = []
+        with tempfile.TemporaryDirectory() as directorio:
+            resumen = generar_lote(
+                ["PALABRAMUYLARGA"],
+                3,
+                directorio=directorio,
+                workers=1,
+                exportar_solucion=False,
+                al_completar=completados.append,
+                tamaño=5
+            )
+        self.assertEqual(resumen['fallidos'], 3)
+        self.assertEqual(len(completados), 3)
+        self.assertIsNotNone(completados[0]['error'])
+
+    def test_lote_sigue_si_falla_una_escritura(self):
+        """Test: Un error al escribir una sopa la cuenta como fallida sin cortar el lote."""
+        with tempfile.TemporaryDirectory() as directorio:
+            # Una carpeta con el nombre de la segunda imagen impide escribirla
+            os.mkdir(os.path.join(directorio, 'lote_1.png'))
+            resumen = generar_lote(
+                ["SOL"], 3, directorio=directorio, prefijo='lote', workers=1,
+                exportar_solucion=False, tamaño=5
+            )
+            self.assertEqual(resumen['exitosos'], 2)
+            self.assertEqual(resumen['fallidos'], 1)
+            self.assertEqual(resumen['errores'][0]['archivo'], os.path.join(directorio, 'lote_1.png'))
+            self.assertTrue(os.path.exists(os.path.join(directorio, 'lote_2.png')))
+
+    def test_lote_con_semilla_es_reproducible(self):
+        """Test: Cada sopa del lote recibe su semilla derivada."""
+        completados = []
+        with tempfile.TemporaryDirectory() as directorio:
+            generar_lote(
+                ["SOL", "LUNA"],
+                4,
+                directorio=directorio,
+                workers=2,
+                semilla=99,
+                exportar_solucion=False,
+                al_completar=completados.append,
+                tamaño=6
+            )
+        semillas = {r['indice']: r['semilla'] for r in completados}
+        self.assertEqual(semillas, {i: derivar_semilla(99, i) for i in range(4)})
+        self.assertEqual(len(set(semillas.values())), 4)
+
+
+def _indice_par(generador):
+    """Métrica de prueba: 1 si la semilla de la sopa es par."""
+    return 1.0 if generador.semilla % 2 == 0 else 0.0
+
+
+def _lenta_salvo_la_primera(generador):
+    """Métrica de prueba: la candidata 0 puntúa 1 al momento; las demás tardan un minuto."""
+    if generador.semilla == derivar_semilla(3, 0):
+        return 1.0
+    time.sleep(60)
+    return 0.0
+
+
+class TestGenerarMejor(unittest.TestCase):
+    """Tests para la función generar_mejor."""
+
+    def setUp(self):
+        self.opciones = dict(
+            tamaño=12,
+            orientaciones=Config.ORIENTACIONES_AVANZADO,
+            permitir_inversa=True
+        )
+        self.palabras = ["PYTHON", "CODIGO", "TEST", "DATOS", "LISTA"]
+
+    def test_elige_la_mejor_candidata(self):
+        """Test: Sin umbral se evalúan todas y gana la de mayor puntuación."""
+        generador, resumen = generar_mejor(
+            self.palabras, candidatos=4, workers=1, semilla=7, **self.opciones
+        )
+        self.assertEqual(resumen['evaluadas'], 4)
+        self.assertEqual(resumen['detenidas'], 0)
+        self.assertEqual(resumen['sin_generar'], 0)
+        self.assertEqual(resumen['semilla'], derivar_semilla(7, resumen['indice']))
+        self.assertEqual(len(generador.palabras_colocadas), len(self.palabras))
+
+        # La sopa devuelta es la misma que generar esa candidata por separado
+        referencia = WordSearchGenerator(self.palabras, semilla=resumen['semilla'], **self.opciones)
+        referencia.generar()
+        self.assertEqual(generador.cuadrícula, referencia.cuadrícula)
+        self.assertEqual(generador.palabras_colocadas, referencia.palabras_colocadas)
+
+    def test_umbral_cancela_el_resto(self):
+        """Test: La primera candidata que alcanza el umbral gana y no se generan más."""
+        pares = [i for i in range(8) if derivar_semilla(3, i) % 2 == 0]
+        _, resumen = generar_mejor(
+            self.palabras, candidatos=8, umbral=1.0, metricas={'par': _indice_par},
+            workers=1, semilla=3, **self.opciones
+        )
+        self.assertEqual(resumen['indice'], pares[0])
+        self.assertTrue(resumen['cumple_umbral'])
+        self.assertEqual(resumen['evaluadas'], pares[0] + 1)
+        self.assertEqual(resumen['detenidas'], 0)
+        self.assertEqual(resumen['sin_generar'], 8 - pares[0] - 1)
+
+    def test_procesos_eligen_la_misma_sopa(self):
+        """Test: Con varios procesos se elige la misma candidata que en serie."""
+        for umbral in (None, 0.5):
+            elegidas = [
+                generar_mejor(
+                    self.palabras, candidatos=6, umbral=umbral, workers=workers,
+                    semilla=11, **self.opciones
+                )[1]['indice']
+                for workers in (1, 3)
+            ]
+            self.assertEqual(elegidas[0], elegidas[1])
+
+    def test_umbral_detiene_candidatas_en_curso(self):
+        """Test: Al alcanzar el umbral no se espera a las candidatas que siguen corriendo."""
+        inicio = time.perf_counter()
+        _, resumen = generar_mejor(
+            self.palabras, candidatos=3, umbral=1.0, metricas={'lenta': _lenta_salvo_la_primera},
+            workers=3, semilla=3, **self.opciones
+        )
+        self.assertEqual(resumen['indice'], 0)
+        self.assertEqual(resumen['detenidas'], 2)
+        self.assertEqual(resumen['evaluadas'] + resumen['detenidas'] + resumen['sin_generar'], 3)
+        self.assertLess(time.perf_counter() - inicio, 20)
+
+    def test_sin_candidatas_validas_lanza_error(self):
+        """Test: Si ninguna candidata cabe en la cuadrícula se lanza ValueError."""
+        with self.assertRaises(ValueError):
+            generar_mejor(["PALABRAMUYLARGA"], candidatos=2, workers=1, tamaño=5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+Tests unitarios para la carga de listas de palabras externas.
+"""
+
+import unittest
+import json
+import os
+import random
+import sys
+import tempfile
+
+# Agregar el directorio padre al path para poder importar los módulos
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from config import Config
+from lista_palabras import IndicePalabras, leer_palabras, normalizar_palabra
+
+
+class TestNormalizarPalabra(unittest.TestCase):
+    """Tests para la normalización por alfabeto."""
+
+    def test_conserva_enie_en_español(self):
+        """Test: La Ñ se conserva con el alfabeto español y los acentos no."""
+        self.assertEqual(normalizar_palabra('niño', Config.ALFABETO_ES), 'NIÑO')
+        self.assertEqual(normalizar_palabra('Camión', Config.ALFABETO_ES), 'CAMION')
+        self.assertEqual(normalizar_palabra('pingüino', Config.ALFABETO_ES), 'PINGUINO')
+
+    def test_quita_enie_en_ingles(self):
+        """Test: Con el alfabeto inglés la Ñ pasa a N."""
+        self.assertEqual(normalizar_palabra('niño', Config.ALFABETO_EN), 'NINO')
+
+    def test_rechaza_caracteres_ajenos(self):
+        """Test: Las palabras con dígitos o símbolos se descartan."""
+        self.assertIsNone(normalizar_palabra('R2D2', Config.ALFABETO_EN))
+        self.assertEqual(normalizar_palabra('papa-noel', Config.ALFABETO_EN), 'PAPANOEL')
+
+
+class TestIndicePalabras(unittest.TestCase):
+    """Tests para la lectura e indexado de diccionarios."""
+
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def escribir(self, nombre, contenido):
+        ruta = os.path.join(self.directorio.name, nombre)
+        with open(ruta, 'w', encoding='utf-8') as f:
+            f.write(contenido)
+        return ruta
+
+    def test_lee_texto_csv_y_jsonl(self):
+        """Test: Los tres formatos devuelven las mismas palabras."""
+        texto = self.escribir('lista.txt', '# comentario\nsol\n\nluna\n')
+        tabla = self.escribir('lista.csv', 'id,palabra\n1,sol\n2,luna\n')
+        lineas = self.escribir('lista.jsonl', json.dumps({'palabra': 'sol'}) + '\n"luna"\n')
+        self.assertEqual(list(leer_palabras(texto)), ['sol', 'luna'])
+        self.assertEqual(list(leer_palabras(tabla, columna='palabra')), ['sol', 'luna'])
+        self.assertEqual(list(leer_palabras(lineas)), ['sol', 'luna'])
+
+    def test_indice_descarta_repetidas_y_agrupa_por_largo(self):
+        """Test: Las variantes con acentos cuentan como la misma palabra."""
+        ruta = self.escribir('lista.txt', 'árbol\nARBOL\nsol\nmar\nx\nniño\n')
+        indice = IndicePalabras.desde_archivo(ruta, Config.ALFABETO_ES)
+        self.assertEqual(indice.palabras, ['ARBOL', 'SOL', 'MAR', 'NIÑO'])
+        self.assertEqual(indice.descartadas, 2)
+        self.assertEqual(sorted(indice.por_largo), [3, 4, 5])
+        self.assertEqual([indice.palabras[i] for i in indice.por_largo[3]], ['SOL', 'MAR'])
+
+    def test_muestrear_respeta_tamaño_y_letras(self):
+        """Test: Las palabras elegidas caben en la cuadrícula y usan las letras pedidas."""
+        indice = IndicePalabras(Config.ALFABETO_EN)
+        rng = random.Random(0)
+        for _ in range(2000):
+            indice.agregar(''.join(rng.choice('ABCDEFGH') for _ in range(rng.randint(3, 12))), 3)
+
+        palabras = indice.muestrear(8, 15, random.Random(1))
+        self.assertEqual(len(set(palabras)), 8)
+
+        # En una cuadrícula pequeña manda el presupuesto de letras
+        pequeñas = indice.muestrear(10, 6, random.Random(1))
+        self.assertTrue(pequeñas)
+        self.assertTrue(all(len(p) <= 6 for p in pequeñas))
+        self.assertLessEqual(sum(map(len, pequeñas)), Config.DENSIDAD_MAXIMA_MUESTREO * 36)
+
+        con_letras = indice.muestrear(5, 12, random.Random(2), letras='ABC')
+        self.assertTrue(con_letras)
+        self.assertTrue(all(set(p) <= set('ABC') for p in con_letras))
+
+    def test_muestrear_es_reproducible(self):
+        """Test: Con el mismo generador aleatorio se eligen las mismas palabras."""
+        ruta = self.escribir('lista.txt', '\n'.join(f'palabra{c}' for c in 'abcdefghij'))
+        indice = IndicePalabras.desde_archivo(ruta)
+        self.assertEqual(
+            indice.muestrear(4, 15, random.Random(9)), indice.muestrear(4, 15, random.Random(9))
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+"""
+Tests unitarios para las utilidades de renderizado.
+"""
+
+import unittest
+import io
+import os
+import random
+import sys
+import tempfile
+
+# Agregar el directorio padre al path para poder importar los módulos
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PIL import Image, ImageChops, ImageDraw
+
+import renderizado
+from config import Config
+from renderizado import EscritorPNG, cargar_fuente, obtener_atlas, obtener_plantilla
+from word_search_generator import WordSearchGenerator
+
+
+class TestAtlasGlifos(unittest.TestCase):
+    """Tests para el atlas de glifos."""
+
+    def test_atlas_compartido_por_color(self):
+        """Test: El mismo color devuelve el mismo atlas."""
+        self.assertIs(obtener_atlas('black'), obtener_atlas('black'))
+        self.assertIsNot(obtener_atlas('black'), obtener_atlas('red'))
+
+    def test_glifo_se_rasteriza_una_vez(self):
+        """Test: Cada letra se rasteriza solo la primera vez."""
+        atlas = obtener_atlas('black')
+        self.assertIs(atlas.glifo('Ñ'), atlas.glifo('Ñ'))
+
+    def test_pegar_equivale_a_dibujar_texto(self):
+        """Test: Pegar desde el atlas produce los mismos píxeles que draw.text."""
+        fuente = cargar_fuente()
+        tamaño_celda = 40
+        esperado = Image.new('RGB', (tamaño_celda, tamaño_celda), 'white')
+        draw = ImageDraw.Draw(esperado)
+        bbox = draw.textbbox((0, 0), 'W', font=fuente)
+        x = (tamaño_celda - (bbox[2] - bbox[0])) // 2
+        y = (tamaño_celda - (bbox[3] - bbox[1])) // 2
+        draw.text((x, y), 'W', font=fuente, fill='blue')
+
+        obtenido = Image.new('RGB', (tamaño_celda, tamaño_celda), 'white')
+        obtener_atlas('blue').pegar(obtenido, 'W', 0, 0, tamaño_celda)
+
+        self.assertIsNone(ImageChops.difference(esperado, obtenido).getbbox())
+
+
+class TestPlantillas(unittest.TestCase):
+    """Tests para la caché de plantillas de cuadrícula."""
+
+    def test_plantilla_devuelve_copias_independientes(self):
+        """Test: Dibujar sobre una plantilla no altera la caché."""
+        primera = obtener_plantilla(5, 100, False, 'white', 'black')
+        primera.paste('red', (0, 0, 100, 100))
+        segunda = obtener_plantilla(5, 100, False, 'white', 'black')
+        self.assertEqual(segunda.getpixel((10, 10)), (255, 255, 255))
+        self.assertEqual(segunda.getpixel((0, 10)), (0, 0, 0))
+
+    def test_plantillas_con_desalojo_lru(self):
+        """Test: La caché no supera el máximo configurado."""
+        for tamaño in range(2, Config.MAX_PLANTILLAS_CACHE + 6):
+            obtener_plantilla(tamaño, 60, True, 'white', 'black')
+        self.assertEqual(len(renderizado._PLANTILLAS), Config.MAX_PLANTILLAS_CACHE)
+        self.assertNotIn((2, 60, True, 'white', 'black'), renderizado._PLANTILLAS)
+
+
+class TestRenderizadoPorFranjas(unittest.TestCase):
+    """Tests para el PNG escrito por franjas."""
+
+    def test_escritor_png_reconstruye_la_imagen(self):
+        """Test: Escribir por franjas produce la misma imagen."""
+        rng = random.Random(1)
+        original = Image.frombytes('RGB', (37, 50), bytes(rng.randrange(256) for _ in range(37 * 50 * 3)))
+        salida = io.BytesIO()
+        escritor = EscritorPNG(salida, 37, 50)
+        for inicio in range(0, 50, 16):
+            escritor.escribir_franja(original.crop((0, inicio, 37, min(inicio + 16, 50))))
+        escritor.cerrar()
+
+        salida.seek(0)
+        leida = Image.open(salida)
+        self.assertEqual(leida.size, (37, 50))
+        self.assertIsNone(ImageChops.difference(leida.convert('RGB'), original).getbbox())
+
+    def test_escritor_png_exige_todas_las_filas(self):
+        """Test: Cerrar antes de escribir todas las filas lanza ValueError."""
+        escritor = EscritorPNG(io.BytesIO(), 10, 10)
+        escritor.escribir_franja(Image.new('RGB', (10, 5)))
+        with self.assertRaises(ValueError):
+            escritor.cerrar()
+
+    def test_exportar_imagen_con_tamaño_celda(self):
+        """Test: Con tamaño de celda fijo la imagen crece con la cuadrícula."""
+        generador = WordSearchGenerator(palabras=["PYTHON", "CODIGO"], tamaño=40, semilla=2)
+        generador.generar()
+        with tempfile.TemporaryDirectory() as directorio:
+            archivo = os.path.join(directorio, 'poster.png')
+            self.assertIsNone(generador.exportar(archivo, tamaño_celda=12, mostrar_palabras=False))
+            with Image.open(archivo) as imagen:
+                self.assertEqual(imagen.size, (40 * 12 + 1, 40 * 12 + 1))
+                imagen = imagen.convert('RGB')
+                # Bordes y líneas en los múltiplos del tamaño de celda
+                self.assertEqual(imagen.getpixel((5, 12 * 39)), (0, 0, 0))
+                self.assertEqual(imagen.getpixel((40 * 12, 5)), (0, 0, 0))
+                self.assertEqual(imagen.getpixel((1, 1)), (255, 255, 255))
+
+    def test_renderizado_por_franjas_se_mide_una_vez(self):
+        """Test: Exportar con tamaño de celda registra un solo renderizado."""
+        fases = []
+        generador = WordSearchGenerator(
+            palabras=["SOL"], tamaño=6, semilla=1,
+            perfilador=lambda fase, segundos: fases.append((fase, segundos))
+        )
+        generador.generar()
+        fases.clear()
+        generador.exportar_imagen(io.BytesIO(), tamaño_celda=10)
+        generador.exportar_imagen_por_franjas(io.BytesIO(), tamaño_celda=10)
+        self.assertEqual([fase for fase, _ in fases], ['renderizado', 'renderizado'])
+        self.assertAlmostEqual(
+            generador.obtener_estadisticas()['tiempos']['renderizado'],
+            sum(segundos for _, segundos in fases)
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
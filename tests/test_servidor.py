@@ -0,0 +1,171 @@
+"""
+Tests unitarios para el servidor HTTP de sopas de letras.
+"""
+
+import unittest
+import asyncio
+import base64
+import http.client
+import json
+import os
+import socket
+import sys
+import threading
+
+# Agregar el directorio padre al path para poder importar los módulos
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from config import Config
+from servidor import ErrorPeticion, ServidorSopas, validar_parametros
+
+
+class TestValidarParametros(unittest.TestCase):
+    """Tests para la validación del cuerpo JSON."""
+
+    def test_parametros_validos(self):
+        """Test: Las opciones se traducen a parámetros del generador."""
+        parametros = validar_parametros({
+            "palabras": ["SOL", "LUNA"], "tamaño": 8, "alfabeto": "es", "formato": "svg"
+        })
+        self.assertEqual(parametros['formato'], 'svg')
+        self.assertEqual(parametros['generador']['tamaño'], 8)
+        self.assertIn('Ñ', parametros['generador']['alfabeto'])
+        self.assertEqual(parametros['generador']['max_nodos'], Config.SERVIDOR_MAX_NODOS)
+
+    def test_parametros_no_validos(self):
+        """Test: Los cuerpos incorrectos lanzan ErrorPeticion con 400."""
+        for datos in (
+            [],
+            {"palabras": []},
+            {"palabras": ["SOL"], "tamaño": "grande"},
+            {"palabras": ["SOL"], "tamaño": 10000},
+            {"palabras": ["SOL"], "orientaciones": ["X"]},
+            {"palabras": ["SOL"], "orientaciones": [["E"]]},
+            {"palabras": ["SOL"], "orientaciones": [{"E": 1}]},
+            {"palabras": ["SOL"], "desconocida": 1},
+            {"palabras": ["SOL"] * 101, "tamaño": 200},
+        ):
+            with self.assertRaises(ErrorPeticion) as contexto:
+                validar_parametros(datos)
+            self.assertEqual(contexto.exception.estado, 400)
+
+
+class TestServidorSopas(unittest.TestCase):
+    """Tests del servidor atendiendo peticiones reales."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.loop = asyncio.new_event_loop()
+        cls.servidor = ServidorSopas(puerto=0, workers=1, max_pendientes=4)
+        listo = threading.Event()
+
+        def ejecutar():
+            asyncio.set_event_loop(cls.loop)
+            cls.loop.run_until_complete(cls.servidor.iniciar())
+            listo.set()
+            cls.loop.run_forever()
+
+        cls.hilo = threading.Thread(target=ejecutar, daemon=True)
+        cls.hilo.start()
+        listo.wait(60)
+
+    @classmethod
+    def tearDownClass(cls):
+        asyncio.run_coroutine_threadsafe(cls.servidor.detener(), cls.loop).result(30)
+        cls.loop.call_soon_threadsafe(cls.loop.stop)
+        cls.hilo.join(10)
+        cls.loop.close()
+
+    def peticion(self, metodo, ruta, datos=None):
+        conexion = http.client.HTTPConnection('127.0.0.1', self.servidor.puerto, timeout=30)
+        cuerpo = json.dumps(datos).encode('utf-8') if datos is not None else None
+        conexion.request(metodo, ruta, body=cuerpo)
+        respuesta = conexion.getresponse()
+        contenido = respuesta.read()
+        conexion.close()
+        return respuesta, contenido
+
+    def test_sopa_devuelve_imagen_y_solucion(self):
+        """Test: /sopa responde la imagen en base64 y la solución."""
+        respuesta, contenido = self.peticion(
+            'POST', '/sopa', {"palabras": ["PYTHON", "CODIGO"], "tamaño": 10, "semilla": 3}
+        )
+        self.assertEqual(respuesta.status, 200)
+        datos = json.loads(contenido)
+        self.assertTrue(base64.b64decode(datos['imagen']).startswith(b'\x89PNG'))
+        self.assertEqual({s['palabra'] for s in datos['solucion']}, {"PYTHON", "CODIGO"})
+
+    def test_imagen_svg(self):
+        """Test: /imagen responde directamente el documento pedido."""
+        respuesta, contenido = self.peticion(
+            'POST', '/imagen', {"palabras": ["SOL"], "tamaño": 5, "formato": "svg"}
+        )
+        self.assertEqual(respuesta.status, 200)
+        self.assertEqual(respuesta.getheader('Content-Type'), 'image/svg+xml')
+        self.assertIn(b'<svg', contenido)
+
+    def test_palabras_que_no_caben(self):
+        """Test: Si las palabras no caben se responde 422."""
+        respuesta, _ = self.peticion('POST', '/sopa', {"palabras": ["PALABRALARGA"], "tamaño": 4})
+        self.assertEqual(respuesta.status, 422)
+
+    def test_json_no_valido_y_ruta_desconocida(self):
+        """Test: Cuerpos no JSON dan 400 y rutas desconocidas 404."""
+        conexion = http.client.HTTPConnection('127.0.0.1', self.servidor.puerto, timeout=30)
+        conexion.request('POST', '/sopa', body=b'{no es json')
+        self.assertEqual(conexion.getresponse().status, 400)
+        conexion.close()
+        respuesta, _ = self.peticion('GET', '/otra')
+        self.assertEqual(respuesta.status, 404)
+
+    def test_content_length_negativo(self):
+        """Test: Un Content-Length negativo se rechaza con 400."""
+        with socket.create_connection(('127.0.0.1', self.servidor.puerto), timeout=30) as conexion:
+            conexion.sendall(b'POST /sopa HTTP/1.1\r\nContent-Length: -1\r\n\r\n')
+            respuesta = http.client.HTTPResponse(conexion)
+            respuesta.begin()
+        self.assertEqual(respuesta.status, 400)
+
+    def test_peticion_lenta_responde_408(self):
+        """Test: Un cliente que no termina las cabeceras recibe 408."""
+        tiempo_lectura = self.servidor.tiempo_lectura
+        self.servidor.tiempo_lectura = 0.2
+        try:
+            with socket.create_connection(('127.0.0.1', self.servidor.puerto), timeout=30) as conexion:
+                conexion.sendall(b'POST /sopa HTTP/1.1\r\nContent-Le')
+                respuesta = http.client.HTTPResponse(conexion)
+                respuesta.begin()
+        finally:
+            self.servidor.tiempo_lectura = tiempo_lectura
+        self.assertEqual(respuesta.status, 408)
+
+    def test_generacion_lenta_responde_504_y_libera_el_proceso(self):
+        """Test: Una sopa que no llega a tiempo da 504 y el proceso se recupera."""
+        tiempo_generacion = self.servidor.tiempo_generacion
+        self.servidor.tiempo_generacion = 1e-6
+        try:
+            respuesta, _ = self.peticion('POST', '/sopa', {"palabras": ["SOL"], "tamaño": 6})
+        finally:
+            self.servidor.tiempo_generacion = tiempo_generacion
+        self.assertEqual(respuesta.status, 504)
+        respuesta, _ = self.peticion('POST', '/sopa', {"palabras": ["SOL"], "tamaño": 6})
+        self.assertEqual(respuesta.status, 200)
+        _, contenido = self.peticion('GET', '/estado')
+        self.assertEqual(json.loads(contenido)['en_proceso'], 0)
+
+    def test_cola_llena_responde_503(self):
+        """Test: Sin espacio en la cola se rechaza con 503 y Retry-After."""
+        max_pendientes = self.servidor.max_pendientes
+        self.servidor.max_pendientes = 0
+        try:
+            respuesta, _ = self.peticion('POST', '/sopa', {"palabras": ["SOL"]})
+        finally:
+            self.servidor.max_pendientes = max_pendientes
+        self.assertEqual(respuesta.status, 503)
+        self.assertEqual(respuesta.getheader('Retry-After'), '1')
+        _, contenido = self.peticion('GET', '/estado')
+        self.assertGreaterEqual(json.loads(contenido)['rechazadas'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+Tests unitarios para el solucionador de sopas de letras.
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+
+# Agregar el directorio padre al path para poder importar los módulos
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from word_search_generator import WordSearchGenerator
+from config import Config
+from solucionador import AutomataAhoCorasick, leer_cuadricula, resolver_cuadricula
+
+
+class TestSolucionador(unittest.TestCase):
+    """Tests para el autómata y la búsqueda en cuadrículas."""
+
+    def test_automata_encuentra_solapamientos(self):
+        """Test: El autómata reconoce palabras que se solapan o se contienen."""
+        automata = AutomataAhoCorasick(["RON", "PATRONUM", "UM"])
+        encontradas = sorted(automata.buscar("PATRONUM"))
+        self.assertEqual(encontradas, [(5, 0), (7, 1), (7, 2)])
+
+    def test_ocho_direcciones(self):
+        """Test: Se encuentran palabras en las 8 direcciones."""
+        cuadrícula = [
+            list("ABC"),
+            list("DEF"),
+            list("GHI"),
+        ]
+        palabras = ["ABC", "CBA", "ADG", "GDA", "AEI", "IEA", "CEG", "GEC"]
+        direcciones = {
+            a['palabra']: a['direccion'] for a in resolver_cuadricula(cuadrícula, palabras)
+        }
+        self.assertEqual(direcciones, {
+            "ABC": (0, 1), "CBA": (0, -1), "ADG": (1, 0), "GDA": (-1, 0),
+            "AEI": (1, 1), "IEA": (-1, -1), "CEG": (1, -1), "GEC": (-1, 1),
+        })
+
+    def test_capicua_se_reporta_una_vez(self):
+        """Test: Una palabra capicúa no se cuenta dos veces."""
+        apariciones = resolver_cuadricula([list("XOSOX")], ["OSO"])
+        self.assertEqual(len(apariciones), 1)
+        self.assertEqual(apariciones[0]['posiciones'], [(0, 1), (0, 2), (0, 3)])
+
+    def test_resolver_encuentra_palabras_colocadas(self):
+        """Test: El solucionador encuentra todas las palabras de una sopa generada."""
+        generador = WordSearchGenerator(
+            palabras=["PYTHON", "CODIGO", "TEST"],
+            tamaño=12,
+            orientaciones=Config.ORIENTACIONES_AVANZADO,
+            permitir_inversa=True,
+            semilla=11
+        )
+        generador.generar()
+        apariciones = generador.resolver()
+        for palabra, info in generador.palabras_colocadas.items():
+            posiciones = [a['posiciones'] for a in apariciones if a['palabra'] == palabra]
+            self.assertTrue(
+                info['posiciones'] in posiciones or info['posiciones'][::-1] in posiciones
+            )
+
+    def test_celdas_vacias_no_desplazan_posiciones(self):
+        """Test: Las celdas vacías ocupan su sitio y no unen letras separadas."""
+        cuadrícula = [
+            ['M', 'A', 'R', ''],
+            ['', 'S', 'O', 'L'],
+            ['S', 'O', '', 'L'],
+        ]
+        posiciones = {
+            a['palabra']: a['posiciones'] for a in resolver_cuadricula(cuadrícula, ["SOL", "MAR"])
+        }
+        self.assertEqual(posiciones, {
+            "MAR": [(0, 0), (0, 1), (0, 2)],
+            "SOL": [(1, 1), (1, 2), (1, 3)],
+        })
+
+    def test_celdas_de_varias_letras_se_rechazan(self):
+        """Test: Una celda con más de una letra lanza ValueError."""
+        with self.assertRaises(ValueError):
+            resolver_cuadricula([['SO', 'L'], ['A', 'B']], ["SOL"])
+
+    def test_resolver_antes_de_rellenar(self):
+        """Test: resolver() funciona con la cuadrícula aún sin rellenar."""
+        generador = WordSearchGenerator(palabras=["PYTHON", "SOPA"], tamaño=8, semilla=5)
+        for palabra in generador.palabras:
+            generador._colocar_palabra(palabra)
+        for aparicion in generador.resolver():
+            info = generador.palabras_colocadas[aparicion['palabra']]
+            self.assertIn(aparicion['posiciones'], (info.posiciones, info.posiciones[::-1]))
+
+    def test_leer_cuadricula(self):
+        """Test: Se leen cuadrículas con y sin espacios entre letras."""
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, 'cuadricula.txt')
+            with open(ruta, 'w', encoding='utf-8') as f:
+                f.write("a b ñ\nDEF\n\n")
+            self.assertEqual(leer_cuadricula(ruta), [list("ABÑ"), list("DEF")])
+
+    def test_leer_cuadricula_con_celdas_de_varias_letras(self):
+        """Test: Las celdas de más de una letra separadas por espacios se rechazan."""
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, 'cuadricula.txt')
+            with open(ruta, 'w', encoding='utf-8') as f:
+                f.write("A B C\nDE F G\n")
+            with self.assertRaises(ValueError):
+                leer_cuadricula(ruta)
+
+
+if __name__ == '__main__':
+    unittest.main()
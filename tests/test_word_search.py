@@ -3,14 +3,25 @@ Tests unitarios para el generador de sopas de letras.
 """
 
 import unittest
+import json
 import os
+import subprocess
 import sys
+import tempfile
+from unittest import mock
 
 # Agregar el directorio padre al path para poder importar los módulos
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from word_search_generator import WordSearchGenerator
+from word_search_generator import Colocacion, WordSearchGenerator, DIRECCIONES
 from config import Config
+from solucionador import leer_cuadricula
+from tableros import TableroBitboard, TableroLineas, TableroLista, TableroNumpy
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class TestWordSearchGenerator(unittest.TestCase):
@@ -129,6 +140,32 @@ class TestWordSearchGenerator(unittest.TestCase):
             if os.path.exists(archivo_test):
                 os.remove(archivo_test)
 
+    def test_exportar_texto(self):
+        """Test: La cuadrícula en texto se puede volver a leer."""
+        generador = WordSearchGenerator(palabras=self.palabras_basico, tamaño=10, semilla=1)
+        generador.generar()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            archivo = os.path.join(tmpdir, 'sopa.txt')
+            generador.exportar(archivo)
+            self.assertEqual(tuple(tuple(fila) for fila in leer_cuadricula(archivo)), generador.cuadrícula)
+
+    def test_generar_en_texto_no_importa_pillow(self):
+        """Test: Generar y exportar en texto no carga Pillow ni NumPy."""
+        codigo = (
+            "import sys, io\n"
+            "from word_search_generator import WordSearchGenerator\n"
+            "g = WordSearchGenerator(['SOPA', 'LETRAS'], tamaño=8, semilla=1)\n"
+            "g.generar()\n"
+            "g.exportar(io.StringIO(), formato='txt')\n"
+            "print('PIL' in sys.modules, 'numpy' in sys.modules)\n"
+        )
+        raiz = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+        salida = subprocess.run(
+            [sys.executable, '-c', codigo], cwd=raiz, capture_output=True, text=True, check=True
+        )
+        self.assertEqual(salida.stdout.split(), ['False', 'False'])
+
     def test_exportar_solucion(self):
         """Test: Exportar archivo de soluciones."""
         generador = WordSearchGenerator(
@@ -192,6 +229,34 @@ class TestWordSearchGenerator(unittest.TestCase):
             for celda in fila:
                 self.assertEqual(celda, '')
 
+    def test_cuadricula_es_de_solo_lectura(self):
+        """Test: Escribir en la cuadrícula falla en todos los backends en lugar de perderse."""
+        backends = ['lista', 'bitboard', 'lineas'] + (['numpy'] if numpy is not None else [])
+        for backend in backends:
+            generador = WordSearchGenerator(palabras=self.palabras_basico, tamaño=8, backend=backend)
+            with self.assertRaises(TypeError):
+                generador.cuadrícula[0][0] = 'X'
+            with self.assertRaises(TypeError):
+                generador.cuadrícula[0] = ('X',) * 8
+            generador.tablero.asignar(0, 0, 'X')
+            self.assertEqual(generador.cuadrícula[0][0], 'X')
+
+    def test_cuadricula_se_reutiliza_hasta_escribir(self):
+        """Test: La copia de la cuadrícula solo se rehace al escribir en el tablero."""
+        backends = ['lista', 'bitboard', 'lineas'] + (['numpy'] if numpy is not None else [])
+        for backend in backends:
+            generador = WordSearchGenerator(palabras=["SOL"], tamaño=5, backend=backend, semilla=1)
+            generador.generar()
+            copia = generador.cuadrícula
+            self.assertIs(generador.cuadrícula, copia)
+            posiciones = generador.palabras_colocadas["SOL"].posiciones
+            generador.tablero.vaciar(posiciones)
+            self.assertEqual([generador.cuadrícula[f][c] for f, c in posiciones], ['', '', ''])
+            generador.tablero.colocar("SOL", 0, 0, 0, 1)
+            self.assertEqual(generador.cuadrícula[0][:3], ('S', 'O', 'L'))
+            generador.generar()
+            self.assertIsNot(generador.cuadrícula, copia)
+
     def test_multiples_palabras_largas(self):
         """Test: Colocación de múltiples palabras largas."""
         generador = WordSearchGenerator(
@@ -248,10 +313,457 @@ class TestWordSearchGenerator(unittest.TestCase):
         generador.generar()
         self.assertEqual(len(generador.palabras_colocadas), 1)
 
+    def test_posiciones_validas_enumera_todos_los_inicios(self):
+        """Test: Se enumeran todas las posiciones legales de una palabra."""
+        generador = WordSearchGenerator(
+            palabras=["ABC"],
+            tamaño=4,
+            orientaciones=['H', 'D_INV']
+        )
+        candidatos = generador._posiciones_validas("ABC")
+        horizontales = [c for c in candidatos if c[2] == 'H']
+        diagonales = [c for c in candidatos if c[2] == 'D_INV']
+        self.assertEqual(len(horizontales), 4 * 2)
+        self.assertEqual(len(diagonales), 2 * 2)
+        self.assertIn((3, 3, 'D_INV'), diagonales)
+
+    def test_sin_posicion_legal_lanza_error(self):
+        """Test: Una palabra sin ningún hueco legal lanza ValueError."""
+        generador = WordSearchGenerator(
+            palabras=["AB", "CD"],
+            tamaño=2,
+            orientaciones=['H']
+        )
+        generador._colocar_palabra("AB")
+        generador._colocar_palabra("CD")
+        with self.assertRaises(ValueError):
+            generador._colocar_palabra("EF")
+
+    def test_unico_hueco_se_encuentra_aunque_fallen_los_sorteos(self):
+        """Test: Si ningún inicio sorteado sirve, la enumeración halla el único hueco."""
+        for muestras in (0, Config.MUESTRAS_COLOCACION):
+            with mock.patch.object(Config, 'MUESTRAS_COLOCACION', muestras):
+                generador = WordSearchGenerator(palabras=["AB"], tamaño=5, orientaciones=['H'])
+                for fila in range(5):
+                    for col in range(5):
+                        if (fila, col) not in ((3, 1), (3, 2)):
+                            generador.tablero.asignar(fila, col, 'Z')
+                generador._colocar_palabra("AB")
+                self.assertEqual(generador.palabras_colocadas["AB"].posiciones, [(3, 1), (3, 2)])
+
+    def test_backtracking_no_depende_del_limite_de_recursion(self):
+        """Test: El backtracking admite más palabras que el límite de recursión."""
+        palabras = [a + b + c for a in 'ABCDE' for b in 'FGHIJ' for c in 'KLMNOP']
+        limite = sys.getrecursionlimit()
+        sys.setrecursionlimit(100)
+        try:
+            generador = WordSearchGenerator(
+                palabras=palabras,
+                tamaño=30,
+                orientaciones=['H', 'V'],
+                estrategia='backtracking',
+                backend='bitboard',
+                semilla=1
+            )
+            generador.generar()
+        finally:
+            sys.setrecursionlimit(limite)
+        self.assertEqual(len(generador.palabras_colocadas), len(palabras))
+
+    def test_backtracking_resuelve_cuadricula_ajustada(self):
+        """Test: El modo backtracking completa una cuadrícula sin huecos."""
+        palabras = ["ABC", "DEF", "GHI", "ADG", "BEH", "CFI"]
+        for _ in range(10):
+            generador = WordSearchGenerator(
+                palabras=palabras,
+                tamaño=3,
+                orientaciones=['H', 'V'],
+                estrategia='backtracking'
+            )
+            generador.generar()
+            self.assertEqual(len(generador.palabras_colocadas), len(palabras))
+
+    def test_backtracking_agota_presupuesto(self):
+        """Test: El modo backtracking respeta el presupuesto de búsqueda."""
+        generador = WordSearchGenerator(
+            palabras=["ABC", "DEF", "GHI", "JKL"],
+            tamaño=3,
+            orientaciones=['H'],
+            estrategia='backtracking',
+            max_nodos=5
+        )
+        with self.assertRaises(ValueError):
+            generador.generar()
+
+    def test_orden_por_restriccion(self):
+        """Test: Las palabras más largas se colocan primero."""
+        generador = WordSearchGenerator(
+            palabras=["SOL", "MARIPOSA", "LUNA", "ZAFIRO"],
+            tamaño=10,
+            estrategia='backtracking'
+        )
+        self.assertEqual(
+            generador._ordenar_por_restriccion(),
+            ["MARIPOSA", "ZAFIRO", "LUNA", "SOL"]
+        )
+
+    def test_estrategia_invalida_lanza_error(self):
+        """Test: Una estrategia desconocida lanza ValueError."""
+        with self.assertRaises(ValueError):
+            WordSearchGenerator(palabras=["SOL"], estrategia='magia')
+
+    @unittest.skipIf(numpy is None, "NumPy no está instalado")
+    def test_backend_numpy_genera_cuadricula_completa(self):
+        """Test: El backend NumPy genera y expone una lista de listas."""
+        generador = WordSearchGenerator(
+            palabras=["NIÑO", "ESPAÑA", "PYTHON"],
+            tamaño=10,
+            orientaciones=Config.ORIENTACIONES_AVANZADO,
+            alfabeto=Config.ALFABETO_EN,
+            backend='numpy'
+        )
+        generador.generar()
+
+        cuadrícula = generador.cuadrícula
+        self.assertEqual(len(cuadrícula), 10)
+        for fila in cuadrícula:
+            for celda in fila:
+                self.assertTrue(celda.isalpha())
+        for palabra, info in generador.palabras_colocadas.items():
+            letras = ''.join(cuadrícula[f][c] for f, c in info['posiciones'])
+            self.assertEqual(letras, palabra)
+
+    @unittest.skipIf(numpy is None, "NumPy no está instalado")
+    def test_backend_numpy_coincide_con_listas(self):
+        """Test: Ambos backends enumeran las mismas posiciones válidas."""
+        lista = TableroLista(6, 'ABC')
+        compacto = TableroNumpy(6, 'ABC')
+        for tablero in (lista, compacto):
+            tablero.colocar('ABCA', 1, 0, 0, 1)
+            tablero.colocar('CBA', 5, 5, -1, -1)
+
+        for delta_fila, delta_col, _ in DIRECCIONES.values():
+            self.assertEqual(
+                sorted(lista.inicios_validos('ACB', delta_fila, delta_col)),
+                sorted(compacto.inicios_validos('ACB', delta_fila, delta_col))
+            )
+
+    def test_backend_bitboard_coincide_con_listas(self):
+        """Test: Las máscaras de bits dan los mismos inicios y celdas que las listas."""
+        lista = TableroLista(7, 'ABC')
+        bits = TableroBitboard(7, 'ABC')
+        for tablero in (lista, bits):
+            tablero.colocar('ABCA', 1, 0, 0, 1)
+            tablero.colocar('CBA', 5, 5, -1, -1)
+            tablero.colocar('BAC', 6, 0, -1, 1)
+            tablero.vaciar([(6, 0)])
+
+        direcciones = [(df, dc) for df, dc, _ in DIRECCIONES.values()] + [(1, -1), (-1, 1)]
+        for delta_fila, delta_col in direcciones:
+            for palabra in ('ACB', 'A', 'CCCCCCC'):
+                esperados = lista.inicios_validos(palabra, delta_fila, delta_col)
+                obtenidos = bits.inicios_validos(palabra, delta_fila, delta_col)
+                self.assertEqual(list(obtenidos), esperados)
+                self.assertEqual(len(obtenidos), len(esperados))
+                if esperados:
+                    self.assertEqual(obtenidos[len(esperados) // 2], esperados[len(esperados) // 2])
+                for fila, col in esperados[:5]:
+                    self.assertTrue(bits.puede_colocar(palabra, fila, col, delta_fila, delta_col))
+
+    def test_backend_bitboard_misma_sopa_que_listas(self):
+        """Test: Con la misma semilla, el backend bitboard genera la misma sopa."""
+        for estrategia in Config.ESTRATEGIAS:
+            sopas = []
+            for backend in ('lista', 'bitboard'):
+                generador = WordSearchGenerator(
+                    palabras=self.palabras_basico + ["ESPAÑA", "NIÑO"],
+                    tamaño=12,
+                    orientaciones=Config.ORIENTACIONES_AVANZADO,
+                    permitir_inversa=True,
+                    estrategia=estrategia,
+                    backend=backend,
+                    semilla=8
+                )
+                generador.generar()
+                sopas.append((generador.cuadrícula, generador.palabras_colocadas))
+            self.assertEqual(sopas[0], sopas[1])
+
+    def test_backend_lineas_coincide_con_listas(self):
+        """Test: Las búsquedas por línea dan los mismos inicios que las listas."""
+        lista = TableroLista(7, 'ABC')
+        lineas = TableroLineas(7, 'ABC')
+        for tablero in (lista, lineas):
+            tablero.colocar('ABCA', 1, 0, 0, 1)
+            tablero.colocar('CBA', 5, 5, -1, -1)
+            tablero.colocar('BAC', 6, 0, -1, 1)
+            tablero.vaciar([(6, 0)])
+
+        direcciones = [(df, dc) for df, dc, _ in DIRECCIONES.values()] + [(1, -1), (-1, 1)]
+        for delta_fila, delta_col in direcciones:
+            for palabra in ('ACB', 'A', 'CCCCCCC'):
+                esperados = lista.inicios_validos(palabra, delta_fila, delta_col)
+                obtenidos = lineas.inicios_validos(palabra, delta_fila, delta_col)
+                # Mismos inicios, pero recorridos línea a línea
+                self.assertEqual(sorted(obtenidos), esperados)
+                self.assertEqual([obtenidos[i] for i in range(len(obtenidos))], list(obtenidos))
+                for fila, col in esperados[:5]:
+                    self.assertTrue(lineas.puede_colocar(palabra, fila, col, delta_fila, delta_col))
+
+    def test_backend_lineas_genera_sopa_reproducible(self):
+        """Test: El backend lineas coloca todas las palabras y respeta la semilla."""
+        palabras = self.palabras_basico + ["ESPAÑA", "NIÑO"]
+        sopas = []
+        for _ in range(2):
+            generador = WordSearchGenerator(
+                palabras=palabras,
+                tamaño=12,
+                orientaciones=Config.ORIENTACIONES_AVANZADO,
+                permitir_inversa=True,
+                backend='lineas',
+                semilla=8
+            )
+            generador.generar()
+            sopas.append(generador.cuadrícula)
+            self.assertEqual(len(generador.palabras_colocadas), len(palabras))
+            for palabra, info in generador.palabras_colocadas.items():
+                letras = ''.join(generador.cuadrícula[f][c] for f, c in info.posiciones)
+                self.assertIn(palabra, (letras, letras[::-1]))
+        self.assertEqual(sopas[0], sopas[1])
+
+    def test_backend_invalido_lanza_error(self):
+        """Test: Un backend desconocido lanza ValueError."""
+        with self.assertRaises(ValueError):
+            WordSearchGenerator(palabras=["SOL"], backend='papel')
+
+    def test_misma_semilla_misma_sopa(self):
+        """Test: Con la misma semilla se obtiene la misma sopa."""
+        sopas = []
+        for _ in range(2):
+            generador = WordSearchGenerator(
+                palabras=self.palabras_basico,
+                tamaño=10,
+                orientaciones=Config.ORIENTACIONES_AVANZADO,
+                permitir_inversa=True,
+                semilla=42
+            )
+            generador.generar()
+            sopas.append((generador.cuadrícula, generador.palabras_colocadas))
+        self.assertEqual(sopas[0], sopas[1])
+
+    def test_semilla_no_usa_random_global(self):
+        """Test: La generación con semilla no depende del estado global."""
+        import random
+        cuadrículas = []
+        for estado in (1, 2):
+            random.seed(estado)
+            generador = WordSearchGenerator(palabras=self.palabras_basico, tamaño=10, semilla=7)
+            generador.generar()
+            cuadrículas.append(generador.cuadrícula)
+        self.assertEqual(cuadrículas[0], cuadrículas[1])
+
+    @unittest.skipIf(numpy is None, "NumPy no está instalado")
+    def test_semilla_reproducible_con_numpy(self):
+        """Test: El relleno vectorizado también respeta la semilla."""
+        cuadrículas = []
+        for _ in range(2):
+            generador = WordSearchGenerator(
+                palabras=self.palabras_basico, tamaño=12, backend='numpy', semilla=3
+            )
+            generador.generar()
+            cuadrículas.append(generador.cuadrícula)
+        self.assertEqual(cuadrículas[0], cuadrículas[1])
+
+    def test_relleno_sin_duplicados(self):
+        """Test: El relleno no crea apariciones extra de las palabras."""
+        palabras = ["SOL", "MAR", "RIO", "OLA"]
+        for semilla in range(20):
+            generador = WordSearchGenerator(
+                palabras=palabras,
+                tamaño=8,
+                orientaciones=Config.ORIENTACIONES_AVANZADO,
+                alfabeto="SOLMARIO",
+                relleno='sin_duplicados',
+                semilla=semilla
+            )
+            generador.generar()
+            encontradas = [a['palabra'] for a in generador.resolver()]
+            self.assertTrue(all(celda for fila in generador.cuadrícula for celda in fila))
+            self.assertEqual(sorted(encontradas), sorted(palabras))
+
+    def test_estadisticas_incluyen_telemetria(self):
+        """Test: Las estadísticas registran tiempos por fase e intentos por palabra."""
+        fases = []
+        generador = WordSearchGenerator(
+            palabras=self.palabras_basico,
+            tamaño=15,
+            semilla=1,
+            perfilador=lambda fase, segundos: fases.append(fase)
+        )
+        generador.generar()
+        with tempfile.TemporaryDirectory() as directorio:
+            generador.exportar_imagen(os.path.join(directorio, 'sopa.png'))
+            generador.exportar_solucion(os.path.join(directorio, 'solucion.txt'))
+
+        stats = generador.obtener_estadisticas()
+        self.assertEqual(fases, ['colocacion', 'relleno', 'renderizado', 'solucion'])
+        self.assertEqual(set(stats['tiempos']), set(fases))
+        self.assertEqual(stats['retrocesos_totales'], 0)
+        for palabra in self.palabras_basico:
+            # Al menos el inicio elegido se examinó y no se rechazó
+            self.assertGreaterEqual(
+                stats['intentos_por_palabra'][palabra] - stats['rechazos_por_palabra'].get(palabra, 0), 1
+            )
+
+    def test_estadisticas_enumeracion_cuenta_inicios(self):
+        """Test: Al enumerar se cuentan todos los inicios examinados y los rechazados."""
+        with mock.patch.object(Config, 'MUESTRAS_COLOCACION', 0):
+            generador = WordSearchGenerator(palabras=["PYTHON", "CODIGO"], tamaño=15, semilla=1)
+            generador.generar()
+        stats = generador.obtener_estadisticas()
+        # 15 filas x 10 columnas en horizontal y 10 x 15 en vertical
+        self.assertEqual(stats['intentos_por_palabra'], {"PYTHON": 300, "CODIGO": 300})
+        self.assertEqual(stats['rechazos_por_palabra'].get("PYTHON", 0), 0)
+        self.assertEqual(stats['candidatos_por_palabra']["PYTHON"], 300)
+        self.assertGreater(stats['rechazos_por_palabra']["CODIGO"], 0)
+        self.assertEqual(
+            stats['candidatos_por_palabra']["CODIGO"],
+            300 - stats['rechazos_por_palabra']["CODIGO"]
+        )
+
+    def test_estadisticas_backtracking_cuentan_retrocesos(self):
+        """Test: Cada colocación deshecha se cuenta como retroceso."""
+        generador = WordSearchGenerator(
+            palabras=["ABC", "DEF", "GHI", "ADG", "BEH", "CFI"],
+            tamaño=3,
+            orientaciones=['H', 'V'],
+            estrategia='backtracking',
+            semilla=0
+        )
+        with mock.patch.object(
+            generador, '_registrar_colocacion', wraps=generador._registrar_colocacion
+        ) as registrar:
+            generador.generar()
+        stats = generador.obtener_estadisticas()
+        self.assertGreater(stats['retrocesos_totales'], 0)
+        self.assertEqual(registrar.call_count, len(generador.palabras) + stats['retrocesos_totales'])
+
+    def test_relleno_invalido_lanza_error(self):
+        """Test: Un modo de relleno desconocido lanza ValueError."""
+        with self.assertRaises(ValueError):
+            WordSearchGenerator(palabras=self.palabras_basico, relleno='otro')
+
+    def test_solapamiento_puntua_letras_compartidas(self):
+        """Test: La puntuación por índice coincide con recorrer cada candidato."""
+        generador = WordSearchGenerator(
+            palabras=["SOPA", "PASO"],
+            tamaño=6,
+            orientaciones=Config.ORIENTACIONES_AVANZADO,
+            permitir_inversa=True,
+            maximizar_solapamiento=True,
+            semilla=3
+        )
+        generador._registrar_colocacion("SOPA", "SOPA", 2, 1, 'H')
+        candidatos = generador._candidatos("PASO")
+        puntos = generador._puntuar_solapamiento(candidatos)
+
+        for (palabra, fila, col, orientacion), obtenido in zip(candidatos, puntos):
+            delta_fila, delta_col, _ = DIRECCIONES[orientacion]
+            esperado = sum(
+                generador.tablero.celda(fila + i * delta_fila, col + i * delta_col) != ''
+                for i in range(len(palabra))
+            )
+            self.assertEqual(obtenido, esperado)
+
+        # Se elige una de las posiciones con más letras compartidas
+        generador._colocar_palabra("PASO")
+        self.assertEqual(generador.obtener_estadisticas()['celdas_compartidas'], max(puntos))
+
+    def test_solapamiento_con_backtracking(self):
+        """Test: Al deshacer colocaciones el índice de letras queda al día."""
+        generador = WordSearchGenerator(
+            palabras=["ABCD", "EFGH", "IJKL", "MNOP", "AEIM", "BFJN"],
+            tamaño=4,
+            estrategia='backtracking',
+            maximizar_solapamiento=True,
+            semilla=5
+        )
+        generador.generar()
+        self.assertEqual(len(generador.palabras_colocadas), 6)
+
+        ocupadas = {
+            celda
+            for info in generador.palabras_colocadas.values()
+            for celda in info['posiciones']
+        }
+        indexadas = set().union(*generador._celdas_por_letra.values())
+        self.assertEqual(indexadas, ocupadas)
+
+
+class TestColocacion(unittest.TestCase):
+    """Tests para el registro compacto de palabras colocadas."""
+
+    def test_posiciones_derivadas(self):
+        """Test: Las posiciones se calculan desde el inicio y la dirección."""
+        colocacion = Colocacion(4, 3, -1, -1, 3, False)
+        self.assertEqual(colocacion.posiciones, [(4, 3), (3, 2), (2, 1)])
+        self.assertEqual(colocacion.inicio, (4, 3))
+        self.assertEqual(colocacion.fin, (2, 1))
+        self.assertEqual(colocacion.orientacion, 'Diagonal Inversa')
+
+    def test_acceso_por_clave(self):
+        """Test: Se mantiene el acceso de los antiguos diccionarios."""
+        colocacion = Colocacion(0, 1, 0, 1, 2, True)
+        self.assertEqual(dict(colocacion), {
+            'posiciones': [(0, 1), (0, 2)],
+            'orientacion': 'Horizontal',
+            'inversa': True,
+        })
+        self.assertIsNone(colocacion.get('palabra'))
+        with self.assertRaises(KeyError):
+            colocacion['fila']
+
+    def test_se_comporta_como_mapping(self):
+        """Test: El registro admite in, len, items y se vuelca a JSON."""
+        generador = WordSearchGenerator(palabras=["SOL", "MAR"], tamaño=6, semilla=2)
+        generador.generar()
+        colocacion = generador.palabras_colocadas["SOL"]
+        self.assertIn('inversa', colocacion)
+        self.assertNotIn(0, colocacion)
+        self.assertEqual(list(colocacion), ['posiciones', 'orientacion', 'inversa'])
+        self.assertEqual(len(colocacion), 3)
+        self.assertEqual(dict(colocacion.items()), dict(colocacion))
+        self.assertEqual(colocacion, dict(colocacion))
+        volcado = json.loads(json.dumps(generador.palabras_colocadas, default=dict))
+        self.assertEqual(volcado["SOL"]['posiciones'], [list(p) for p in colocacion.posiciones])
+        self.assertEqual(volcado["MAR"]['orientacion'], generador.palabras_colocadas["MAR"].orientacion)
+
+    def test_sin_diccionario_por_instancia(self):
+        """Test: El registro usa __slots__ y no guarda las posiciones."""
+        colocacion = Colocacion(0, 0, 1, 0, 5, False)
+        self.assertFalse(hasattr(colocacion, '__dict__'))
+
+    def test_restaurar_recupera_registros(self):
+        """Test: Restaurar desde obtener_solucion reproduce las colocaciones."""
+        generador = WordSearchGenerator(
+            palabras=["PYTHON", "SOPA", "A"],
+            tamaño=8,
+            orientaciones=Config.ORIENTACIONES_AVANZADO,
+            semilla=4
+        )
+        generador.generar()
+        copia = WordSearchGenerator(palabras=generador.palabras, tamaño=8)
+        copia.restaurar(generador.cuadrícula, generador.obtener_solucion())
+        self.assertEqual(copia.palabras_colocadas, generador.palabras_colocadas)
+
 
 class TestConfig(unittest.TestCase):
     """Tests para la configuración."""
 
+    def test_max_intentos_colocacion_obsoleto(self):
+        """Test: La constante retirada sigue disponible con un aviso."""
+        with self.assertWarns(DeprecationWarning):
+            self.assertEqual(Config.MAX_INTENTOS_COLOCACION, Config.MUESTRAS_COLOCACION)
+
     def test_alfabeto_español_contiene_enie(self):
         """Test: El alfabeto español contiene Ñ."""
         self.assertIn('Ñ', Config.ALFABETO_ES)
@@ -1,12 +1,153 @@
 """
 Generador modular de sopas de letras.
 Permite crear sopas de letras personalizables con diferentes niveles de dificultad.
+
+Pillow solo se importa al exportar una imagen PNG: generar la sopa y
+exportarla como texto, SVG o PDF no lo cargan.
 """
 
+import os
 import random
-from PIL import Image, ImageDraw, ImageFont
-from typing import List, Tuple, Optional
+import time
+from collections import Counter
+from collections.abc import Mapping
+from contextlib import contextmanager
+from functools import wraps
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple
 from config import Config
+from formatos_solucion import (
+    FORMATOS_SOLUCION, escribir_registros, formato_por_extension, registro_binario, registro_jsonl
+)
+from exportadores_vectoriales import EscritorPDF, contenido_pagina_pdf, escribir_svg
+from solucionador import resolver_cuadricula
+from tableros import crear_tablero
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+
+# Desplazamiento (fila, columna) y nombre legible de cada orientación
+DIRECCIONES = {
+    'H': (0, 1, 'Horizontal'),
+    'V': (1, 0, 'Vertical'),
+    'D': (1, 1, 'Diagonal'),
+    'H_INV': (0, -1, 'Horizontal Inversa'),
+    'V_INV': (-1, 0, 'Vertical Inversa'),
+    'D_INV': (-1, -1, 'Diagonal Inversa'),
+}
+
+# Nombre legible de cada vector de dirección y viceversa
+_NOMBRES_DIRECCION = {(df, dc): nombre for df, dc, nombre in DIRECCIONES.values()}
+_DELTAS_POR_NOMBRE = {nombre: (df, dc) for (df, dc), nombre in _NOMBRES_DIRECCION.items()}
+
+
+class Colocacion(Mapping):
+    """
+    Registro compacto de una palabra colocada.
+
+    Guarda solo el inicio, el vector de dirección, la longitud y si la
+    palabra se escribió invertida; las posiciones y el nombre de la
+    orientación se calculan al pedirlos. Se comporta como un mapping de
+    solo lectura con las claves de los antiguos diccionarios ('posiciones',
+    'orientacion', 'inversa'): admite in, len, keys, items y dict(). El
+    módulo json solo serializa diccionarios, así que para volcar registros
+    se usa json.dumps(..., default=dict).
+
+    Attributes:
+        fila: Fila de la primera letra
+        col: Columna de la primera letra
+        delta_fila: Incremento de fila por cada letra
+        delta_col: Incremento de columna por cada letra
+        longitud: Número de letras
+        inversa: Si la palabra se escribió invertida
+    """
+
+    __slots__ = ('fila', 'col', 'delta_fila', 'delta_col', 'longitud', 'inversa')
+
+    CLAVES = ('posiciones', 'orientacion', 'inversa')
+
+    def __init__(
+        self, fila: int, col: int, delta_fila: int, delta_col: int, longitud: int, inversa: bool
+    ):
+        self.fila = fila
+        self.col = col
+        self.delta_fila = delta_fila
+        self.delta_col = delta_col
+        self.longitud = longitud
+        self.inversa = inversa
+
+    @property
+    def posiciones(self) -> List[Tuple[int, int]]:
+        """Celdas (fila, columna) que ocupa la palabra, en orden."""
+        return [
+            (self.fila + i * self.delta_fila, self.col + i * self.delta_col)
+            for i in range(self.longitud)
+        ]
+
+    @property
+    def orientacion(self) -> str:
+        """Nombre legible de la orientación."""
+        return _NOMBRES_DIRECCION[(self.delta_fila, self.delta_col)]
+
+    @property
+    def inicio(self) -> Tuple[int, int]:
+        """Celda de la primera letra."""
+        return self.fila, self.col
+
+    @property
+    def fin(self) -> Tuple[int, int]:
+        """Celda de la última letra."""
+        return (
+            self.fila + (self.longitud - 1) * self.delta_fila,
+            self.col + (self.longitud - 1) * self.delta_col,
+        )
+
+    def __getitem__(self, clave: str):
+        if clave not in self.CLAVES:
+            raise KeyError(clave)
+        return getattr(self, clave)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.CLAVES)
+
+    def __len__(self) -> int:
+        return len(self.CLAVES)
+
+    def __eq__(self, otra) -> bool:
+        if not isinstance(otra, Colocacion):
+            # Con un diccionario u otro mapping se comparan las claves
+            return super().__eq__(otra)
+        return all(getattr(self, campo) == getattr(otra, campo) for campo in self.__slots__)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (f"Colocacion(fila={self.fila}, col={self.col}, delta_fila={self.delta_fila}, "
+                f"delta_col={self.delta_col}, longitud={self.longitud}, inversa={self.inversa})")
+
+
+def _medir_fase(fase: str):
+    """Acumula el tiempo del método decorado en la fase indicada."""
+    def decorador(metodo):
+        @wraps(metodo)
+        def envoltura(self, *args, **kwargs):
+            inicio = time.perf_counter()
+            try:
+                return metodo(self, *args, **kwargs)
+            finally:
+                self._registrar_tiempo(fase, time.perf_counter() - inicio)
+        return envoltura
+    return decorador
+
+
+@contextmanager
+def _abrir_destino(destino, modo: str):
+    """Abre una ruta de archivo o usa directamente un archivo ya abierto."""
+    if hasattr(destino, 'write'):
+        yield destino
+        return
+    with open(destino, modo, encoding=None if 'b' in modo else 'utf-8') as f:
+        yield f
 
 
 class WordSearchGenerator:
@@ -18,8 +159,26 @@ class WordSearchGenerator:
         tamaño: Tamaño de la cuadrícula (NxN)
         orientaciones: Lista de orientaciones permitidas
         alfabeto: Alfabeto a usar para relleno
-        cuadrícula: Matriz que representa la sopa de letras
-        palabras_colocadas: Diccionario con información de palabras colocadas
+        cuadrícula: Copia de solo lectura de la sopa (una tupla por fila)
+        tablero: Almacenamiento de la cuadrícula (ver tableros.py)
+        backend: Nombre del almacenamiento ('lista', 'numpy', 'bitboard' o 'lineas')
+        semilla: Semilla usada para el generador aleatorio (None si no se fijó)
+        rng: Generador aleatorio propio de la instancia
+        palabras_colocadas: Diccionario palabra -> Colocacion de las palabras colocadas
+        estrategia: Estrategia de colocación ('aleatoria' o 'backtracking')
+        relleno: Modo de relleno ('aleatorio' o 'sin_duplicados')
+        maximizar_solapamiento: Si se prefieren las posiciones que comparten
+            más letras con las palabras ya colocadas
+        tiempos: Segundos acumulados por fase ('colocacion', 'relleno',
+            'renderizado', 'solucion')
+        intentos: Inicios examinados por palabra (sorteados o recorridos al
+            enumerar sus candidatos)
+        rechazos: Inicios examinados por palabra donde no cabía
+        retrocesos: Colocaciones deshechas por palabra (modo backtracking)
+        candidatos: Posiciones legales encontradas por palabra en su última
+            enumeración
+        perfilador: Función opcional llamada con (fase, segundos) al terminar
+            cada fase
     """
 
     def __init__(
@@ -28,7 +187,15 @@ class WordSearchGenerator:
         tamaño: int = 15,
         orientaciones: Optional[List[str]] = None,
         alfabeto: str = Config.ALFABETO_EN,
-        permitir_inversa: bool = False
+        permitir_inversa: bool = False,
+        estrategia: str = 'aleatoria',
+        max_nodos: int = Config.MAX_NODOS_BACKTRACKING,
+        backend: str = 'lista',
+        semilla: Optional[int] = None,
+        rng: Optional[random.Random] = None,
+        relleno: str = 'aleatorio',
+        perfilador: Optional[Callable[[str, float], None]] = None,
+        maximizar_solapamiento: bool = False
     ):
         """
         Inicializa el generador de sopa de letras.
@@ -39,14 +206,91 @@ class WordSearchGenerator:
             orientaciones: Orientaciones permitidas (por defecto básico)
             alfabeto: Alfabeto para letras de relleno
             permitir_inversa: Si se permite invertir palabras aleatoriamente
+            estrategia: 'aleatoria' coloca las palabras en orden y sin
+                retroceder; 'backtracking' ordena las palabras de la más
+                restringida a la menos y revisa decisiones previas al fallar
+            max_nodos: Presupuesto de colocaciones a probar en modo backtracking
+            backend: Almacenamiento de la cuadrícula: 'lista' (listas de
+                caracteres), 'numpy' (arreglo uint8 compacto, requiere NumPy),
+                'bitboard' (listas más máscaras de bits por fila; el más
+                rápido colocando palabras en cuadrículas grandes) o 'lineas'
+                (listas más el texto de cada línea, donde los huecos de cada
+                palabra se buscan con una expresión regular)
+            semilla: Semilla del generador aleatorio; con la misma semilla y
+                los mismos parámetros se obtiene siempre la misma sopa
+            rng: Generador aleatorio propio (tiene prioridad sobre semilla)
+            relleno: 'aleatorio' rellena cada celda libre con cualquier letra;
+                'sin_duplicados' evita letras que formen una segunda aparición
+                de alguna palabra de la lista
+            perfilador: Función llamada con (fase, segundos) cada vez que
+                termina una fase medida; útil para registrar tiempos en
+                producción sin un profiler
+            maximizar_solapamiento: Empaquetado denso: cada palabra va a la
+                posición que comparte más letras con las ya colocadas, de modo
+                que caben más palabras en cuadrículas más pequeñas
+
+        Raises:
+            ValueError: Si la estrategia, el relleno o el backend no son válidos
         """
+        if estrategia not in Config.ESTRATEGIAS:
+            raise ValueError(
+                f"Estrategia '{estrategia}' no válida. "
+                f"Opciones: {', '.join(Config.ESTRATEGIAS)}"
+            )
+        if relleno not in Config.RELLENOS:
+            raise ValueError(
+                f"Relleno '{relleno}' no válido. "
+                f"Opciones: {', '.join(Config.RELLENOS)}"
+            )
+
         self.palabras = [p.upper() for p in palabras]
         self.tamaño = tamaño
         self.orientaciones = orientaciones or Config.ORIENTACIONES_BASICO
         self.alfabeto = alfabeto
         self.permitir_inversa = permitir_inversa
-        self.cuadrícula = [['' for _ in range(tamaño)] for _ in range(tamaño)]
         self.palabras_colocadas = {}
+        self.estrategia = estrategia
+        self.max_nodos = max_nodos
+        self.relleno = relleno
+        self.maximizar_solapamiento = maximizar_solapamiento
+        self.semilla = semilla
+        self.backend = backend
+        self.rng = rng if rng is not None else random.Random(semilla)
+        self.perfilador = perfilador
+        self.tiempos = {}
+        self.intentos = {}
+        self.rechazos = {}
+        self.retrocesos = {}
+        self.candidatos = {}
+        # Celdas ocupadas por cada letra (solo con maximizar_solapamiento)
+        self._celdas_por_letra: Dict[str, Set[Tuple[int, int]]] = {}
+        # Última copia de la cuadrícula: (tablero, versión del tablero, filas)
+        self._instantanea = None
+
+        # Letras del alfabeto primero, luego las de las palabras que falten
+        extras = sorted(set(''.join(self.palabras)) - set(alfabeto))
+        self.tablero = crear_tablero(backend, tamaño, alfabeto + ''.join(extras))
+
+    @property
+    def cuadrícula(self) -> Tuple[Tuple[str, ...], ...]:
+        """
+        Copia de solo lectura de la cuadrícula: una tupla de letras por fila
+        ('' en celdas vacías).
+
+        Cada backend guarda las letras a su manera (y algunos mantienen
+        índices que deben actualizarse), así que la copia es inmutable para
+        que escribir en ella falle en lugar de perderse en silencio; para
+        cambiar una celda usa tablero.asignar(fila, col, letra). La copia se
+        construye una vez y se reutiliza hasta que se escribe en el tablero,
+        así que leerla celda a celda no cuesta una copia por acceso; mientras
+        se escribe, tablero.celda(fila, col) lee una celda sin copiar nada.
+        """
+        instantanea = self._instantanea
+        if (instantanea is None or instantanea[0] is not self.tablero
+                or instantanea[1] != self.tablero.version):
+            filas = tuple(tuple(fila) for fila in self.tablero.filas())
+            instantanea = self._instantanea = (self.tablero, self.tablero.version, filas)
+        return instantanea[2]
 
     def _validar_palabra(self, palabra: str) -> None:
         """
@@ -80,16 +324,11 @@ class WordSearchGenerator:
         Returns:
             True si la palabra puede colocarse, False en caso contrario
         """
-        for i in range(len(palabra)):
-            r = fila + i * delta_fila
-            c = col + i * delta_col
-            if self.cuadrícula[r][c] not in ('', palabra[i]):
-                return False
-        return True
+        return self.tablero.puede_colocar(palabra, fila, col, delta_fila, delta_col)
 
     def _colocar_en_cuadricula(
         self, palabra: str, fila: int, col: int, delta_fila: int, delta_col: int
-    ) -> None:
+    ) -> List[Tuple[int, int]]:
         """
         Coloca una palabra en la cuadrícula.
 
@@ -99,120 +338,349 @@ class WordSearchGenerator:
             col: Columna inicial
             delta_fila: Incremento de fila por cada letra
             delta_col: Incremento de columna por cada letra
+
+        Returns:
+            Lista de posiciones (fila, columna) ocupadas por la palabra
+        """
+        return self.tablero.colocar(palabra, fila, col, delta_fila, delta_col)
+
+    def _posiciones_validas(self, palabra: str) -> List[Tuple[int, int, str]]:
         """
-        posiciones = []
-        for i in range(len(palabra)):
-            r = fila + i * delta_fila
-            c = col + i * delta_col
-            self.cuadrícula[r][c] = palabra[i]
-            posiciones.append((r, c))
-        return posiciones
+        Enumera todas las posiciones donde una palabra puede colocarse.
+
+        Recorre la cuadrícula una sola vez por orientación permitida y
+        devuelve cada inicio legal junto con su orientación.
+
+        Args:
+            palabra: Palabra a colocar (ya invertida si corresponde)
+
+        Returns:
+            Lista de tuplas (fila, columna, orientación)
+        """
+        return [
+            (fila, col, orientacion)
+            for orientacion in self.orientaciones
+            for fila, col in self.tablero.inicios_validos(palabra, *DIRECCIONES[orientacion][:2])
+        ]
+
+    def _grupos_candidatos(
+        self, palabra_original: str
+    ) -> List[Tuple[str, str, Sequence[Tuple[int, int]]]]:
+        """
+        Enumera los inicios válidos de una palabra por forma y orientación.
+
+        Incluye la forma invertida de la palabra si está permitida. Suma a
+        la telemetría todos los inicios que no se salen de la cuadrícula como
+        examinados, los que no admiten la palabra como rechazados, y guarda
+        el número de candidatos legales.
+
+        Args:
+            palabra_original: Palabra a colocar
+
+        Returns:
+            Lista de tuplas (palabra, orientación, inicios), donde palabra es
+            la forma que se escribirá en la cuadrícula e inicios la secuencia
+            devuelta por el tablero (puede ser perezosa)
+        """
+        self._validar_palabra(palabra_original)
+
+        grupos = []
+        examinados = 0
+        for palabra in self._variantes(palabra_original):
+            for orientacion in self.orientaciones:
+                delta_fila, delta_col, _ = DIRECCIONES[orientacion]
+                filas, columnas = self.tablero.rangos_inicio(len(palabra), delta_fila, delta_col)
+                examinados += len(filas) * len(columnas)
+                grupos.append((
+                    palabra, orientacion,
+                    self.tablero.inicios_validos(palabra, delta_fila, delta_col)
+                ))
+
+        legales = sum(len(inicios) for _, _, inicios in grupos)
+        self.candidatos[palabra_original] = legales
+        self._contar(self.intentos, palabra_original, examinados)
+        self._contar(self.rechazos, palabra_original, examinados - legales)
+        return grupos
+
+    def _variantes(self, palabra_original: str) -> List[str]:
+        """Formas de la palabra que pueden escribirse: la original y, si se permite, la invertida."""
+        variantes = [palabra_original]
+        if self.permitir_inversa and palabra_original[::-1] != palabra_original:
+            variantes.append(palabra_original[::-1])
+        return variantes
+
+    def _sortear_candidato(self, palabra_original: str) -> Optional[Tuple[str, int, int, str]]:
+        """
+        Prueba unos pocos inicios al azar antes de enumerar todos.
+
+        Cada sorteo es uniforme entre todos los inicios que no se salen de la
+        cuadrícula (de cualquier forma y orientación), así que el primero que
+        admite la palabra es uniforme entre los candidatos legales, igual que
+        al elegirlo de la enumeración completa. En cuadrículas poco llenas
+        casi siempre acierta y evita recorrer el tablero entero.
+
+        Args:
+            palabra_original: Palabra a colocar (ya validada)
+
+        Returns:
+            Tupla (palabra, fila, columna, orientación), o None si ninguno de
+            los Config.MUESTRAS_COLOCACION sorteos admitía la palabra
+        """
+        grupos = []
+        total = 0
+        for palabra in self._variantes(palabra_original):
+            for orientacion in self.orientaciones:
+                delta_fila, delta_col, _ = DIRECCIONES[orientacion]
+                filas, columnas = self.tablero.rangos_inicio(len(palabra), delta_fila, delta_col)
+                grupos.append((palabra, orientacion, filas, columnas))
+                total += len(filas) * len(columnas)
+
+        for _ in range(Config.MUESTRAS_COLOCACION):
+            self._contar(self.intentos, palabra_original)
+            indice = self.rng.randrange(total)
+            for palabra, orientacion, filas, columnas in grupos:
+                if indice < len(filas) * len(columnas):
+                    break
+                indice -= len(filas) * len(columnas)
+            fila = filas[indice // len(columnas)]
+            col = columnas[indice % len(columnas)]
+            if self._puede_colocar(palabra, fila, col, *DIRECCIONES[orientacion][:2]):
+                return palabra, fila, col, orientacion
+            self._contar(self.rechazos, palabra_original)
+        return None
+
+    def _candidatos(self, palabra_original: str) -> List[Tuple[str, int, int, str]]:
+        """
+        Enumera los candidatos de colocación de una palabra.
+
+        Args:
+            palabra_original: Palabra a colocar
+
+        Returns:
+            Lista de tuplas (palabra, fila, columna, orientación), en el
+            orden de _grupos_candidatos
+        """
+        return [
+            (palabra, fila, col, orientacion)
+            for palabra, orientacion, inicios in self._grupos_candidatos(palabra_original)
+            for fila, col in inicios
+        ]
+
+    def _puntuar_solapamiento(self, candidatos: List[Tuple[str, int, int, str]]) -> List[int]:
+        """
+        Cuenta cuántas letras comparte cada candidato con la cuadrícula.
+
+        En lugar de recorrer las celdas de cada candidato, parte del índice
+        de celdas por letra: cada celda ocupada con la letra i-ésima de la
+        palabra señala, en cada orientación, el único inicio que la cruzaría
+        en esa posición. Como los candidatos son legales, toda celda ocupada
+        que atraviesan coincide en letra y cuenta una vez.
+
+        Args:
+            candidatos: Tuplas (palabra, fila, columna, orientación)
+
+        Returns:
+            Letras compartidas de cada candidato, en el mismo orden
+        """
+        puntos = [0] * len(candidatos)
+        if not self._celdas_por_letra:
+            return puntos
+
+        indices = {candidato: i for i, candidato in enumerate(candidatos)}
+        for palabra in {candidato[0] for candidato in candidatos}:
+            for posicion, letra in enumerate(palabra):
+                for fila, col in self._celdas_por_letra.get(letra, ()):
+                    for orientacion in self.orientaciones:
+                        delta_fila, delta_col, _ = DIRECCIONES[orientacion]
+                        i = indices.get((
+                            palabra,
+                            fila - posicion * delta_fila,
+                            col - posicion * delta_col,
+                            orientacion
+                        ))
+                        if i is not None:
+                            puntos[i] += 1
+        return puntos
+
+    def _registrar_colocacion(
+        self, palabra_original: str, palabra: str, fila: int, col: int, orientacion: str
+    ) -> List[Tuple[int, int]]:
+        """
+        Escribe un candidato en la cuadrícula y registra la palabra colocada.
+
+        Args:
+            palabra_original: Palabra tal como aparece en la lista
+            palabra: Forma escrita en la cuadrícula (posiblemente invertida)
+            fila: Fila inicial
+            col: Columna inicial
+            orientacion: Clave de orientación (ver DIRECCIONES)
+
+        Returns:
+            Lista de celdas que estaban vacías y ahora ocupa la palabra
+        """
+        delta_fila, delta_col, _ = DIRECCIONES[orientacion]
+        libres = [
+            (fila + i * delta_fila, col + i * delta_col)
+            for i in range(len(palabra))
+            if self.tablero.celda(fila + i * delta_fila, col + i * delta_col) == ''
+        ]
+        if self.maximizar_solapamiento:
+            for i, letra in enumerate(palabra):
+                celda = (fila + i * delta_fila, col + i * delta_col)
+                self._celdas_por_letra.setdefault(letra, set()).add(celda)
+        self._colocar_en_cuadricula(palabra, fila, col, delta_fila, delta_col)
+        self.palabras_colocadas[palabra_original] = Colocacion(
+            fila, col, delta_fila, delta_col, len(palabra), palabra != palabra_original
+        )
+        return libres
+
+    def _vaciar(self, libres: List[Tuple[int, int]]) -> None:
+        """Deshace una colocación vaciando las celdas que había ocupado."""
+        if self.maximizar_solapamiento:
+            for celda in libres:
+                self._celdas_por_letra[self.tablero.celda(*celda)].discard(celda)
+        self.tablero.vaciar(libres)
 
     def _colocar_palabra(self, palabra_original: str) -> bool:
         """
-        Intenta colocar una palabra en la cuadrícula.
+        Coloca una palabra en una posición elegida al azar entre las válidas.
+
+        Primero se prueban unos pocos inicios al azar (ver
+        _sortear_candidato). Si ninguno sirve, se cuentan todos los
+        candidatos legales (incluida la forma invertida si está permitida) y
+        se elige uno de manera uniforme; solo se construye el elegido, lo que
+        aprovecha los tableros que devuelven los inicios de forma perezosa.
+        Así el error solo se lanza si la palabra no cabe en ningún sitio. Con
+        maximizar_solapamiento se enumera siempre y solo se sortea entre los
+        que comparten más letras con la cuadrícula.
 
         Args:
             palabra_original: Palabra a colocar
 
         Returns:
-            True si se colocó exitosamente, False en caso contrario
+            True si se colocó exitosamente
 
         Raises:
-            ValueError: Si no se puede colocar después del máximo de intentos
+            ValueError: Si la palabra no tiene ninguna posición legal
         """
         self._validar_palabra(palabra_original)
+        if not self.maximizar_solapamiento:
+            candidato = self._sortear_candidato(palabra_original)
+            if candidato is not None:
+                self._registrar_colocacion(palabra_original, *candidato)
+                return True
 
-        palabra = palabra_original
-        if self.permitir_inversa and random.choice([True, False]):
-            palabra = palabra[::-1]
+        grupos = self._grupos_candidatos(palabra_original)
+        total = self.candidatos[palabra_original]
+        if not total:
+            raise ValueError(
+                f"No existe ninguna posición válida para la palabra "
+                f"'{palabra_original}'. Considera aumentar el tamaño de la cuadrícula."
+            )
 
-        intentos = 0
-        max_intentos = Config.MAX_INTENTOS_COLOCACION
+        if self.maximizar_solapamiento:
+            candidatos = [
+                (palabra, fila, col, orientacion)
+                for palabra, orientacion, inicios in grupos
+                for fila, col in inicios
+            ]
+            puntos = self._puntuar_solapamiento(candidatos)
+            maximo = max(puntos)
+            candidatos = [c for c, p in zip(candidatos, puntos) if p == maximo]
+            self._registrar_colocacion(palabra_original, *self.rng.choice(candidatos))
+            return True
 
-        while intentos < max_intentos:
-            intentos += 1
-            orientacion = random.choice(self.orientaciones)
+        # Equivale a rng.choice sobre la lista completa de candidatos
+        indice = self.rng.randrange(total)
+        for palabra, orientacion, inicios in grupos:
+            if indice < len(inicios):
+                fila, col = inicios[indice]
+                break
+            indice -= len(inicios)
+        self._registrar_colocacion(palabra_original, palabra, fila, col, orientacion)
+        return True
 
-            try:
-                if orientacion == 'H':  # Horizontal (izquierda a derecha)
-                    fila = random.randint(0, self.tamaño - 1)
-                    col = random.randint(0, self.tamaño - len(palabra))
-                    if self._puede_colocar(palabra, fila, col, 0, 1):
-                        posiciones = self._colocar_en_cuadricula(palabra, fila, col, 0, 1)
-                        self.palabras_colocadas[palabra_original] = {
-                            'posiciones': posiciones,
-                            'orientacion': 'Horizontal',
-                            'inversa': palabra != palabra_original
-                        }
-                        return True
+    def _ordenar_por_restriccion(self) -> List[str]:
+        """
+        Ordena las palabras de la más restringida a la menos restringida.
 
-                elif orientacion == 'V':  # Vertical (arriba a abajo)
-                    fila = random.randint(0, self.tamaño - len(palabra))
-                    col = random.randint(0, self.tamaño - 1)
-                    if self._puede_colocar(palabra, fila, col, 1, 0):
-                        posiciones = self._colocar_en_cuadricula(palabra, fila, col, 1, 0)
-                        self.palabras_colocadas[palabra_original] = {
-                            'posiciones': posiciones,
-                            'orientacion': 'Vertical',
-                            'inversa': palabra != palabra_original
-                        }
-                        return True
+        Primero las más largas y, a igual longitud, las que usan las letras
+        menos frecuentes de la lista (con menos opciones de cruce).
 
-                elif orientacion == 'D':  # Diagonal (arriba-izq a abajo-der)
-                    fila = random.randint(0, self.tamaño - len(palabra))
-                    col = random.randint(0, self.tamaño - len(palabra))
-                    if self._puede_colocar(palabra, fila, col, 1, 1):
-                        posiciones = self._colocar_en_cuadricula(palabra, fila, col, 1, 1)
-                        self.palabras_colocadas[palabra_original] = {
-                            'posiciones': posiciones,
-                            'orientacion': 'Diagonal',
-                            'inversa': palabra != palabra_original
-                        }
-                        return True
+        Returns:
+            Lista de palabras en orden de colocación
+        """
+        frecuencias = Counter(letra for palabra in self.palabras for letra in palabra)
 
-                elif orientacion == 'H_INV':  # Horizontal inversa (derecha a izquierda)
-                    fila = random.randint(0, self.tamaño - 1)
-                    col = random.randint(len(palabra) - 1, self.tamaño - 1)
-                    if self._puede_colocar(palabra, fila, col, 0, -1):
-                        posiciones = self._colocar_en_cuadricula(palabra, fila, col, 0, -1)
-                        self.palabras_colocadas[palabra_original] = {
-                            'posiciones': posiciones,
-                            'orientacion': 'Horizontal Inversa',
-                            'inversa': palabra != palabra_original
-                        }
-                        return True
+        def rareza(palabra: str) -> float:
+            letras = set(palabra)
+            return sum(frecuencias[letra] for letra in letras) / len(letras)
 
-                elif orientacion == 'V_INV':  # Vertical inversa (abajo a arriba)
-                    fila = random.randint(len(palabra) - 1, self.tamaño - 1)
-                    col = random.randint(0, self.tamaño - 1)
-                    if self._puede_colocar(palabra, fila, col, -1, 0):
-                        posiciones = self._colocar_en_cuadricula(palabra, fila, col, -1, 0)
-                        self.palabras_colocadas[palabra_original] = {
-                            'posiciones': posiciones,
-                            'orientacion': 'Vertical Inversa',
-                            'inversa': palabra != palabra_original
-                        }
-                        return True
+        return sorted(self.palabras, key=lambda p: (-len(p), rareza(p)))
 
-                elif orientacion == 'D_INV':  # Diagonal inversa (abajo-der a arriba-izq)
-                    fila = random.randint(len(palabra) - 1, self.tamaño - 1)
-                    col = random.randint(len(palabra) - 1, self.tamaño - 1)
-                    if self._puede_colocar(palabra, fila, col, -1, -1):
-                        posiciones = self._colocar_en_cuadricula(palabra, fila, col, -1, -1)
-                        self.palabras_colocadas[palabra_original] = {
-                            'posiciones': posiciones,
-                            'orientacion': 'Diagonal Inversa',
-                            'inversa': palabra != palabra_original
-                        }
-                        return True
+    def _colocar_con_backtracking(self) -> None:
+        """
+        Coloca todas las palabras mediante búsqueda con retroceso.
+
+        Si una palabra no tiene posición legal, deshace la colocación de la
+        palabra anterior y prueba su siguiente candidato. La búsqueda se
+        detiene tras probar `max_nodos` colocaciones. Usa una pila explícita
+        en lugar de recursión, así que admite listas de cualquier longitud.
+
+        Raises:
+            ValueError: Si no hay solución o se agota el presupuesto de búsqueda
+        """
+        palabras = self._ordenar_por_restriccion()
+        for palabra in palabras:
+            self._validar_palabra(palabra)
+        if not palabras:
+            return
+        nodos = 0
+
+        def abrir(indice: int) -> list:
+            """Prepara los candidatos de una palabra en el orden en que se probarán."""
+            palabra_original = palabras[indice]
+            candidatos = self._candidatos(palabra_original)
+            self.rng.shuffle(candidatos)
+            if self.maximizar_solapamiento:
+                # Orden estable: los empates conservan el orden aleatorio
+                puntos = dict(zip(candidatos, self._puntuar_solapamiento(candidatos)))
+                candidatos.sort(key=puntos.__getitem__, reverse=True)
+            # [candidatos, siguiente candidato a probar, celdas ocupadas por el actual]
+            return [candidatos, 0, None]
 
-            except (IndexError, ValueError):
+        # Un marco por palabra colocada o en curso, en el orden de `palabras`
+        pila = [abrir(0)]
+        while pila:
+            palabra_original = palabras[len(pila) - 1]
+            marco = pila[-1]
+            candidatos, siguiente, libres = marco
+            if libres is not None:
+                # La palabra siguiente no tuvo solución: deshacer esta colocación
+                self._contar(self.retrocesos, palabra_original)
+                self._vaciar(libres)
+                self.palabras_colocadas.pop(palabra_original, None)
+                marco[2] = None
+            if siguiente == len(candidatos):
+                pila.pop()
                 continue
 
+            nodos += 1
+            if nodos > self.max_nodos:
+                raise ValueError(
+                    f"Se agotó el presupuesto de búsqueda ({self.max_nodos} "
+                    f"colocaciones) sin ubicar todas las palabras. "
+                    f"Considera aumentar el tamaño de la cuadrícula."
+                )
+            marco[1] = siguiente + 1
+            marco[2] = self._registrar_colocacion(palabra_original, *candidatos[siguiente])
+            if len(pila) == len(palabras):
+                return
+            pila.append(abrir(len(pila)))
+
         raise ValueError(
-            f"No se pudo colocar la palabra '{palabra_original}' después de "
-            f"{max_intentos} intentos. Considera aumentar el tamaño de la cuadrícula."
+            "No existe ninguna disposición que permita colocar todas las "
+            "palabras. Considera aumentar el tamaño de la cuadrícula."
         )
 
     def generar(self) -> None:
@@ -221,16 +689,101 @@ class WordSearchGenerator:
 
         Coloca todas las palabras y rellena espacios vacíos con letras aleatorias.
         """
-        # Colocar todas las palabras
-        for palabra in self.palabras:
-            self._colocar_palabra(palabra)
+        self._colocar_palabras()
+        self._rellenar()
+
+    @_medir_fase('colocacion')
+    def _colocar_palabras(self) -> None:
+        """Coloca todas las palabras según la estrategia elegida."""
+        if self.estrategia == 'backtracking':
+            self._colocar_con_backtracking()
+        else:
+            for palabra in self.palabras:
+                self._colocar_palabra(palabra)
+
+    @_medir_fase('relleno')
+    def _rellenar(self) -> None:
+        """Rellena los espacios vacíos según el modo de relleno."""
+        if self.relleno == 'sin_duplicados':
+            self._rellenar_sin_duplicados()
+        else:
+            self.tablero.rellenar(self.alfabeto, self.rng)
+
+    @staticmethod
+    def _contar(contador: dict, palabra: str, cantidad: int = 1) -> None:
+        """Suma `cantidad` al contador de una palabra."""
+        contador[palabra] = contador.get(palabra, 0) + cantidad
+
+    def _registrar_tiempo(self, fase: str, segundos: float) -> None:
+        """
+        Acumula el tiempo de una fase y avisa al perfilador.
+
+        Args:
+            fase: Nombre de la fase
+            segundos: Duración medida
+        """
+        self.tiempos[fase] = self.tiempos.get(fase, 0.0) + segundos
+        if self.perfilador is not None:
+            self.perfilador(fase, segundos)
+
+    def _rellenar_sin_duplicados(self) -> None:
+        """
+        Rellena las celdas vacías sin formar apariciones extra de las palabras.
+
+        Mantiene un índice de qué palabras contienen cada letra y en qué
+        posición. Al rellenar una celda solo se comprueban, en las 8
+        direcciones, las palabras que podrían pasar por ella con esa letra;
+        como las celdas se rellenan de una en una, cada aparición nueva se
+        detecta justo al escribir su última letra libre.
+
+        Raises:
+            ValueError: Si alguna celda no admite ninguna letra del alfabeto
+        """
+        indice_letras = {}
+        for palabra in set(self.palabras):
+            for posicion, letra in enumerate(palabra):
+                indice_letras.setdefault(letra, []).append((palabra, posicion))
+
+        direcciones = [
+            (delta_fila, delta_col)
+            for delta_fila in (-1, 0, 1) for delta_col in (-1, 0, 1)
+            if delta_fila or delta_col
+        ]
+        celda = self.tablero.celda
+
+        def completa_palabra(fila: int, col: int, letra: str) -> bool:
+            for palabra, posicion in indice_letras.get(letra, ()):
+                for delta_fila, delta_col in direcciones:
+                    fila_inicio = fila - posicion * delta_fila
+                    col_inicio = col - posicion * delta_col
+                    fila_fin = fila_inicio + (len(palabra) - 1) * delta_fila
+                    col_fin = col_inicio + (len(palabra) - 1) * delta_col
+                    if not (0 <= fila_inicio < self.tamaño and 0 <= col_inicio < self.tamaño
+                            and 0 <= fila_fin < self.tamaño and 0 <= col_fin < self.tamaño):
+                        continue
+                    if all(
+                        i == posicion
+                        or celda(fila_inicio + i * delta_fila, col_inicio + i * delta_col) == palabra[i]
+                        for i in range(len(palabra))
+                    ):
+                        return True
+            return False
 
-        # Rellenar espacios vacíos con letras aleatorias
         for fila in range(self.tamaño):
             for col in range(self.tamaño):
-                if self.cuadrícula[fila][col] == '':
-                    self.cuadrícula[fila][col] = random.choice(self.alfabeto)
+                if celda(fila, col) != '':
+                    continue
+                for letra in self.rng.sample(self.alfabeto, len(self.alfabeto)):
+                    if not completa_palabra(fila, col, letra):
+                        self.tablero.asignar(fila, col, letra)
+                        break
+                else:
+                    raise ValueError(
+                        f"Ninguna letra del alfabeto evita repetir una palabra "
+                        f"en la celda ({fila}, {col})."
+                    )
 
+    @_medir_fase('renderizado')
     def exportar_imagen(
         self,
         nombre_archivo: str,
@@ -238,55 +791,54 @@ class WordSearchGenerator:
         imagen_tamaño: int = Config.IMAGEN_TAMAÑO,
         color_fondo: str = Config.COLOR_FONDO,
         color_lineas: str = Config.COLOR_LINEAS,
-        color_texto: str = Config.COLOR_TEXTO
-    ) -> Image.Image:
+        color_texto: str = Config.COLOR_TEXTO,
+        tamaño_celda: Optional[int] = None
+    ) -> Optional['Image.Image']:
         """
         Exporta la sopa de letras como una imagen.
 
         Args:
-            nombre_archivo: Ruta donde guardar la imagen
+            nombre_archivo: Ruta donde guardar la imagen, o archivo binario
+                abierto (en ese caso se escribe en formato PNG)
             mostrar_palabras: Si se debe mostrar la lista de palabras
             imagen_tamaño: Tamaño de la imagen en píxeles
             color_fondo: Color de fondo
             color_lineas: Color de las líneas de la cuadrícula
             color_texto: Color del texto
+            tamaño_celda: Si se indica, ignora imagen_tamaño y renderiza por
+                franjas con celdas de ese lado en píxeles (ver
+                exportar_imagen_por_franjas)
 
         Returns:
-            Objeto Image de PIL con la sopa de letras generada
+            Objeto Image de PIL con la sopa de letras generada, o None si se
+            renderizó por franjas
         """
+        if tamaño_celda is not None:
+            self._dibujar_por_franjas(
+                nombre_archivo, tamaño_celda, mostrar_palabras,
+                color_fondo, color_lineas, color_texto
+            )
+            return None
+
+        from PIL import ImageDraw
+        from renderizado import cargar_fuente, obtener_atlas, obtener_plantilla
+
         cell_size = imagen_tamaño // self.tamaño
         altura_extra = Config.IMAGEN_EXTRA_ALTURA if mostrar_palabras else 0
-        imagen = Image.new(
-            'RGB',
-            (imagen_tamaño, imagen_tamaño + altura_extra),
-            color_fondo
+
+        # Partir de la plantilla con fondo y líneas de la cuadrícula
+        imagen = obtener_plantilla(
+            self.tamaño, imagen_tamaño, mostrar_palabras, color_fondo, color_lineas
         )
         draw = ImageDraw.Draw(imagen)
-        font = ImageFont.load_default()
-
-        # Dibujar cuadrícula
-        for i in range(self.tamaño + 1):
-            # Líneas horizontales
-            draw.line(
-                [(0, i * cell_size), (imagen_tamaño, i * cell_size)],
-                fill=color_lineas
-            )
-            # Líneas verticales
-            draw.line(
-                [(i * cell_size, 0), (i * cell_size, imagen_tamaño)],
-                fill=color_lineas
-            )
+        font = cargar_fuente()
+        atlas = obtener_atlas(color_texto)
 
-        # Dibujar letras centradas en cada celda
+        # Pegar letras centradas en cada celda desde el atlas de glifos
+        cuadrícula = self.cuadrícula
         for fila in range(self.tamaño):
             for col in range(self.tamaño):
-                letra = self.cuadrícula[fila][col]
-                bbox = draw.textbbox((0, 0), letra, font=font)
-                ancho_letra = bbox[2] - bbox[0]
-                alto_letra = bbox[3] - bbox[1]
-                x = col * cell_size + (cell_size - ancho_letra) // 2
-                y = fila * cell_size + (cell_size - alto_letra) // 2
-                draw.text((x, y), letra, font=font, fill=color_texto)
+                atlas.pegar(imagen, cuadrícula[fila][col], col * cell_size, fila * cell_size, cell_size)
 
         # Dibujar lista de palabras si se solicita
         if mostrar_palabras:
@@ -306,17 +858,305 @@ class WordSearchGenerator:
                     palabra_x += Config.ANCHO_COLUMNA_PALABRAS
 
         # Guardar imagen
-        imagen.save(nombre_archivo)
+        if hasattr(nombre_archivo, 'write'):
+            imagen.save(nombre_archivo, format='PNG')
+        else:
+            imagen.save(nombre_archivo)
         return imagen
 
-    def exportar_solucion(self, nombre_archivo: str) -> None:
+    @_medir_fase('renderizado')
+    def exportar_imagen_por_franjas(
+        self,
+        nombre_archivo: str,
+        tamaño_celda: int = Config.TAMAÑO_CELDA_FRANJAS,
+        mostrar_palabras: bool = True,
+        color_fondo: str = Config.COLOR_FONDO,
+        color_lineas: str = Config.COLOR_LINEAS,
+        color_texto: str = Config.COLOR_TEXTO
+    ) -> None:
+        """
+        Exporta la sopa de letras como PNG dibujándola franja a franja.
+
+        Pensado para pósteres de cuadrículas muy grandes: el tamaño de celda
+        es fijo en píxeles y solo se mantiene en memoria una franja de unas
+        Config.ALTURA_FRANJA filas, que se comprime y escribe antes de
+        dibujar la siguiente.
+
+        Args:
+            nombre_archivo: Ruta donde guardar el PNG o archivo binario abierto
+            tamaño_celda: Lado de cada celda en píxeles
+            mostrar_palabras: Si se debe mostrar la lista de palabras
+            color_fondo: Color de fondo
+            color_lineas: Color de las líneas de la cuadrícula
+            color_texto: Color del texto
+        """
+        self._dibujar_por_franjas(
+            nombre_archivo, tamaño_celda, mostrar_palabras,
+            color_fondo, color_lineas, color_texto
+        )
+
+    def _dibujar_por_franjas(
+        self,
+        nombre_archivo: str,
+        tamaño_celda: int,
+        mostrar_palabras: bool,
+        color_fondo: str,
+        color_lineas: str,
+        color_texto: str
+    ) -> None:
+        """
+        Dibuja y escribe el PNG por franjas sin medir la fase de renderizado.
+
+        Lo usan exportar_imagen y exportar_imagen_por_franjas, que son los
+        que miden el tiempo, para que el renderizado se cuente una sola vez.
+        """
+        from PIL import Image, ImageDraw
+        from renderizado import EscritorPNG, cargar_fuente, obtener_atlas
+
+        ancho = self.tamaño * tamaño_celda + 1
+        alto_cuadricula = self.tamaño * tamaño_celda + 1
+
+        # Lista de palabras en columnas, de arriba abajo y de izquierda a derecha
+        columnas = max(1, (ancho - Config.MARGEN_PALABRAS_X) // Config.ANCHO_COLUMNA_PALABRAS)
+        lineas_lista = -(-len(self.palabras) // columnas) if mostrar_palabras else 0
+        alto_lista = (
+            2 * Config.MARGEN_PALABRAS_Y + lineas_lista * Config.ESPACIADO_ENTRE_PALABRAS
+            if lineas_lista else 0
+        )
+
+        tamaño_fuente = max(1, int(tamaño_celda * Config.PROPORCION_FUENTE_FRANJAS))
+        atlas = obtener_atlas(color_texto, Config.FUENTE_POR_DEFECTO, tamaño_fuente)
+        fuente_lista = cargar_fuente()
+        celda = self.tablero.celda
+        filas_por_franja = max(1, Config.ALTURA_FRANJA // tamaño_celda)
+
+        with _abrir_destino(nombre_archivo, 'wb') as f:
+            escritor = EscritorPNG(f, ancho, alto_cuadricula + alto_lista)
+
+            for fila_inicio in range(0, self.tamaño, filas_por_franja):
+                fila_fin = min(fila_inicio + filas_por_franja, self.tamaño)
+                # La última franja incluye la línea inferior de la cuadrícula
+                alto = (fila_fin - fila_inicio) * tamaño_celda + (fila_fin == self.tamaño)
+                franja = Image.new('RGB', (ancho, alto), color_fondo)
+                draw = ImageDraw.Draw(franja)
+                for i in range(fila_fin - fila_inicio + 1):
+                    draw.line([(0, i * tamaño_celda), (ancho, i * tamaño_celda)], fill=color_lineas)
+                for col in range(self.tamaño + 1):
+                    draw.line([(col * tamaño_celda, 0), (col * tamaño_celda, alto)], fill=color_lineas)
+                for fila in range(fila_inicio, fila_fin):
+                    y = (fila - fila_inicio) * tamaño_celda
+                    for col in range(self.tamaño):
+                        atlas.pegar(franja, celda(fila, col), col * tamaño_celda, y, tamaño_celda)
+                escritor.escribir_franja(franja)
+
+            lineas_por_franja = max(1, Config.ALTURA_FRANJA // Config.ESPACIADO_ENTRE_PALABRAS)
+            linea = 0
+            while linea < lineas_lista:
+                fin = min(linea + lineas_por_franja, lineas_lista)
+                primera = linea == 0
+                ultima = fin == lineas_lista
+                alto = (
+                    (fin - linea) * Config.ESPACIADO_ENTRE_PALABRAS
+                    + Config.MARGEN_PALABRAS_Y * (primera + ultima)
+                )
+                franja = Image.new('RGB', (ancho, alto), color_fondo)
+                draw = ImageDraw.Draw(franja)
+                y_base = Config.MARGEN_PALABRAS_Y if primera else 0
+                for columna in range(columnas):
+                    for i in range(linea, fin):
+                        indice = columna * lineas_lista + i
+                        if indice >= len(self.palabras):
+                            break
+                        draw.text(
+                            (
+                                Config.MARGEN_PALABRAS_X + columna * Config.ANCHO_COLUMNA_PALABRAS,
+                                y_base + (i - linea) * Config.ESPACIADO_ENTRE_PALABRAS
+                            ),
+                            f"{Config.ESPACIADO_CHECKBOX}   {self.palabras[indice]}",
+                            font=fuente_lista,
+                            fill=color_texto
+                        )
+                escritor.escribir_franja(franja)
+                linea = fin
+
+            escritor.cerrar()
+
+    @_medir_fase('renderizado')
+    def exportar_svg(
+        self,
+        nombre_archivo: str,
+        mostrar_palabras: bool = True,
+        imagen_tamaño: int = Config.IMAGEN_TAMAÑO,
+        color_fondo: str = Config.COLOR_FONDO,
+        color_lineas: str = Config.COLOR_LINEAS,
+        color_texto: str = Config.COLOR_TEXTO
+    ) -> None:
+        """
+        Exporta la sopa de letras como documento vectorial SVG.
+
+        Args:
+            nombre_archivo: Ruta donde guardar el SVG o archivo de texto abierto
+            mostrar_palabras: Si se debe mostrar la lista de palabras
+            imagen_tamaño: Tamaño de la cuadrícula en píxeles
+            color_fondo: Color de fondo
+            color_lineas: Color de las líneas de la cuadrícula
+            color_texto: Color del texto
+        """
+        with _abrir_destino(nombre_archivo, 'w') as f:
+            escribir_svg(
+                f, self.cuadrícula, self.palabras, mostrar_palabras,
+                imagen_tamaño, color_fondo, color_lineas, color_texto
+            )
+
+    @_medir_fase('renderizado')
+    def exportar_pdf(
+        self,
+        nombre_archivo: str,
+        mostrar_palabras: bool = True,
+        imagen_tamaño: int = Config.IMAGEN_TAMAÑO,
+        color_fondo: str = Config.COLOR_FONDO,
+        color_lineas: str = Config.COLOR_LINEAS,
+        color_texto: str = Config.COLOR_TEXTO
+    ) -> None:
+        """
+        Exporta la sopa de letras como documento vectorial PDF de una página.
+
+        Args:
+            nombre_archivo: Ruta donde guardar el PDF o archivo binario abierto
+            mostrar_palabras: Si se debe mostrar la lista de palabras
+            imagen_tamaño: Tamaño de la cuadrícula en puntos
+            color_fondo: Color de fondo
+            color_lineas: Color de las líneas de la cuadrícula
+            color_texto: Color del texto
+        """
+        with _abrir_destino(nombre_archivo, 'wb') as f:
+            escritor = EscritorPDF(f)
+            escritor.agregar_pagina(*contenido_pagina_pdf(
+                self.cuadrícula, self.palabras, mostrar_palabras,
+                imagen_tamaño, color_fondo, color_lineas, color_texto
+            ))
+            escritor.cerrar()
+
+    @_medir_fase('renderizado')
+    def exportar_texto(self, nombre_archivo: str, mostrar_palabras: bool = False) -> None:
         """
-        Exporta un archivo de texto con las soluciones (posiciones de palabras).
+        Exporta la cuadrícula como texto, una fila por línea.
+
+        Las letras van separadas por espacios, como en imprimir_cuadricula,
+        de modo que el archivo puede leerse con solucionador.leer_cuadricula.
+        No necesita Pillow.
+
+        Args:
+            nombre_archivo: Ruta donde guardar el texto o archivo de texto abierto
+            mostrar_palabras: Si se añade la lista de palabras tras una línea
+                en blanco (el archivo ya no sirve para leer_cuadricula)
+        """
+        with _abrir_destino(nombre_archivo, 'w') as f:
+            for fila in self.cuadrícula:
+                f.write(' '.join(fila) + '\n')
+            if mostrar_palabras:
+                f.write('\n' + '\n'.join(self.palabras) + '\n')
+
+    def exportar(self, nombre_archivo: str, formato: Optional[str] = None, **opciones) -> None:
+        """
+        Exporta la sopa de letras en el formato indicado o según la extensión.
+
+        Args:
+            nombre_archivo: Ruta donde guardar el archivo
+            formato: 'png', 'svg', 'pdf' o 'txt' (por defecto, la extensión del archivo)
+            **opciones: Opciones de dibujo (mostrar_palabras, imagen_tamaño, colores)
+
+        Raises:
+            ValueError: Si el formato no es válido
+        """
+        formato = (formato or os.path.splitext(nombre_archivo)[1].lstrip('.') or 'png').lower()
+        exportadores = {
+            'png': self.exportar_imagen,
+            'svg': self.exportar_svg,
+            'pdf': self.exportar_pdf,
+            'txt': self.exportar_texto,
+        }
+        if formato not in exportadores:
+            raise ValueError(
+                f"Formato '{formato}' no válido. Opciones: {', '.join(Config.FORMATOS_SALIDA)}"
+            )
+        exportadores[formato](nombre_archivo, **opciones)
+
+    def obtener_solucion(self) -> List[dict]:
+        """
+        Devuelve la solución en una forma serializable (por ejemplo, a JSON).
+
+        Returns:
+            Lista con un diccionario por palabra colocada: 'palabra',
+            'posiciones' (lista de [fila, columna]), 'orientacion' e 'inversa'
+        """
+        return [
+            {
+                'palabra': palabra,
+                'posiciones': [[fila, col] for fila, col in info['posiciones']],
+                'orientacion': info['orientacion'],
+                'inversa': info['inversa'],
+            }
+            for palabra, info in self.palabras_colocadas.items()
+        ]
+
+    def restaurar(self, cuadrícula: List[List[str]], solucion: List[dict]) -> None:
+        """
+        Carga una sopa ya generada en lugar de llamar a generar().
+
+        Args:
+            cuadrícula: Matriz de letras
+            solucion: Palabras colocadas en el formato de obtener_solucion()
+        """
+        for fila, letras in enumerate(cuadrícula):
+            for col, letra in enumerate(letras):
+                self.tablero.asignar(fila, col, letra)
+        self.palabras_colocadas = {}
+        for info in solucion:
+            fila, col = info['posiciones'][0]
+            delta_fila, delta_col = _DELTAS_POR_NOMBRE[info['orientacion']]
+            self.palabras_colocadas[info['palabra']] = Colocacion(
+                fila, col, delta_fila, delta_col, len(info['posiciones']), info['inversa']
+            )
+
+    @_medir_fase('solucion')
+    def exportar_solucion(
+        self,
+        nombre_archivo: str,
+        formato: Optional[str] = None,
+        anexar: bool = False,
+        identificador=None
+    ) -> None:
+        """
+        Exporta las soluciones (posiciones de palabras).
 
         Args:
             nombre_archivo: Ruta donde guardar el archivo de soluciones
+            formato: 'texto' (informe legible), 'jsonl' (una línea JSON con
+                todas las posiciones y direcciones) o 'binario' (ver
+                formatos_solucion.py); por defecto, según la extensión
+            anexar: Si se añade la solución al final del archivo, para
+                reunir muchas sopas en uno solo
+            identificador: Identificador de la sopa en los formatos
+                estructurados (por defecto, la semilla)
+
+        Raises:
+            ValueError: Si el formato no es válido
         """
-        with open(nombre_archivo, 'w', encoding='utf-8') as f:
+        formato = formato or formato_por_extension(nombre_archivo)
+        if formato not in FORMATOS_SOLUCION:
+            raise ValueError(
+                f"Formato de solución '{formato}' no válido. "
+                f"Opciones: {', '.join(FORMATOS_SOLUCION)}"
+            )
+        if formato == 'jsonl':
+            escribir_registros(nombre_archivo, [registro_jsonl(self, identificador)], formato, anexar)
+            return
+        if formato == 'binario':
+            escribir_registros(nombre_archivo, [registro_binario(self, identificador)], formato, anexar)
+            return
+
+        with open(nombre_archivo, 'a' if anexar else 'w', encoding='utf-8') as f:
             f.write("=" * 60 + "\n")
             f.write("SOLUCIONES - SOPA DE LETRAS\n")
             f.write("=" * 60 + "\n\n")
@@ -332,6 +1172,23 @@ class WordSearchGenerator:
                        f"columna {info['posiciones'][-1][1]}\n")
                 f.write("-" * 60 + "\n")
 
+    def resolver(self, palabras: Optional[List[str]] = None) -> List[dict]:
+        """
+        Busca todas las apariciones de las palabras en la cuadrícula.
+
+        Recorre las 8 direcciones, por lo que también encuentra apariciones
+        accidentales formadas por las letras de relleno.
+
+        Args:
+            palabras: Palabras a buscar (por defecto, las de la sopa)
+
+        Returns:
+            Lista de apariciones (ver solucionador.resolver_cuadricula)
+        """
+        return resolver_cuadricula(
+            self.cuadrícula, self.palabras if palabras is None else palabras
+        )
+
     def imprimir_cuadricula(self) -> None:
         """Imprime la cuadrícula en la consola (útil para debug)."""
         for fila in self.cuadrícula:
@@ -341,13 +1198,23 @@ class WordSearchGenerator:
         """
         Obtiene estadísticas sobre la sopa de letras generada.
 
+        Además de los conteos de palabras y orientaciones incluye la
+        telemetría de la generación: segundos por fase y, por palabra, los
+        inicios examinados y rechazados, las colocaciones deshechas al
+        retroceder y las posiciones legales halladas al enumerar (solo las
+        palabras que no se colocaron con un inicio sorteado).
+
         Returns:
             Diccionario con estadísticas
         """
         orientaciones_usadas = {}
         palabras_invertidas = 0
+        letras_colocadas = 0
+        celdas_ocupadas = set()
 
         for info in self.palabras_colocadas.values():
+            letras_colocadas += len(info['posiciones'])
+            celdas_ocupadas.update(info['posiciones'])
             orientacion = info['orientacion']
             orientaciones_usadas[orientacion] = orientaciones_usadas.get(orientacion, 0) + 1
             if info['inversa']:
@@ -358,5 +1225,14 @@ class WordSearchGenerator:
             'tamaño_cuadricula': self.tamaño,
             'palabras_colocadas': len(self.palabras_colocadas),
             'orientaciones_usadas': orientaciones_usadas,
-            'palabras_invertidas': palabras_invertidas
+            'palabras_invertidas': palabras_invertidas,
+            'celdas_compartidas': letras_colocadas - len(celdas_ocupadas),
+            'tiempos': dict(self.tiempos),
+            'intentos_por_palabra': dict(self.intentos),
+            'rechazos_por_palabra': dict(self.rechazos),
+            'retrocesos_por_palabra': dict(self.retrocesos),
+            'candidatos_por_palabra': dict(self.candidatos),
+            'intentos_totales': sum(self.intentos.values()),
+            'rechazos_totales': sum(self.rechazos.values()),
+            'retrocesos_totales': sum(self.retrocesos.values())
         }